@@ -0,0 +1,197 @@
+# Generates synthetic config in the layout of sample configs at configurable scale
+#
+# Usage: python -m benchmark.config_generator output_path [--databases N] [--schemas N] [--tables N] ...
+
+from argparse import ArgumentParser
+from dataclasses import dataclass, fields
+from pathlib import Path
+from shutil import rmtree
+from yaml import safe_dump
+
+
+@dataclass
+class ConfigScale:
+    databases: int = 2
+    schemas: int = 5
+    tables: int = 20
+    columns: int = 10
+    views: int = 10
+    view_chain: int = 3
+    business_roles: int = 20
+    users: int = 50
+    stage_files: int = 5
+
+    @property
+    def object_count(self):
+        schema_count = self.databases * self.schemas
+        return self.databases + schema_count * (1 + self.tables + self.views) + self.business_roles + self.users
+
+
+column_types = (
+    "NUMBER(38,0)",
+    "VARCHAR(255)",
+    "TIMESTAMP_NTZ(9)",
+    "BOOLEAN",
+    "NUMBER(18,2) NOT NULL",
+    "VARCHAR(16777216)",
+    "DATE",
+    "VARIANT",
+)
+
+
+def generate_config(config_path: Path, scale: ConfigScale):
+    if config_path.exists():
+        rmtree(config_path)
+
+    config_path.mkdir(parents=True)
+
+    write_yaml(config_path / 'placeholder.yaml', {
+        "default_wh_size": "XSMALL",
+        "default_wh_suspend": 60,
+    })
+
+    write_yaml(config_path / 'warehouse.yaml', {
+        f"wh_{d:03d}": {
+            "size": "${{ default_wh_size }}",
+            "auto_suspend": "${{ default_wh_suspend }}",
+            "comment": f"Warehouse for database {d}",
+        } for d in range(scale.databases)
+    })
+
+    for d in range(scale.databases):
+        generate_database(config_path / f"db_{d:03d}", scale)
+
+    write_yaml(config_path / 'business_role.yaml', {
+        f"analyst_{r:04d}": {
+            # Wildcard grants are expanded by parser, this is a hot path for configs with many schemas
+            "schema_read": [f"db_{r % scale.databases:03d}.*"],
+            "schema_write": [f"db_{r % scale.databases:03d}.sch_{r % scale.schemas:03d}"],
+            "warehouse_usage": [f"wh_{r % scale.databases:03d}"],
+            "comment": f"Business role {r}",
+        } for r in range(scale.business_roles)
+    })
+
+    # Each user requires at least one business role
+    if scale.users and scale.business_roles:
+        write_yaml(config_path / 'user.yaml', {
+            f"user_{u:05d}": {
+                "first_name": "User",
+                "last_name": f"No {u}",
+                "email": f"user_{u:05d}@example.com",
+                "password": f"Password{u:05d}",
+                "business_roles": [f"analyst_{u % scale.business_roles:04d}"],
+                "comment": f"User {u}",
+            } for u in range(scale.users)
+        })
+
+
+def generate_database(database_path: Path, scale: ConfigScale):
+    database_path.mkdir()
+
+    write_yaml(database_path / 'params.yaml', {
+        "comment": f"Database {database_path.name}",
+    })
+
+    for s in range(scale.schemas):
+        schema_path = database_path / f"sch_{s:03d}"
+        schema_path.mkdir()
+
+        write_yaml(schema_path / 'params.yaml', {
+            "comment": f"Schema {schema_path.name}",
+        })
+
+        generate_tables(schema_path, scale)
+        generate_views(schema_path, scale)
+        generate_stage(schema_path, scale)
+
+
+def generate_tables(schema_path: Path, scale: ConfigScale):
+    if not scale.tables:
+        return
+
+    (schema_path / 'table').mkdir()
+
+    for t in range(scale.tables):
+        columns = {}
+
+        for c in range(scale.columns):
+            columns[f"col_{c:03d}"] = {
+                "type": column_types[(t + c) % len(column_types)],
+                "comment": f"Column {c}",
+            }
+
+        write_yaml(schema_path / 'table' / f"tbl_{t:05d}.yaml", {
+            "columns": columns,
+            "comment": f"Table {t}",
+        })
+
+
+def generate_views(schema_path: Path, scale: ConfigScale):
+    if not scale.views:
+        return
+
+    (schema_path / 'view').mkdir()
+
+    for v in range(scale.views):
+        params = {}
+
+        # Views form chains of depends_on, each chain starts with a view on table
+        if v % max(scale.view_chain, 1) == 0:
+            params["text"] = f"SELECT col_000 AS id, col_001 AS name FROM tbl_{v % max(scale.tables, 1):05d}" if scale.tables else "SELECT 1 AS id, 'a' AS name"
+        else:
+            params["text"] = f"SELECT id, name FROM view_{v - 1:05d}"
+            params["depends_on"] = [f"view_{v - 1:05d}"]
+
+        params["comment"] = f"View {v}"
+
+        write_yaml(schema_path / 'view' / f"view_{v:05d}.yaml", params)
+
+
+def generate_stage(schema_path: Path, scale: ConfigScale):
+    if not scale.stage_files:
+        return
+
+    stage_path = schema_path / 'stage'
+    stage_path.mkdir()
+
+    write_yaml(stage_path / 'files.yaml', {
+        "comment": "Stage with managed files",
+    })
+
+    for f in range(scale.stage_files):
+        file_path = stage_path / 'files' / f"dir_{f % 3}" / f"file_{f:04d}.txt"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(f"Stage file {f}\n" * 10)
+
+
+def write_yaml(path: Path, data):
+    with path.open('w', encoding='utf-8') as f:
+        safe_dump(data, f, sort_keys=False)
+
+
+def add_scale_arguments(parser: ArgumentParser):
+    defaults = ConfigScale()
+
+    for field in fields(ConfigScale):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", help=f"(default: {getattr(defaults, field.name)})", default=getattr(defaults, field.name), type=int)
+
+
+def get_scale(args):
+    return ConfigScale(**{field.name: getattr(args, field.name) for field in fields(ConfigScale)})
+
+
+def main():
+    parser = ArgumentParser(description="Generate synthetic SnowDDL config")
+    parser.add_argument('config_path', help="Path to output directory, existing directory is replaced")
+    add_scale_arguments(parser)
+
+    args = parser.parse_args()
+    scale = get_scale(args)
+
+    generate_config(Path(args.config_path), scale)
+
+    print(f"Generated config with ~{scale.object_count} objects in [{args.config_path}]")
+
+
+if __name__ == '__main__':
+    main()
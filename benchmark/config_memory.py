@@ -0,0 +1,115 @@
+# Measures memory retained by parsed config: blueprints, columns, grants, data types and identifiers
+#
+# Usage: python -m benchmark.config_memory [--tables N] [--columns N] ...
+
+from argparse import ArgumentParser
+from collections import defaultdict
+from dataclasses import fields, is_dataclass
+from gc import collect
+from pathlib import Path
+from sys import getsizeof
+from tempfile import TemporaryDirectory
+
+import tracemalloc
+
+from benchmark.config_generator import add_scale_arguments, generate_config, get_scale
+
+from snowddl.blueprint import AbstractIdent, DataType
+from snowddl.config import SnowDDLConfig
+from snowddl.parser import default_parser_sequence, PlaceholderParser
+
+
+def load_config(config_path: Path):
+    config = SnowDDLConfig()
+
+    PlaceholderParser(config, config_path).load_placeholders()
+
+    for parser_cls in default_parser_sequence:
+        parser_cls(config, config_path).load_blueprints()
+
+    if config.errors:
+        raise ValueError(f"Generated config has errors: {list(config.errors)[:5]}")
+
+    return config
+
+
+def measure_retained_memory(config_path: Path):
+    collect()
+    tracemalloc.start()
+
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        config = load_config(config_path)
+
+        collect()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return config, after - before, peak - before
+
+
+def collect_object_stats(config: SnowDDLConfig):
+    # Number of unique objects and their own size, including instance __dict__ if present
+    counts = defaultdict(int)
+    sizes = defaultdict(int)
+    seen = set()
+
+    def visit(obj):
+        if id(obj) in seen:
+            return
+
+        if is_dataclass(obj) or isinstance(obj, (AbstractIdent, DataType)):
+            seen.add(id(obj))
+
+            group = obj.__class__.__name__
+            group = 'Blueprint' if group.endswith('Blueprint') else group
+
+            counts[group] += 1
+            sizes[group] += getsizeof(obj) + (getsizeof(obj.__dict__) if hasattr(obj, '__dict__') else 0)
+
+            if is_dataclass(obj):
+                for f in fields(obj):
+                    visit(getattr(obj, f.name))
+
+        elif isinstance(obj, (list, tuple)):
+            for item in obj:
+                visit(item)
+
+        elif isinstance(obj, dict):
+            for item in obj.values():
+                visit(item)
+
+    for bp_dict in config.blueprints.values():
+        for bp in bp_dict.values():
+            visit(bp)
+
+    return counts, sizes
+
+
+def main():
+    parser = ArgumentParser(description="Memory retained by parsed config")
+    add_scale_arguments(parser)
+
+    args = parser.parse_args()
+    scale = get_scale(args)
+
+    with TemporaryDirectory() as tmp_dir:
+        config_path = Path(tmp_dir) / 'config'
+        generate_config(config_path, scale)
+
+        print(f"Generated config with ~{scale.object_count} objects")
+
+        config, retained, peak = measure_retained_memory(config_path)
+
+    counts, sizes = collect_object_stats(config)
+
+    print(f"  {'retained by config':<40} {retained / 1048576:10.2f} MiB")
+    print(f"  {'peak during parsing':<40} {peak / 1048576:10.2f} MiB")
+
+    for group in sorted(counts, key=lambda g: sizes[g], reverse=True):
+        print(f"  {group:<40} {counts[group]:10} objects {sizes[group] / 1048576:10.2f} MiB {sizes[group] / counts[group]:8.0f} bytes per object")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+# Measures hot paths of SnowDDL on synthetic config: parsing, blueprints, dependency sorting, SQL formatting and full apply / plan
+# Queries are executed by in-memory emulator, so results do not depend on Snowflake
+#
+# Usage: python -m benchmark.end_to_end [--tables N] [--columns N] ... [--baseline baseline.json] [--save-baseline baseline.json]
+
+from argparse import ArgumentParser
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict
+from json import dumps, loads
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmark.config_generator import add_scale_arguments, generate_config, get_scale
+
+from snowddl.config import SnowDDLConfig
+from snowddl.emulator import SnowDDLEmulatorCatalog
+from snowddl.engine import SnowDDLEngine
+from snowddl.parser import default_parser_sequence, PlaceholderParser
+from snowddl.resolver import default_resolver_sequence, default_resolver_dependencies, TableResolver, ViewResolver
+from snowddl.resolver._dependency_graph import sort_by_dependencies
+from snowddl.scheduler import SnowDDLResolverScheduler
+from snowddl.settings import SnowDDLSettings
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.timings = defaultdict(list)
+
+    @contextmanager
+    def measure(self, phase: str):
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.timings[phase].append(perf_counter() - start)
+
+    def get_best(self):
+        # Best of repeats is the least noisy estimate of actual cost
+        return {phase: min(values) for phase, values in self.timings.items()}
+
+
+def run_offline_phases(timer: PhaseTimer, config_path: Path):
+    config = SnowDDLConfig()
+
+    with timer.measure("placeholders"):
+        PlaceholderParser(config, config_path).load_placeholders()
+
+    for parser_cls in default_parser_sequence:
+        with timer.measure(f"parse:{parser_cls.__name__}"):
+            parser_cls(config, config_path).load_blueprints()
+
+    if config.errors:
+        raise ValueError(f"Generated config has errors: {list(config.errors)[:5]}")
+
+    catalog = SnowDDLEmulatorCatalog()
+
+    with SnowDDLEngine(catalog.connect(), config, SnowDDLSettings(), connection_factory=catalog.connect) as engine:
+        resolvers = [resolver_cls(engine) for resolver_cls in default_resolver_sequence]
+
+        for resolver in resolvers:
+            with timer.measure(f"get_blueprints:{resolver.__class__.__name__}"):
+                resolver.blueprints = resolver.get_blueprints()
+
+        with timer.measure("sort_dependencies"):
+            for resolver in resolvers:
+                sort_by_dependencies(resolver._get_blueprint_dependencies())
+
+        with timer.measure("format_sql"):
+            for resolver in resolvers:
+                if isinstance(resolver, TableResolver):
+                    for bp in resolver.blueprints.values():
+                        str(resolver._build_create_table(bp))
+                elif isinstance(resolver, ViewResolver):
+                    for bp in resolver.blueprints.values():
+                        str(resolver._build_create_view(bp))
+
+    return config
+
+
+def run_emulator_phases(timer: PhaseTimer, config: SnowDDLConfig):
+    catalog = SnowDDLEmulatorCatalog()
+    suggested_ddl_count = 0
+
+    for phase, is_apply in (("emulator:apply", True), ("emulator:plan", False)):
+        settings = SnowDDLSettings(execute_safe_ddl=is_apply, execute_unsafe_ddl=is_apply)
+
+        with timer.measure(phase):
+            with SnowDDLEngine(catalog.connect(), config, settings, connection_factory=catalog.connect) as engine:
+                scheduler = SnowDDLResolverScheduler(engine, default_resolver_sequence, default_resolver_dependencies)
+                scheduler.resolve()
+
+                if scheduler.error_count:
+                    raise ValueError(f"Emulator {phase} finished with {scheduler.error_count} errors")
+
+                suggested_ddl_count = len(engine.suggested_ddl)
+
+    # Emulator does not support some object types (e.g. users, stages), so plan is not empty
+    return suggested_ddl_count
+
+
+def compare_with_baseline(timings, baseline, tolerance: float, min_duration: float):
+    regressions = []
+
+    for phase, duration in timings.items():
+        baseline_duration = baseline['phases'].get(phase)
+
+        if baseline_duration is None:
+            continue
+
+        # Very short phases are dominated by noise
+        if max(duration, baseline_duration) < min_duration:
+            continue
+
+        if duration > baseline_duration * (1 + tolerance):
+            regressions.append((phase, baseline_duration, duration))
+
+    return regressions
+
+
+def main():
+    parser = ArgumentParser(description="End-to-end benchmark of SnowDDL on synthetic config")
+    add_scale_arguments(parser)
+    parser.add_argument('--config-path', help="Path to directory for generated config (default: temporary directory)")
+    parser.add_argument('--repeat', help="Number of runs, the best timing of each phase is reported (default: 3)", default=3, type=int)
+    parser.add_argument('--skip-emulator', help="Do not run full apply and plan against emulator", default=False, action='store_true')
+    parser.add_argument('--baseline', help="Path to baseline JSON, exit with error code on regression")
+    parser.add_argument('--save-baseline', help="Path to save current timings as baseline JSON")
+    parser.add_argument('--tolerance', help="Allowed slowdown relative to baseline (default: 0.25)", default=0.25, type=float)
+    parser.add_argument('--min-duration', help="Phases shorter than this in seconds are not compared (default: 0.01)", default=0.01, type=float)
+
+    args = parser.parse_args()
+    scale = get_scale(args)
+
+    with TemporaryDirectory() as tmp_dir:
+        config_path = Path(args.config_path) if args.config_path else Path(tmp_dir) / 'config'
+        generate_config(config_path, scale)
+
+        print(f"Generated config with ~{scale.object_count} objects")
+
+        timer = PhaseTimer()
+
+        for _ in range(args.repeat):
+            config = run_offline_phases(timer, config_path)
+
+        if not args.skip_emulator:
+            suggested_ddl_count = run_emulator_phases(timer, config)
+            print(f"Plan after apply: {suggested_ddl_count} suggested statements")
+
+    timings = timer.get_best()
+
+    for phase, duration in timings.items():
+        print(f"  {phase:<60} {duration * 1000:10.1f} ms")
+
+    print(f"  {'total':<60} {sum(timings.values()) * 1000:10.1f} ms")
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(dumps({"scale": asdict(scale), "phases": timings}, indent=2))
+
+    if args.baseline:
+        baseline = loads(Path(args.baseline).read_text())
+
+        if baseline['scale'] != asdict(scale):
+            print(f"Warning: baseline was recorded with different scale {baseline['scale']}")
+
+        regressions = compare_with_baseline(timings, baseline, args.tolerance, args.min_duration)
+
+        for phase, baseline_duration, duration in regressions:
+            print(f"REGRESSION {phase}: {baseline_duration * 1000:.1f} ms -> {duration * 1000:.1f} ms ({duration / baseline_duration - 1:+.0%})")
+
+        if regressions:
+            exit(1)
+
+        print(f"No regressions compared to baseline (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# Compares cost of SQL formatting with string.Formatter.vformat and with compiled templates
+# Templates and params are collected from full apply of synthetic config against in-memory emulator
+#
+# Usage: python -m benchmark.formatter [--tables N] [--columns N] ... [--number N] [--repeat N]
+
+from argparse import ArgumentParser
+from pathlib import Path
+from string import Formatter
+from tempfile import TemporaryDirectory
+from timeit import repeat
+
+from benchmark.config_generator import add_scale_arguments, generate_config, get_scale
+
+from snowddl.config import SnowDDLConfig
+from snowddl.emulator import SnowDDLEmulatorCatalog
+from snowddl.engine import SnowDDLEngine
+from snowddl.formatter import SnowDDLFormatter
+from snowddl.parser import default_parser_sequence, PlaceholderParser
+from snowddl.resolver import default_resolver_sequence, default_resolver_dependencies
+from snowddl.scheduler import SnowDDLResolverScheduler
+from snowddl.settings import SnowDDLSettings
+
+
+def collect_calls(config_path: Path):
+    # Templates and params of all formatted statements, exactly as they are passed to formatter
+    calls = []
+    original_format_sql = SnowDDLFormatter.format_sql
+
+    def format_sql(self, sql, params=None):
+        if params:
+            calls.append((str(sql), dict(params)))
+
+        return original_format_sql(self, sql, params)
+
+    SnowDDLFormatter.format_sql = format_sql
+
+    try:
+        config = SnowDDLConfig()
+
+        PlaceholderParser(config, config_path).load_placeholders()
+
+        for parser_cls in default_parser_sequence:
+            parser_cls(config, config_path).load_blueprints()
+
+        catalog = SnowDDLEmulatorCatalog()
+        settings = SnowDDLSettings(execute_safe_ddl=True, execute_unsafe_ddl=True)
+
+        with SnowDDLEngine(catalog.connect(), config, settings, connection_factory=catalog.connect) as engine:
+            SnowDDLResolverScheduler(engine, default_resolver_sequence, default_resolver_dependencies).resolve()
+    finally:
+        SnowDDLFormatter.format_sql = original_format_sql
+
+    return calls
+
+
+def measure(calls, format_func, number, repeat_count):
+    timings = repeat(lambda: [format_func(sql, params) for sql, params in calls], number=number, repeat=repeat_count)
+
+    return min(timings) / number / len(calls)
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark of SQL formatting with compiled templates")
+    add_scale_arguments(parser)
+    parser.add_argument('--number', help="Number of runs per measurement (default: 5)", default=5, type=int)
+    parser.add_argument('--repeat', help="Number of measurements, the best one is reported (default: 5)", default=5, type=int)
+
+    args = parser.parse_args()
+    scale = get_scale(args)
+
+    with TemporaryDirectory() as tmp_dir:
+        config_path = Path(tmp_dir) / 'config'
+        generate_config(config_path, scale)
+
+        calls = collect_calls(config_path)
+
+    formatter = SnowDDLFormatter()
+    vformat = lambda sql, params: Formatter.vformat(formatter, sql, [], params)
+
+    for sql, params in calls:
+        if formatter.format_sql(sql, params) != vformat(sql, params):
+            raise ValueError(f"Compiled template produced different output for [{sql}]")
+
+    before = measure(calls, vformat, args.number, args.repeat)
+    after = measure(calls, formatter.format_sql, args.number, args.repeat)
+
+    print(f"{len(calls)} statements, {len({sql for sql, _ in calls})} templates, output is identical")
+    print(f"  string.Formatter.vformat(): {before * 1e6:10.2f} us per statement")
+    print(f"  compiled template:          {after * 1e6:10.2f} us per statement")
+    print(f"  speedup:                    {before / after:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
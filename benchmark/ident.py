@@ -0,0 +1,81 @@
+# Compares typical operations on identifiers: building strings on each access vs cached strings and hashable identifiers
+#
+# Usage: python -m benchmark.ident [--count N] [--repeat N]
+
+from argparse import ArgumentParser
+from time import perf_counter
+
+from snowddl.blueprint import AbstractIdent, SchemaObjectIdent, intern_ident
+
+
+def format_uncached(ident: AbstractIdent):
+    # Same as AbstractIdent.__str__ without cache, which is how identifiers were compared and used as keys before
+    core_parts, argument_parts = ident.parts_for_format()
+
+    if argument_parts is not None:
+        return f"{'.'.join(core_parts)}({','.join(argument_parts)})"
+
+    return '.'.join(core_parts)
+
+
+def build_idents(count: int):
+    # Roughly 100 objects per schema and 100 schemas per database, same names are used in different schemas
+    return [SchemaObjectIdent('', f"db_{i // 10000:03d}", f"sc_{i // 100 % 100:03d}", f"table_{i % 100:03d}") for i in range(count)]
+
+
+def measure(name, func, repeat_count):
+    timings = []
+
+    for _ in range(repeat_count):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+
+    print(f"  {name:<60} {min(timings) * 1000:10.1f} ms")
+
+    return min(timings)
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark of identifiers used as keys and in comparisons")
+    parser.add_argument('--count', help="Number of identifiers (default: 1000000)", default=1000000, type=int)
+    parser.add_argument('--repeat', help="Number of measurements, the best one is reported (default: 3)", default=3, type=int)
+
+    args = parser.parse_args()
+
+    idents = build_idents(args.count)
+    lookups = build_idents(args.count)
+
+    print(f"{args.count} identifiers")
+
+    print("Construction:")
+    measure("build identifiers", lambda: build_idents(args.count), args.repeat)
+
+    print("String building, 3 times per identifier:")
+    before = measure("uncached", lambda: [format_uncached(i) for i in idents for _ in range(3)], args.repeat)
+    after = measure("cached __str__", lambda: [str(i) for i in idents for _ in range(3)], args.repeat)
+    print(f"  {'speedup':<60} {before / after:10.1f}x")
+
+    print("Membership of equal identifiers created separately:")
+    uncached_names = {format_uncached(i) for i in idents}
+    ident_set = set(idents)
+
+    before = measure("set of strings, uncached string for each lookup", lambda: all(format_uncached(i) in uncached_names for i in lookups), args.repeat)
+    after = measure("set of identifiers", lambda: all(i in ident_set for i in lookups), args.repeat)
+    print(f"  {'speedup':<60} {before / after:10.1f}x")
+
+    interned_idents = [intern_ident(i) for i in idents]
+    interned_lookups = [intern_ident(i) for i in lookups]
+    interned_set = set(interned_idents)
+
+    after = measure("set of interned identifiers", lambda: all(i in interned_set for i in interned_lookups), args.repeat)
+    print(f"  {'speedup':<60} {before / after:10.1f}x")
+
+    print("Grouping by identifier:")
+    before = measure("dict by uncached string", lambda: {format_uncached(i): i for i in lookups}, args.repeat)
+    after = measure("dict by identifier", lambda: {i: i for i in lookups}, args.repeat)
+    print(f"  {'speedup':<60} {before / after:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# Compares per-file cost of JSON schema validation with and without compiled validators
+#
+# Usage: python -m benchmark.json_schema_validation [config_path ...]
+
+from argparse import ArgumentParser
+from collections import defaultdict
+from jsonschema import validate
+from pathlib import Path
+from timeit import repeat
+
+from snowddl.config import SnowDDLConfig
+from snowddl.parser import default_parser_sequence, PlaceholderParser
+from snowddl.parser._json_schema import validate_json_schema
+from snowddl.parser._parsed_file import ParsedFile
+
+
+def collect_files(config_path: Path):
+    # Params and schemas of all config files, exactly as they are passed to validation
+    files = []
+    original_validate_json_schema = ParsedFile._validate_json_schema
+
+    def _validate_json_schema(self):
+        files.append((self.path, self.params, self.json_schema))
+        original_validate_json_schema(self)
+
+    ParsedFile._validate_json_schema = _validate_json_schema
+
+    try:
+        config = SnowDDLConfig()
+
+        PlaceholderParser(config, config_path).load_placeholders()
+
+        for parser_cls in default_parser_sequence:
+            parser_cls(config, config_path).load_blueprints()
+    finally:
+        ParsedFile._validate_json_schema = original_validate_json_schema
+
+    return files
+
+
+def measure(files, validate_func, number, repeat_count):
+    timings = repeat(lambda: [validate_func(params, json_schema) for _, params, json_schema in files], number=number, repeat=repeat_count)
+
+    return min(timings) / number / len(files)
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark of JSON schema validation of config files")
+    parser.add_argument('config_path', nargs='*', help="Path to config directory (default: sample configs)")
+    parser.add_argument('--number', help="Number of runs per measurement (default: 20)", default=20, type=int)
+    parser.add_argument('--repeat', help="Number of measurements, the best one is reported (default: 5)", default=5, type=int)
+
+    args = parser.parse_args()
+
+    if args.config_path:
+        config_paths = [Path(p) for p in args.config_path]
+    else:
+        config_paths = sorted((Path(__file__).parent.parent / 'snowddl' / '_config').iterdir())
+
+    for config_path in config_paths:
+        files = collect_files(config_path)
+
+        if not files:
+            continue
+
+        files_by_schema = defaultdict(int)
+
+        for _, _, json_schema in files:
+            files_by_schema[id(json_schema)] += 1
+
+        before = measure(files, validate, args.number, args.repeat)
+        after = measure(files, validate_json_schema, args.number, args.repeat)
+
+        print(f"{config_path.name}: {len(files)} files, {len(files_by_schema)} schemas")
+        print(f"  jsonschema.validate():   {before * 1e6:10.1f} us per file")
+        print(f"  compiled validator:      {after * 1e6:10.1f} us per file")
+        print(f"  speedup:                 {before / after:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
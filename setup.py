@@ -48,7 +48,7 @@ Enjoy!
 
     keywords='snowflake database schema object change ddl sql create alter drop grant',
 
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmark', 'benchmark.*']),
     include_package_data = True,
 
     entry_points={
@@ -1,35 +1,53 @@
 from argparse import ArgumentParser, HelpFormatter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from json import loads as json_loads
 from json.decoder import JSONDecodeError
 from logging import getLogger, Formatter, StreamHandler
 from os import environ, getcwd
 from pathlib import Path
+from subprocess import run
 from snowflake.connector import connect
 from traceback import TracebackException
 
 from snowddl.blueprint import ObjectType
+from snowddl.change_scope import SnowDDLChangeScope
+from snowddl.concurrency import SnowDDLConcurrencyController
 from snowddl.config import SnowDDLConfig
+from snowddl.ddl_sink import SnowDDLStatementSink
 from snowddl.engine import SnowDDLEngine
-from snowddl.parser import default_parser_sequence, PlaceholderParser
-from snowddl.resolver import default_resolver_sequence
+from snowddl.metrics import SnowDDLMetrics
+from snowddl.parser import default_parser_sequence, ParseCache, PlaceholderParser
+from snowddl.parser._parse_worker import init_parse_worker
+from snowddl.profiler import SnowDDLProfiler
+from snowddl.resolver import default_resolver_sequence, default_resolver_dependencies
+from snowddl.scheduler import SnowDDLResolverScheduler
 from snowddl.settings import SnowDDLSettings
+from snowddl.state_snapshot import SnowDDLStateSnapshot
 from snowddl.version import __version__
 
 
 class BaseApp:
     parser_sequence = default_parser_sequence
     resolver_sequence = default_resolver_sequence
+    resolver_dependencies = default_resolver_dependencies
 
     def __init__(self):
         self.arg_parser = self.init_arguments_parser()
         self.args = self.init_arguments()
         self.logger = self.init_logger()
+        self.profiler = self.init_profiler()
 
         self.config_path = self.init_config_path()
-        self.config = self.init_config()
+
+        with self.profiler.phase("config") if self.profiler else nullcontext():
+            self.config = self.init_config()
+
         self.settings = self.init_settings()
 
         self.engine = self.init_engine()
+        self.engine.metrics = self.init_metrics()
+        self.engine.profiler = self.profiler
 
     def init_arguments_parser(self):
         formatter = lambda prog: HelpFormatter(prog, max_help_position=32)
@@ -52,18 +70,38 @@ class BaseApp:
         parser.add_argument('--passphrase', help='Passphrase for private key file (default: SNOWFLAKE_PRIVATE_KEY_PASSPHRASE env variable)', default=environ.get('SNOWFLAKE_PRIVATE_KEY_PASSPHRASE'))
         parser.add_argument('--env-prefix', help='Env prefix added to global object names, used to separate environments (e.g. DEV, PROD)', default=environ.get('SNOWFLAKE_ENV_PREFIX'))
         parser.add_argument('--max-workers', help='Maximum number of workers to resolve objects in parallel', default=None, type=int)
+        parser.add_argument('--max-resolvers', help='Maximum number of independent resolvers to run in parallel (default: 1, statements are written in sequence order regardless)', default=None, type=int)
+        parser.add_argument('--bulk-role-grants', help='Load grants of all roles at once from SNOWFLAKE.ACCOUNT_USAGE.GRANTS_TO_ROLES, roles created after the latest update of this view are processed individually', default=False, action='store_true')
+        parser.add_argument('--bulk-role-grants-max-lag', help='Maximum age in seconds of the latest change in SNOWFLAKE.ACCOUNT_USAGE.GRANTS_TO_ROLES for --bulk-role-grants, all roles are processed individually if view is older (default: 900)', default=None, type=int)
+        parser.add_argument('--async-ddl', help='Submit long-running table DDL asynchronously, worker threads are not blocked while Snowflake is running statements', default=False, action='store_true')
+        parser.add_argument('--adaptive-concurrency', help='Adjust number of queries in flight based on latency and throttling, --max-workers is used as initial limit, up to the highest MAX limit of sessions are opened', default=False, action='store_true')
+        parser.add_argument('--concurrency-limits', help='Comma-separated list of CLASS=MIN:MAX limits for adaptive concurrency (classes: META, DDL, REPLACE_TABLE)', default=None, metavar='')
 
         # Logging
         parser.add_argument('--log-level', help="Log level (possible values: DEBUG, INFO, WARNING; default: INFO)", default="INFO")
         parser.add_argument('--show-sql', help="Show executed DDL queries", default=False, action='store_true')
+        parser.add_argument('--stream-ddl', help="Output DDL queries as soon as each object is resolved instead of at the end of the run", default=False, action='store_true')
+        parser.add_argument('--suggested-ddl-path', help="Stream suggested DDL queries to file instead of stdout", default=None, metavar='')
+        parser.add_argument('--executed-ddl-path', help="Stream executed DDL queries to file instead of stdout, implies --show-sql", default=None, metavar='')
+        parser.add_argument('--ddl-gzip', help="Compress DDL files with gzip (enabled automatically for paths ending with .gz)", default=False, action='store_true')
 
         # Placeholders
         parser.add_argument('--placeholder-path', help='Path to config file with environment-specific placeholders', default=None, metavar='')
         parser.add_argument('--placeholder-values', help='Environment-specific placeholder values in JSON format', default=None, metavar='')
 
+        # Parsing
+        parser.add_argument('--parse-workers', help='Number of processes to load and validate config files in parallel (default: 1, no extra processes)', default=None, type=int)
+        parser.add_argument('--parse-cache', help='Path to directory with cache of parsed config files, unchanged files are not parsed again (default: SNOWDDL_PARSE_CACHE env variable)', default=environ.get('SNOWDDL_PARSE_CACHE'), metavar='')
+        parser.add_argument('--parse-cache-trusted', help='Do not validate JSON schema of config files loaded from parse cache', default=False, action='store_true')
+
         # Object types
         parser.add_argument('--exclude-object-types', help="Comma-separated list of object types NOT to resolve", default=None, metavar='')
         parser.add_argument('--include-object-types', help="Comma-separated list of object types TO resolve, all other types are excluded", default=None, metavar='')
+        parser.add_argument('--changed-since', help="Git ref, resolve only objects affected by config files changed since this ref (incremental plan)", default=None, metavar='')
+        parser.add_argument('--state-snapshot', help="Path to state snapshot file, objects without changes since previous run are not compared again (default: SNOWDDL_STATE_SNAPSHOT env variable)", default=environ.get('SNOWDDL_STATE_SNAPSHOT'), metavar='')
+        parser.add_argument('--metrics-json', help="Write timing of queries and resolver tasks to JSON report file", default=None, metavar='')
+        parser.add_argument('--metrics-prometheus', help="Write timing of queries and resolver tasks to Prometheus textfile collector file", default=None, metavar='')
+        parser.add_argument('--profile', help="Write profiling data to directory: cProfile .pstats per phase, collapsed stacks of all threads, tracemalloc snapshots", default=None, metavar='')
 
         # Apply even more unsafe changes
         parser.add_argument('--apply-unsafe', help="Additionally apply unsafe changes, which may cause loss of data (ALTER, DROP, etc.)", default=False, action='store_true')
@@ -116,6 +154,22 @@ class BaseApp:
 
         return logger
 
+    def init_profiler(self):
+        if not self.args.get('profile'):
+            return None
+
+        profiler = SnowDDLProfiler(Path(self.args.get('profile')))
+        profiler.start()
+
+        return profiler
+
+    def init_metrics(self):
+        # Timing of every query is kept until the end of the run, so it is collected only if report was requested
+        if not self.args.get('metrics_json') and not self.args.get('metrics_prometheus'):
+            return None
+
+        return SnowDDLMetrics()
+
     def init_config_path(self):
         config_path = Path(self.args['c'])
 
@@ -144,10 +198,23 @@ class BaseApp:
             self.output_config_errors(config)
             exit(1)
 
+        # Parse cache depends on final placeholder values
+        parse_cache_path = self.get_parse_cache_path()
+
+        if parse_cache_path:
+            config.parse_cache = ParseCache(parse_cache_path, config.placeholders, self.args.get('parse_cache_trusted'))
+
         # Blueprints
-        for parser_cls in self.parser_sequence:
-            parser = parser_cls(config, self.config_path)
-            parser.load_blueprints()
+        if self.args.get('parse_workers') and self.args.get('parse_workers') > 1:
+            self.load_blueprints_parallel(config, self.args.get('parse_workers'))
+        else:
+            for parser_cls in self.parser_sequence:
+                parser = parser_cls(config, self.config_path)
+                parser.load_blueprints()
+
+        if config.parse_cache:
+            self.logger.info(f"Parse cache: {config.parse_cache.hit_count} hits, {config.parse_cache.miss_count} misses")
+            config.parse_cache.evict_stale()
 
         if config.errors:
             self.output_config_errors(config)
@@ -155,6 +222,38 @@ class BaseApp:
 
         return config
 
+    def load_blueprints_parallel(self, config: SnowDDLConfig, parse_workers: int):
+        independent_parsers = [p for p in self.parser_sequence if not p.is_dependent_on_blueprints]
+        dependent_parsers = [p for p in self.parser_sequence if p.is_dependent_on_blueprints]
+
+        # Config files are loaded and validated by worker processes
+        config.parse_executor = ProcessPoolExecutor(max_workers=parse_workers, initializer=init_parse_worker, initargs=(
+            self.config_path,
+            config.env_prefix,
+            config.placeholders,
+            config.parse_cache,
+        ))
+
+        try:
+            # Independent parsers submit files of all object types to worker processes before results of any file are applied
+            independent_parsers = [parser_cls(config, self.config_path) for parser_cls in independent_parsers]
+
+            for parser in independent_parsers:
+                parser.load_blueprints()
+
+            # Results are applied in original order of parsers and files, so config does not depend on order of completion
+            for parser in independent_parsers:
+                parser.apply_worker_results()
+
+            # Dependent parsers look up blueprints of other parsers, so they run last in original order
+            for parser_cls in dependent_parsers:
+                parser = parser_cls(config, self.config_path)
+                parser.load_blueprints()
+                parser.apply_worker_results()
+        finally:
+            config.parse_executor.shutdown()
+            config.parse_executor = None
+
     def init_settings(self):
         settings = SnowDDLSettings()
 
@@ -209,10 +308,71 @@ class BaseApp:
         if self.args.get('max_workers'):
             settings.max_workers = int(self.args.get('max_workers'))
 
+        if self.args.get('max_resolvers'):
+            settings.max_resolvers = int(self.args.get('max_resolvers'))
+
+        if self.args.get('bulk_role_grants'):
+            settings.bulk_role_grants = True
+
+        if self.args.get('bulk_role_grants_max_lag') is not None:
+            settings.bulk_role_grants_max_lag = int(self.args.get('bulk_role_grants_max_lag'))
+
+        if self.args.get('async_ddl'):
+            settings.async_ddl = True
+
+        if self.args.get('adaptive_concurrency'):
+            settings.adaptive_concurrency = True
+
+        if self.args.get('concurrency_limits'):
+            settings.concurrency_limits = self.get_concurrency_limits()
+
+        if self.args.get('changed_since'):
+            if self.args.get('action') == 'destroy':
+                raise ValueError("Argument --changed-since cannot be used with [destroy] action")
+
+            settings.change_scope = self.init_change_scope(self.args.get('changed_since'))
+
         return settings
 
+    def get_concurrency_limits(self):
+        concurrency_limits = {}
+
+        for limit in str(self.args.get('concurrency_limits')).split(','):
+            try:
+                statement_class, min_max = limit.split('=')
+                min_limit, max_limit = (int(v) for v in min_max.split(':'))
+            except ValueError:
+                raise ValueError(f"Invalid concurrency limit [{limit}], expected format is CLASS=MIN:MAX")
+
+            statement_class = statement_class.strip().upper()
+
+            if statement_class not in SnowDDLConcurrencyController.default_limits:
+                raise ValueError(f"Invalid statement class [{statement_class}] in concurrency limits")
+
+            if min_limit < 1 or max_limit < min_limit:
+                raise ValueError(f"Invalid concurrency limit [{limit}], MIN must be positive and MAX must not be lower than MIN")
+
+            concurrency_limits[statement_class] = (min_limit, max_limit)
+
+        return concurrency_limits
+
+    def init_change_scope(self, git_ref):
+        change_scope = SnowDDLChangeScope(self.config)
+        changed_files = self.get_changed_config_files(git_ref)
+
+        for path in changed_files:
+            if not change_scope.add_config_file(path):
+                self.logger.info(f"Changed config file [{path}] is not mapped to specific objects, all objects will be resolved")
+                return None
+
+        change_scope.add_dependent_objects()
+
+        self.logger.info(f"Changed since [{git_ref}]: {len(changed_files)} config files, {len(change_scope.full_names)} objects in scope")
+
+        return change_scope
+
     def init_engine(self):
-        return SnowDDLEngine(self.get_connection(), self.config, self.settings)
+        return SnowDDLEngine(self.get_connection(), self.config, self.settings, connection_factory=self.get_connection)
 
     def get_connection(self):
         options = {
@@ -245,34 +405,68 @@ class BaseApp:
 
         with self.engine:
             self.output_engine_context()
+            self.init_ddl_sinks()
 
-            if self.args.get('action') == 'destroy':
-                if not self.args.get('env_prefix') and not self.args.get('destroy_without_prefix'):
-                    raise ValueError("Argument --env-prefix is required for [destroy] action")
+            try:
+                if self.args.get('action') == 'destroy':
+                    if not self.args.get('env_prefix') and not self.args.get('destroy_without_prefix'):
+                        raise ValueError("Argument --env-prefix is required for [destroy] action")
+
+                    for resolver_cls in self.resolver_sequence:
+                        resolver = resolver_cls(self.engine)
+                        resolver.destroy()
+
+                        error_count += len(resolver.errors)
 
-                for resolver_cls in self.resolver_sequence:
-                    resolver = resolver_cls(self.engine)
-                    resolver.destroy()
+                    self.engine.context.destroy_role_with_prefix()
+                else:
+                    state_snapshot_path = self.get_state_snapshot_path()
 
-                    error_count += len(resolver.errors)
+                    if state_snapshot_path:
+                        self.engine.state_snapshot = SnowDDLStateSnapshot(self.engine, state_snapshot_path)
+                        self.engine.state_snapshot.load()
 
-                self.engine.context.destroy_role_with_prefix()
-            else:
-                for resolver_cls in self.resolver_sequence:
-                    resolver = resolver_cls(self.engine)
-                    resolver.resolve()
+                    scheduler = SnowDDLResolverScheduler(self.engine, self.resolver_sequence, self.resolver_dependencies)
+                    scheduler.resolve()
 
-                    error_count += len(resolver.errors)
+                    error_count += scheduler.error_count
 
-            self.output_engine_stats()
+                    if self.engine.state_snapshot:
+                        self.logger.info(f"State snapshot: {self.engine.state_snapshot.hit_count} objects were not compared again")
+                        self.engine.state_snapshot.save()
 
-            if self.args.get('show_sql'):
-                self.output_executed_ddl()
+                self.engine.flush_ddl_buffers()
 
-            self.output_suggested_ddl()
+                self.output_engine_stats()
+                self.output_metrics()
+                self.output_profile()
 
-            if error_count > 0:
-                exit(8)
+                if self.args.get('show_sql') or self.args.get('executed_ddl_path'):
+                    self.output_executed_ddl()
+
+                self.output_suggested_ddl()
+
+                if error_count > 0:
+                    exit(8)
+            finally:
+                # Files must be complete even if resolution failed
+                self.engine.close_ddl_sinks()
+
+    def init_ddl_sinks(self):
+        executed_ddl_sink = None
+        suggested_ddl_sink = None
+
+        if self.args.get('executed_ddl_path'):
+            executed_ddl_sink = SnowDDLStatementSink("Executed DDL", Path(self.args.get('executed_ddl_path')), self.args.get('ddl_gzip'))
+        elif self.args.get('stream_ddl') and self.args.get('show_sql'):
+            executed_ddl_sink = SnowDDLStatementSink("Executed DDL")
+
+        if self.args.get('suggested_ddl_path'):
+            suggested_ddl_sink = SnowDDLStatementSink("Suggested DDL", Path(self.args.get('suggested_ddl_path')), self.args.get('ddl_gzip'))
+        elif self.args.get('stream_ddl'):
+            suggested_ddl_sink = SnowDDLStatementSink("Suggested DDL")
+
+        self.engine.set_ddl_sinks(executed_ddl_sink, suggested_ddl_sink)
 
     def output_engine_context(self):
         roles = []
@@ -321,14 +515,60 @@ class BaseApp:
 
         return None
 
+    def get_parse_cache_path(self):
+        if self.args.get('parse_cache'):
+            return Path(self.args.get('parse_cache')).resolve()
+
+        return None
+
+    def get_state_snapshot_path(self):
+        if self.args.get('state_snapshot'):
+            return Path(self.args.get('state_snapshot')).resolve()
+
+        return None
+
+    def get_changed_config_files(self, git_ref):
+        # Deleted and renamed files are included, so objects defined in these files are dropped
+        commands = [
+            ['git', 'diff', '--name-only', '--no-renames', '--relative', '-z', git_ref, '--'],
+            ['git', 'ls-files', '--others', '--exclude-standard', '-z'],
+        ]
+
+        changed_files = []
+
+        for command in commands:
+            result = run(command, cwd=self.config_path, capture_output=True, text=True)
+
+            if result.returncode != 0:
+                raise ValueError(f"Could not get config files changed since git ref [{git_ref}]: {result.stderr.strip()}")
+
+            changed_files.extend(Path(p) for p in result.stdout.split('\0') if p)
+
+        return changed_files
+
     def output_config_errors(self, config):
         for e in config.errors:
             self.logger.warning(f"[{e['path']}]: {''.join(TracebackException.from_exception(e['error']).format())}")
 
     def output_engine_stats(self):
-        self.logger.info(f"Executed {len(self.engine.executed_ddl)} DDL queries, Suggested {len(self.engine.suggested_ddl)} DDL queries")
+        self.logger.info(f"Executed {self.engine.executed_ddl_count} DDL queries, Suggested {self.engine.suggested_ddl_count} DDL queries")
+
+    def output_metrics(self):
+        if self.args.get('metrics_json'):
+            self.engine.metrics.write_json(Path(self.args.get('metrics_json')))
+
+        if self.args.get('metrics_prometheus'):
+            self.engine.metrics.write_prometheus(Path(self.args.get('metrics_prometheus')))
+
+    def output_profile(self):
+        if self.profiler:
+            self.profiler.stop()
 
     def output_suggested_ddl(self):
+        # Statements were already written by sink
+        if self.engine.suggested_ddl_sink:
+            return
+
         if self.engine.suggested_ddl:
             print("--- Suggested DDL ---\n")
 
@@ -336,6 +576,10 @@ class BaseApp:
             print(f"{sql};\n")
 
     def output_executed_ddl(self):
+        # Statements were already written by sink
+        if self.engine.executed_ddl_sink:
+            return
+
         if self.engine.executed_ddl:
             print("--- Executed DDL ---\n")
 
@@ -36,6 +36,7 @@ class ConvertApp(BaseApp):
 
         # Logging
         parser.add_argument('--log-level', help="Log level (possible values: DEBUG, INFO, WARNING; default: INFO)", default="INFO")
+        parser.add_argument('--profile', help="Write profiling data to directory: cProfile .pstats per phase, collapsed stacks of all threads, tracemalloc snapshots", default=None, metavar='')
 
         # Object types
         parser.add_argument('--exclude-object-types', help="Comma-separated list of object types NOT to convert", default=None, metavar='')
@@ -102,6 +103,8 @@ class ConvertApp(BaseApp):
 
                 error_count += len(converter.errors)
 
+            self.output_profile()
+
             if error_count > 0:
                 exit(8)
 
@@ -1,6 +1,7 @@
 from argparse import ArgumentParser, HelpFormatter
-from dataclasses import fields, is_dataclass
+from dataclasses import fields, is_dataclass, replace
 from os import environ, getcwd
+from pathlib import Path
 from typing import Optional
 
 from snowddl.app.base import BaseApp
@@ -45,18 +46,31 @@ class SingleDbApp(BaseApp):
         parser.add_argument('--passphrase', help='Passphrase for private key file (default: SNOWFLAKE_PRIVATE_KEY_PASSPHRASE env variable)', default=environ.get('SNOWFLAKE_PRIVATE_KEY_PASSPHRASE'))
         parser.add_argument('--env-prefix', help='Env prefix added to global object names, used to separate environments (e.g. DEV, PROD)', default=environ.get('SNOWFLAKE_ENV_PREFIX'))
         parser.add_argument('--max-workers', help='Maximum number of workers to resolve objects in parallel', default=None, type=int)
+        parser.add_argument('--max-resolvers', help='Maximum number of independent resolvers to run in parallel (default: 1, statements are written in sequence order regardless)', default=None, type=int)
 
         # Logging
         parser.add_argument('--log-level', help="Log level (possible values: DEBUG, INFO, WARNING; default: INFO)", default="INFO")
         parser.add_argument('--show-sql', help="Show executed DDL queries", default=False, action='store_true')
+        parser.add_argument('--stream-ddl', help="Output DDL queries as soon as each object is resolved instead of at the end of the run", default=False, action='store_true')
+        parser.add_argument('--suggested-ddl-path', help="Stream suggested DDL queries to file instead of stdout", default=None, metavar='')
+        parser.add_argument('--executed-ddl-path', help="Stream executed DDL queries to file instead of stdout, implies --show-sql", default=None, metavar='')
+        parser.add_argument('--ddl-gzip', help="Compress DDL files with gzip (enabled automatically for paths ending with .gz)", default=False, action='store_true')
 
         # Placeholders
         parser.add_argument('--placeholder-path', help='Path to config file with environment-specific placeholders', default=None, metavar='')
         parser.add_argument('--placeholder-values', help='Environment-specific placeholder values in JSON format', default=None, metavar='')
 
+        # Parsing
+        parser.add_argument('--parse-workers', help='Number of processes to load and validate config files in parallel (default: 1, no extra processes)', default=None, type=int)
+        parser.add_argument('--parse-cache', help='Path to directory with cache of parsed config files, unchanged files are not parsed again (default: SNOWDDL_PARSE_CACHE env variable)', default=environ.get('SNOWDDL_PARSE_CACHE'), metavar='')
+        parser.add_argument('--parse-cache-trusted', help='Do not validate JSON schema of config files loaded from parse cache', default=False, action='store_true')
+
         # Object types
         parser.add_argument('--exclude-object-types', help="Comma-separated list of object types NOT to resolve", default=None, metavar='')
         parser.add_argument('--include-object-types', help="Comma-separated list of object types TO resolve, all other types are excluded", default=None, metavar='')
+        parser.add_argument('--changed-since', help="Git ref, resolve only objects affected by config files changed since this ref (incremental plan)", default=None, metavar='')
+        parser.add_argument('--state-snapshot', help="Path to state snapshot file, objects without changes since previous run are not compared again (default: SNOWDDL_STATE_SNAPSHOT env variable)", default=environ.get('SNOWDDL_STATE_SNAPSHOT'), metavar='')
+        parser.add_argument('--profile', help="Write profiling data to directory: cProfile .pstats per phase, collapsed stacks of all threads, tracemalloc snapshots", default=None, metavar='')
 
         # Apply even more unsafe changes
         parser.add_argument('--apply-unsafe', help="Additionally apply unsafe changes, which may cause loss of data (ALTER, DROP, etc.)", default=False, action='store_true')
@@ -108,26 +122,21 @@ class SingleDbApp(BaseApp):
         return singledb_config
 
     def convert_blueprint(self, bp: AbstractBlueprint):
-        for f in fields(bp):
-            self.convert_object_recursive(getattr(bp, f.name))
-
-        return bp
+        return self.convert_object_recursive(bp)
 
     def convert_object_recursive(self, obj):
+        # Identifiers are immutable, converted objects are rebuilt instead of being changed in place
         if is_dataclass(obj):
-            for f in fields(obj):
-                self.convert_object_recursive(getattr(obj, f.name))
+            return replace(obj, **{f.name: self.convert_object_recursive(getattr(obj, f.name)) for f in fields(obj) if f.init})
 
         if isinstance(obj, list):
-            for item in obj:
-                self.convert_object_recursive(item)
+            return [self.convert_object_recursive(item) for item in obj]
 
         if isinstance(obj, dict):
-            for item in obj.values():
-                self.convert_object_recursive(item)
+            return {key: self.convert_object_recursive(item) for key, item in obj.items()}
 
         if isinstance(obj, (SchemaIdent, SchemaObjectIdent)):
-            obj.database = self.target_db.database
+            return obj.replace(database=self.target_db.database)
 
         return obj
 
@@ -138,6 +147,16 @@ class SingleDbApp(BaseApp):
 
         return settings
 
+    def get_changed_config_files(self, git_ref):
+        changed_files = []
+
+        # Only files of source database are processed, objects are renamed to target database
+        for path in super().get_changed_config_files(git_ref):
+            if len(path.parts) > 1 and path.parts[0].upper() == self.config_db.database:
+                changed_files.append(Path(self.target_db.database, *path.parts[1:]))
+
+        return changed_files
+
 
 def entry_point():
     app = SingleDbApp()
@@ -0,0 +1,197 @@
+from concurrent.futures import Future
+from contextvars import copy_context
+from threading import Condition, Thread
+from time import perf_counter
+from typing import List, Optional, TYPE_CHECKING
+
+from snowflake.connector import SnowflakeConnection, Error
+
+from snowddl.error import SnowDDLExecuteError
+
+if TYPE_CHECKING:
+    from snowddl.concurrency import SnowDDLAdaptiveLimit
+    from snowddl.engine import SnowDDLEngine
+
+
+class SnowDDLPipeline:
+    # Statements collected by engine.ddl_pipeline() or engine.async_ddl() context
+    # Future is available after exit from async context
+    def __init__(self, is_async: bool):
+        self.is_async = is_async
+        self.statements: List[str] = []
+        self.future: Optional[Future] = None
+
+    def then(self, result):
+        # Returns future which resolves to result after all statements were executed, or result itself if nothing was submitted
+        if self.future is None:
+            return result
+
+        chained_future = Future()
+
+        def callback(f: Future):
+            if f.exception():
+                chained_future.set_exception(f.exception())
+            else:
+                chained_future.set_result(result)
+
+        self.future.add_done_callback(callback)
+
+        return chained_future
+
+
+class SnowDDLAsyncQuery:
+    def __init__(self, connection: SnowflakeConnection, statements: List[str]):
+        self.connection = connection
+        self.statements = statements
+
+        # Context of submitting thread, metrics and executed statements are recorded with the same tags
+        self.context = copy_context()
+
+        self.future = Future()
+        self.query_id = None
+        self.sql = None
+        self.submitted_at = None
+
+        # Concurrency slot of running statement, next statement of chain may be waiting for a slot
+        self.limit: Optional["SnowDDLAdaptiveLimit"] = None
+        self.is_waiting_for_slot = False
+
+
+class SnowDDLAsyncQueryPoller:
+    # Statements are submitted without waiting for completion, status of all running queries is checked by a single thread
+    # Statements of the same chain are executed one by one, next statement is submitted when previous statement is completed
+    # Each running statement holds a concurrency slot, it is released when poller detects completion
+    min_poll_interval = 0.1
+    max_poll_interval = 2.0
+
+    def __init__(self, engine: "SnowDDLEngine"):
+        self.engine = engine
+
+        self.running_queries: List[SnowDDLAsyncQuery] = []
+
+        self._condition = Condition()
+        self._thread = None
+        self._is_shutdown = False
+
+    def submit(self, statements: List[str]) -> Future:
+        query = SnowDDLAsyncQuery(self.engine.connection_pool.get_connection(), list(statements))
+
+        if self._submit_next(query):
+            with self._condition:
+                self._start()
+                self.running_queries.append(query)
+                self._condition.notify()
+
+        return query.future
+
+    def shutdown(self):
+        with self._condition:
+            self._is_shutdown = True
+            self._condition.notify()
+
+        if self._thread:
+            self._thread.join()
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+            self._thread.start()
+
+    def _submit_next(self, query: SnowDDLAsyncQuery, blocking=True):
+        # Returns True if statement was submitted or is waiting for concurrency slot, False if chain is completed
+        # Poller thread must not block on concurrency slot, since slots of running async queries are released by the same thread
+        if not query.statements:
+            query.future.set_result(None)
+            return False
+
+        if self.engine.concurrency:
+            query.limit = self.engine.concurrency.acquire(query.statements[0], False, blocking)
+            query.is_waiting_for_slot = query.limit is None
+
+            if query.is_waiting_for_slot:
+                return True
+
+        query.sql = query.statements.pop(0)
+        query.submitted_at = perf_counter()
+
+        try:
+            cur = query.connection.cursor()
+            cur.execute_async(query.sql)
+            query.query_id = cur.sfqid
+        except Error as e:
+            self._release_slot(query, e)
+            self._record_metrics(query, True)
+            query.future.set_exception(SnowDDLExecuteError(e, query.sql))
+            return False
+
+        return True
+
+    def _is_running_safe(self, query: SnowDDLAsyncQuery):
+        # Poller thread must never stop, otherwise futures of running queries are never resolved
+        try:
+            return self._is_running(query)
+        except Exception as e:
+            self._release_slot(query, None)
+            query.future.set_exception(e)
+            return False
+
+    def _is_running(self, query: SnowDDLAsyncQuery):
+        if query.is_waiting_for_slot:
+            return self._submit_next(query, False)
+
+        try:
+            status = query.connection.get_query_status_throw_if_error(query.query_id)
+        except Error as e:
+            self._release_slot(query, e)
+            self._record_metrics(query, True)
+            query.future.set_exception(SnowDDLExecuteError(e, query.sql))
+            return False
+
+        if query.connection.is_still_running(status):
+            return True
+
+        self._release_slot(query, None)
+        self._record_metrics(query, False)
+        query.context.run(self.engine.record_executed_ddl, query.sql)
+
+        return self._submit_next(query, False)
+
+    def _release_slot(self, query: SnowDDLAsyncQuery, error: Optional[Error]):
+        if query.limit is None:
+            return
+
+        # Completion is detected with polling delay, so latency is not reported
+        query.limit.release(None, error is not None and self.engine.concurrency.is_throttle_error(error))
+        query.limit = None
+
+    def _record_metrics(self, query: SnowDDLAsyncQuery, is_error: bool):
+        # Duration includes polling interval, it is accurate up to the current poll interval
+        query.context.run(self.engine.record_query_metrics, query.sql, perf_counter() - query.submitted_at, None, query.query_id, is_error)
+
+    def _run(self):
+        poll_interval = self.min_poll_interval
+
+        while True:
+            with self._condition:
+                while not self.running_queries and not self._is_shutdown:
+                    self._condition.wait()
+                    poll_interval = self.min_poll_interval
+
+                if self._is_shutdown:
+                    return
+
+                queries = list(self.running_queries)
+
+            completed_queries = [q for q in queries if not self._is_running_safe(q)]
+
+            with self._condition:
+                for q in completed_queries:
+                    self.running_queries.remove(q)
+
+                # Poll more often while queries are completing or waiting for slot, back off while all queries are still running
+                if completed_queries or any(q.is_waiting_for_slot for q in self.running_queries):
+                    poll_interval = self.min_poll_interval
+                else:
+                    poll_interval = min(poll_interval * 2, self.max_poll_interval)
+
+                self._condition.wait(poll_interval)
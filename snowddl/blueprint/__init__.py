@@ -57,6 +57,7 @@ from .ident import (
     SchemaObjectIdentWithArgs,
     StageFileIdent,
     TableConstraintIdent,
+    intern_ident,
 )
 
 from .ident_builder import (
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, fields
+
+
+def frozen_dataclass(cls):
+    # Frozen dataclass with __slots__, instances have no __dict__
+    # Same as @dataclass(frozen=True, slots=True), which is not available before Python 3.10
+    # Mixins used together with other dataclasses must define empty __slots__, their fields are stored in slots of subclass
+    cls = dataclass(frozen=True)(cls)
+
+    if '__slots__' in cls.__dict__:
+        return cls
+
+    inherited_slots = set()
+
+    for base in cls.__mro__[1:]:
+        inherited_slots.update(base.__dict__.get('__slots__', ()))
+
+    field_names = tuple(f.name for f in fields(cls))
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = tuple(name for name in field_names if name not in inherited_slots)
+
+    for name in field_names:
+        cls_dict.pop(name, None)
+
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    # Default pickle state of slotted objects is restored with setattr, which is not allowed for frozen dataclass
+    slotted_cls.__getstate__ = _get_state
+    slotted_cls.__setstate__ = _set_state
+
+    return slotted_cls
+
+
+def _get_state(self):
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _set_state(self, state):
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
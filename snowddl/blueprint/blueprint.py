@@ -1,7 +1,7 @@
 from abc import ABC
-from dataclasses import dataclass
 from typing import Optional, List, Dict, Union, TypeVar, TYPE_CHECKING
 
+from ._dataclass import frozen_dataclass
 from .column import ExternalTableColumn, TableColumn, ViewColumn, NameWithType
 from .data_type import DataType
 from .grant import Grant, FutureGrant
@@ -13,42 +13,45 @@ if TYPE_CHECKING:
     from .object_type import ObjectType
 
 
-@dataclass
+@frozen_dataclass
 class AbstractBlueprint(ABC):
     full_name: AbstractIdent
     comment: Optional[str]
 
 
-@dataclass
+@frozen_dataclass
 class SchemaObjectBlueprint(AbstractBlueprint, ABC):
     full_name: SchemaObjectIdent
 
 
-@dataclass
+@frozen_dataclass
 class RoleBlueprint(AbstractBlueprint):
     full_name: AccountObjectIdent
     grants: List[Grant]
     future_grants: List[FutureGrant]
 
 
-@dataclass
+@frozen_dataclass
 class DependsOnMixin(ABC):
+    # Fields are stored in slots of blueprint, mixin cannot have its own slots due to layout conflict
+    __slots__ = ()
+
     full_name: AbstractIdent
     depends_on: List[AbstractIdent]
 
 
-@dataclass
+@frozen_dataclass
 class AccountParameterBlueprint(AbstractBlueprint):
     full_name: Ident
     value: Union[bool,float,int,str]
 
 
-@dataclass
+@frozen_dataclass
 class BusinessRoleBlueprint(RoleBlueprint):
     pass
 
 
-@dataclass
+@frozen_dataclass
 class DatabaseBlueprint(AbstractBlueprint):
     full_name: DatabaseIdent
     is_transient: Optional[bool]
@@ -56,13 +59,13 @@ class DatabaseBlueprint(AbstractBlueprint):
     is_sandbox: Optional[bool]
 
 
-@dataclass
+@frozen_dataclass
 class DatabaseShareBlueprint(AbstractBlueprint):
     full_name: DatabaseIdent
     share_name: InboundShareIdent
 
 
-@dataclass
+@frozen_dataclass
 class ExternalFunctionBlueprint(SchemaObjectBlueprint):
     full_name: SchemaObjectIdent
     arguments: List[NameWithType]
@@ -80,7 +83,7 @@ class ExternalFunctionBlueprint(SchemaObjectBlueprint):
     response_translator: Optional[SchemaObjectIdent]
 
 
-@dataclass
+@frozen_dataclass
 class ExternalTableBlueprint(SchemaObjectBlueprint):
     columns: Optional[List[ExternalTableColumn]]
     partition_by: Optional[List[Ident]]
@@ -96,13 +99,13 @@ class ExternalTableBlueprint(SchemaObjectBlueprint):
     integration: Optional[Ident]
 
 
-@dataclass
+@frozen_dataclass
 class FileFormatBlueprint(SchemaObjectBlueprint):
     type: str
     format_options: Optional[Dict[str,Union[bool,float,int,str,list]]]
 
 
-@dataclass
+@frozen_dataclass
 class ForeignKeyBlueprint(SchemaObjectBlueprint):
     full_name: TableConstraintIdent
     table_name: SchemaObjectIdent
@@ -111,7 +114,7 @@ class ForeignKeyBlueprint(SchemaObjectBlueprint):
     ref_columns: List[Ident]
 
 
-@dataclass
+@frozen_dataclass
 class FunctionBlueprint(SchemaObjectBlueprint):
     full_name: SchemaObjectIdentWithArgs
     language: str
@@ -127,7 +130,7 @@ class FunctionBlueprint(SchemaObjectBlueprint):
     handler: Optional[str]
 
 
-@dataclass
+@frozen_dataclass
 class InboundShareBlueprint(AbstractBlueprint):
     full_name: DatabaseIdent
     accounts: List[AccountIdent]
@@ -135,7 +138,7 @@ class InboundShareBlueprint(AbstractBlueprint):
     grants: List[Grant]
 
 
-@dataclass
+@frozen_dataclass
 class MaterializedViewBlueprint(SchemaObjectBlueprint):
     text: str
     columns: Optional[List[ViewColumn]]
@@ -143,7 +146,7 @@ class MaterializedViewBlueprint(SchemaObjectBlueprint):
     cluster_by: Optional[List[str]]
 
 
-@dataclass
+@frozen_dataclass
 class MaskingPolicyBlueprint(SchemaObjectBlueprint):
     full_name: SchemaObjectIdent
     arguments: List[NameWithType]
@@ -152,14 +155,14 @@ class MaskingPolicyBlueprint(SchemaObjectBlueprint):
     references: List[MaskingPolicyReference]
 
 
-@dataclass
+@frozen_dataclass
 class NetworkPolicyBlueprint(AbstractBlueprint):
     full_name: Ident
     allowed_ip_list: List[str]
     blocked_ip_list: List[str]
 
 
-@dataclass
+@frozen_dataclass
 class OutboundShareBlueprint(AbstractBlueprint):
     full_name: OutboundShareIdent
     accounts: List[AccountIdent]
@@ -167,7 +170,7 @@ class OutboundShareBlueprint(AbstractBlueprint):
     grants: List[Grant]
 
 
-@dataclass
+@frozen_dataclass
 class PipeBlueprint(SchemaObjectBlueprint):
     auto_ingest: bool
     copy_table_name: SchemaObjectIdent
@@ -181,14 +184,14 @@ class PipeBlueprint(SchemaObjectBlueprint):
     integration: Optional[Ident]
 
 
-@dataclass
+@frozen_dataclass
 class PrimaryKeyBlueprint(SchemaObjectBlueprint):
     full_name: TableConstraintIdent
     table_name: SchemaObjectIdent
     columns: List[Ident]
 
 
-@dataclass
+@frozen_dataclass
 class ProcedureBlueprint(SchemaObjectBlueprint):
     full_name: SchemaObjectIdentWithArgs
     language: str
@@ -204,7 +207,7 @@ class ProcedureBlueprint(SchemaObjectBlueprint):
     handler: Optional[str]
 
 
-@dataclass
+@frozen_dataclass
 class ResourceMonitorBlueprint(AbstractBlueprint):
     full_name: Ident
     credit_quota: int
@@ -212,7 +215,7 @@ class ResourceMonitorBlueprint(AbstractBlueprint):
     triggers: Dict[int,str]
 
 
-@dataclass
+@frozen_dataclass
 class RowAccessPolicyBlueprint(SchemaObjectBlueprint):
     full_name: SchemaObjectIdent
     arguments: List[NameWithType]
@@ -220,7 +223,7 @@ class RowAccessPolicyBlueprint(SchemaObjectBlueprint):
     references: List[RowAccessPolicyReference]
 
 
-@dataclass
+@frozen_dataclass
 class SchemaBlueprint(AbstractBlueprint):
     full_name: SchemaIdent
     is_transient: Optional[bool]
@@ -229,12 +232,12 @@ class SchemaBlueprint(AbstractBlueprint):
     owner_additional_grants: List[Grant]
 
 
-@dataclass
+@frozen_dataclass
 class SchemaRoleBlueprint(RoleBlueprint, DependsOnMixin):
     pass
 
 
-@dataclass
+@frozen_dataclass
 class StageBlueprint(SchemaObjectBlueprint):
     url: Optional[str]
     storage_integration: Optional[Ident]
@@ -245,7 +248,7 @@ class StageBlueprint(SchemaObjectBlueprint):
     upload_stage_files: bool
 
 
-@dataclass
+@frozen_dataclass
 class StageFileBlueprint(SchemaObjectBlueprint):
     full_name: StageFileIdent
     local_path: str
@@ -253,13 +256,13 @@ class StageFileBlueprint(SchemaObjectBlueprint):
     stage_path: str
 
 
-@dataclass
+@frozen_dataclass
 class SequenceBlueprint(SchemaObjectBlueprint):
     start: int
     interval: int
 
 
-@dataclass
+@frozen_dataclass
 class StreamBlueprint(SchemaObjectBlueprint):
     object_type: "ObjectType"
     object_name: SchemaObjectIdent
@@ -268,7 +271,7 @@ class StreamBlueprint(SchemaObjectBlueprint):
     show_initial_rows: Optional[bool]
 
 
-@dataclass
+@frozen_dataclass
 class TableBlueprint(SchemaObjectBlueprint):
     columns: List[TableColumn]
     cluster_by: Optional[List[str]]
@@ -278,13 +281,13 @@ class TableBlueprint(SchemaObjectBlueprint):
     search_optimization: bool
 
 
-@dataclass
+@frozen_dataclass
 class TagBlueprint(SchemaObjectBlueprint):
     full_name: SchemaObjectIdent
     references: List[TagReference]
 
 
-@dataclass
+@frozen_dataclass
 class TaskBlueprint(SchemaObjectBlueprint, DependsOnMixin):
     body: str
     schedule: Optional[str]
@@ -297,19 +300,19 @@ class TaskBlueprint(SchemaObjectBlueprint, DependsOnMixin):
     user_task_timeout_ms: Optional[int]
 
 
-@dataclass
+@frozen_dataclass
 class TechRoleBlueprint(RoleBlueprint):
     pass
 
 
-@dataclass
+@frozen_dataclass
 class UniqueKeyBlueprint(SchemaObjectBlueprint):
     full_name: TableConstraintIdent
     table_name: SchemaObjectIdent
     columns: List[Ident]
 
 
-@dataclass
+@frozen_dataclass
 class UserBlueprint(AbstractBlueprint):
     full_name: AccountObjectIdent
     login_name: str
@@ -327,14 +330,14 @@ class UserBlueprint(AbstractBlueprint):
     session_params: Optional[Dict[str,Union[bool,float,int,str]]]
 
 
-@dataclass
+@frozen_dataclass
 class ViewBlueprint(SchemaObjectBlueprint, DependsOnMixin):
     text: str
     columns: Optional[List[ViewColumn]]
     is_secure: Optional[bool]
 
 
-@dataclass
+@frozen_dataclass
 class WarehouseBlueprint(AbstractBlueprint):
     full_name: AccountObjectIdent
     size: str
@@ -1,12 +1,13 @@
-from dataclasses import dataclass
 from typing import Optional, Union, TYPE_CHECKING
 
+from ._dataclass import frozen_dataclass
+
 if TYPE_CHECKING:
     from .ident import Ident, SchemaObjectIdent
     from .data_type import DataType
 
 
-@dataclass
+@frozen_dataclass
 class ExternalTableColumn:
     name: "Ident"
     type: "DataType"
@@ -15,7 +16,7 @@ class ExternalTableColumn:
     comment: Optional[str]
 
 
-@dataclass
+@frozen_dataclass
 class TableColumn:
     name: "Ident"
     type: "DataType"
@@ -26,13 +27,13 @@ class TableColumn:
     comment: Optional[str]
 
 
-@dataclass
+@frozen_dataclass
 class ViewColumn:
     name: "Ident"
     comment: Optional[str]
 
 
-@dataclass
+@frozen_dataclass
 class NameWithType:
     name: "Ident"
     type: "DataType"
@@ -87,29 +87,47 @@ class BaseDataType(Enum):
 
 
 class DataType:
+    # Data types are immutable, parsed data types are shared by all columns with the same type string
+    __slots__ = ('base_type', 'val1', 'val2', '_str')
+
     data_type_re = compile(r'^(?P<base_type>[a-z0-9_]+)(\((?P<val1>\d+)(,(?P<val2>\d+))?\))?$', IGNORECASE)
 
-    def __init__(self, data_type_str):
-        m = self.data_type_re.match(data_type_str)
+    _instances = {}
+
+    def __new__(cls, data_type_str):
+        try:
+            return cls._instances[data_type_str]
+        except KeyError:
+            pass
+
+        m = cls.data_type_re.match(data_type_str)
 
         if not m:
             raise ValueError(f"Could not parse data type string [{data_type_str}]")
 
         try:
-            self.base_type = BaseDataType[str(m['base_type']).upper()]
+            base_type = BaseDataType[str(m['base_type']).upper()]
         except KeyError:
             raise ValueError(f"Invalid base data type [{m['base_type']}] in type string [{data_type_str}]")
 
-        self.val1 = int(m['val1']) if self.base_type.number_of_properties >= 1 else None
-        self.val2 = int(m['val2']) if self.base_type.number_of_properties >= 2 else None
+        data_type = super().__new__(cls)
 
-    def __str__(self):
-        if self.base_type.number_of_properties >= 2:
-            return f"{self.base_type.name}({self.val1},{self.val2})"
-        elif self.base_type.number_of_properties >= 1:
-            return f"{self.base_type.name}({self.val1})"
+        object.__setattr__(data_type, 'base_type', base_type)
+        object.__setattr__(data_type, 'val1', int(m['val1']) if base_type.number_of_properties >= 1 else None)
+        object.__setattr__(data_type, 'val2', int(m['val2']) if base_type.number_of_properties >= 2 else None)
+        object.__setattr__(data_type, '_str', data_type._format())
 
-        return self.base_type.name
+        # Concurrent parsers may create the same data type twice, only one instance is kept
+        return cls._instances.setdefault(data_type_str, data_type)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Data type is immutable, attribute [{key}] cannot be changed")
+
+    def __reduce__(self):
+        return self.__class__, (self._str,)
+
+    def __str__(self):
+        return self._str
 
     def __repr__(self):
         return f"<{self.__class__.__name__}.{str(self)}>"
@@ -118,4 +136,15 @@ class DataType:
         if not isinstance(other, DataType):
             raise NotImplemented
 
-        return str(self) == str(other)
+        return self._str == other._str
+
+    def __hash__(self):
+        return hash(self._str)
+
+    def _format(self):
+        if self.base_type.number_of_properties >= 2:
+            return f"{self.base_type.name}({self.val1},{self.val2})"
+        elif self.base_type.number_of_properties >= 1:
+            return f"{self.base_type.name}({self.val1})"
+
+        return self.base_type.name
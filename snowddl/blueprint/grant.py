@@ -1,19 +1,20 @@
-from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from ._dataclass import frozen_dataclass
+
 if TYPE_CHECKING:
     from .ident import AbstractIdent
     from .object_type import ObjectType
 
 
-@dataclass
+@frozen_dataclass
 class Grant:
     privilege: str
     on: "ObjectType"
     name: "AbstractIdent"
 
 
-@dataclass
+@frozen_dataclass
 class FutureGrant:
     privilege: str
     on: "ObjectType"
@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
 from string import ascii_letters, digits
-from typing import List, Optional, Tuple
+from sys import intern
+from typing import List, Optional, Tuple, TypeVar
+from weakref import WeakValueDictionary
 
 from .data_type import BaseDataType
 
 
 class AbstractIdent(ABC):
+    # Identifiers are immutable, canonical string and hash are computed once and cached
+    __slots__ = ('_str', '_hash', '__weakref__')
+
     allowed_chars = set(ascii_letters + digits + '_$')
 
     @abstractmethod
@@ -17,21 +22,84 @@ class AbstractIdent(ABC):
         pass
 
     def __str__(self):
+        try:
+            return self._str
+        except AttributeError:
+            pass
+
         core_parts, argument_parts = self.parts_for_format()
 
         if argument_parts is not None:
-            return f"{'.'.join(core_parts)}({','.join(argument_parts)})"
+            val = f"{'.'.join(core_parts)}({','.join(argument_parts)})"
+        else:
+            val = '.'.join(core_parts)
+
+        # Interned string makes equal identifiers share the same string object, comparison is done by identity
+        val = intern(val)
+        object.__setattr__(self, '_str', val)
 
-        return '.'.join(core_parts)
+        return val
 
     def __repr__(self):
         return f"<{self.__class__.__name__}={str(self)}>"
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if not isinstance(other, AbstractIdent):
             raise NotImplementedError
 
-        return str(self) == str(other)
+        try:
+            return self._str == other._str
+        except AttributeError:
+            return str(self) == str(other)
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+
+        # Identifiers of different types with the same string are equal, so hash depends on string only
+        # Hash is different from hash of plain string, identifiers and strings should not be mixed in the same set
+        val = hash((AbstractIdent, str(self)))
+        object.__setattr__(self, '_hash', val)
+
+        return val
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Identifier [{self.__class__.__name__}] is immutable, attribute [{key}] cannot be changed")
+
+    def __getstate__(self):
+        # Cached hash depends on hash randomization of current process, so it is not pickled
+        return {k: getattr(self, k) for cls in self.__class__.__mro__ for k in cls.__dict__.get('__slots__', ()) if k not in AbstractIdent.__slots__}
+
+    def __setstate__(self, state):
+        # Protocol 2+ may pass slots as the second element of tuple
+        if isinstance(state, tuple):
+            state = state[1]
+
+        for k, v in state.items():
+            self._set(k, v)
+
+    def replace(self, **changes):
+        # Identifiers are immutable, copy with some parts changed is returned instead, similar to dataclasses.replace()
+        state = self.__getstate__()
+
+        for k, v in changes.items():
+            if k not in state:
+                raise ValueError(f"Identifier [{self.__class__.__name__}] does not have part [{k}]")
+
+            state[k] = v
+
+        ident = self.__class__.__new__(self.__class__)
+        ident.__setstate__(state)
+
+        return ident
+
+    def _set(self, key, value):
+        object.__setattr__(self, key, value)
 
     def _validate_part(self, val):
         val = str(val)
@@ -39,23 +107,39 @@ class AbstractIdent(ABC):
         if not val:
             raise ValueError("Identifier cannot be empty")
 
-        for char in val:
-            if char not in self.allowed_chars:
-                raise ValueError(f"Character [{char}] in not allowed in identifier [{val}], only ASCII letters, digits and single underscores are accepted")
+        # Invalid character is searched only to build error message
+        if not self.allowed_chars.issuperset(val):
+            for char in val:
+                if char not in self.allowed_chars:
+                    raise ValueError(f"Character [{char}] in not allowed in identifier [{val}], only ASCII letters, digits and single underscores are accepted")
 
         return val.upper()
 
 
+T_Ident = TypeVar('T_Ident', bound=AbstractIdent)
+
+_interned_idents = WeakValueDictionary()
+
+
+def intern_ident(ident: T_Ident) -> T_Ident:
+    # Equal identifiers of the same type share the same instance
+    # Set and dict lookups of interned identifiers are resolved by identity, without calling __eq__
+    return _interned_idents.setdefault((ident.__class__, str(ident)), ident)
+
+
 class AbstractIdentWithPrefix(AbstractIdent, ABC):
+    __slots__ = ('env_prefix',)
+
     def __init__(self, env_prefix):
-        self.env_prefix = self._validate_env_prefix(env_prefix)
+        self._set('env_prefix', self._validate_env_prefix(env_prefix))
 
     def _validate_env_prefix(self, val):
         val = str(val)
 
-        for char in val:
-            if char not in self.allowed_chars:
-                raise ValueError(f"Character [{char}] in not allowed in env prefix [{val}], only ASCII letters, digits and single underscores are accepted")
+        if not self.allowed_chars.issuperset(val):
+            for char in val:
+                if char not in self.allowed_chars:
+                    raise ValueError(f"Character [{char}] in not allowed in env prefix [{val}], only ASCII letters, digits and single underscores are accepted")
 
         if val and not val.endswith('__'):
             raise ValueError(f"Env prefix [{val}] in identifier must end with [__] double underscore")
@@ -64,68 +148,82 @@ class AbstractIdentWithPrefix(AbstractIdent, ABC):
 
 
 class Ident(AbstractIdent):
+    __slots__ = ('name',)
+
     def __init__(self, name):
-        self.name = self._validate_part(name)
+        self._set('name', self._validate_part(name))
 
     def parts_for_format(self):
         return [self.name], None
 
 
 class AccountIdent(AbstractIdent):
+    __slots__ = ('organization', 'account')
+
     def __init__(self, organization, account):
-        self.organization = self._validate_part(organization)
-        self.account = self._validate_part(account)
+        self._set('organization', self._validate_part(organization))
+        self._set('account', self._validate_part(account))
 
     def parts_for_format(self):
         return [self.organization, self.account], None
 
 
 class AccountObjectIdent(AbstractIdentWithPrefix):
+    __slots__ = ('name',)
+
     def __init__(self, env_prefix, name):
         super().__init__(env_prefix)
 
-        self.name = self._validate_part(name)
+        self._set('name', self._validate_part(name))
 
     def parts_for_format(self):
         return [f"{self.env_prefix}{self.name}"], None
 
 
 class DatabaseIdent(AbstractIdentWithPrefix):
+    __slots__ = ('database',)
+
     def __init__(self, env_prefix, database):
         super().__init__(env_prefix)
 
-        self.database = self._validate_part(database)
+        self._set('database', self._validate_part(database))
 
     def parts_for_format(self):
         return [f"{self.env_prefix}{self.database}"], None
 
 
 class InboundShareIdent(AbstractIdent):
+    __slots__ = ('organization', 'account', 'share')
+
     def __init__(self, organization, account, share):
-        self.organization = self._validate_part(organization)
-        self.account = self._validate_part(account)
-        self.share = self._validate_part(share)
+        self._set('organization', self._validate_part(organization))
+        self._set('account', self._validate_part(account))
+        self._set('share', self._validate_part(share))
 
     def parts_for_format(self):
         return [self.organization, self.account, self.share], None
 
 
 class OutboundShareIdent(AbstractIdentWithPrefix):
+    __slots__ = ('share',)
+
     def __init__(self, env_prefix, share):
         super().__init__(env_prefix)
 
-        self.share = self._validate_part(share)
+        self._set('share', self._validate_part(share))
 
     def parts_for_format(self):
         return [f"{self.env_prefix}{self.share}"], None
 
 
 class SchemaIdent(AbstractIdentWithPrefix):
+    __slots__ = ('database', 'schema')
+
     def __init__(self, env_prefix, database, schema):
         super().__init__(env_prefix)
 
-        self.database = self._validate_part(database)
-        self.schema = self._validate_part(schema)
+        self._set('database', self._validate_part(database))
+        self._set('schema', self._validate_part(schema))
 
     def parts_for_format(self):
         return [f"{self.env_prefix}{self.database}", self.schema], None
@@ -136,12 +234,14 @@ class SchemaIdent(AbstractIdentWithPrefix):
 
 
 class SchemaObjectIdent(AbstractIdentWithPrefix):
+    __slots__ = ('database', 'schema', 'name')
+
     def __init__(self, env_prefix, database, schema, name):
         super().__init__(env_prefix)
 
-        self.database = self._validate_part(database)
-        self.schema = self._validate_part(schema)
-        self.name = self._validate_part(name)
+        self._set('database', self._validate_part(database))
+        self._set('schema', self._validate_part(schema))
+        self._set('name', self._validate_part(name))
 
     def parts_for_format(self):
         return [f"{self.env_prefix}{self.database}", self.schema, self.name], None
@@ -152,30 +252,36 @@ class SchemaObjectIdent(AbstractIdentWithPrefix):
 
 
 class SchemaObjectIdentWithArgs(SchemaObjectIdent):
+    __slots__ = ('data_types',)
+
     def __init__(self, env_prefix, database, schema, name, data_types: List[BaseDataType]):
         super().__init__(env_prefix, database, schema, name)
 
-        self.data_types = data_types
+        self._set('data_types', data_types)
 
     def parts_for_format(self):
         return [f"{self.env_prefix}{self.database}", self.schema, self.name], [data_type.name for data_type in self.data_types]
 
 
 class StageFileIdent(SchemaObjectIdent):
+    __slots__ = ('path',)
+
     def __init__(self, env_prefix, database, schema, name, path):
         super().__init__(env_prefix, database, schema, name)
 
-        self.path = path
+        self._set('path', path)
 
     def parts_for_format(self):
         return [f"{self.env_prefix}{self.database}", self.schema, self.name], [self.path]
 
 
 class TableConstraintIdent(SchemaObjectIdent):
+    __slots__ = ('columns',)
+
     def __init__(self, env_prefix, database, schema, name, columns: List[Ident]):
         super().__init__(env_prefix, database, schema, name)
 
-        self.columns = columns
+        self._set('columns', columns)
 
     def parts_for_format(self):
         return [f"{self.env_prefix}{self.database}", self.schema, self.name], [str(c) for c in self.columns]
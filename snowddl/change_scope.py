@@ -0,0 +1,130 @@
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Set, Union, TYPE_CHECKING
+
+from snowddl.blueprint import AbstractIdent, DatabaseIdent, SchemaBlueprint, SchemaIdent, SchemaObjectIdent, build_role_ident
+
+if TYPE_CHECKING:
+    from snowddl.blueprint import AbstractBlueprint
+    from snowddl.config import SnowDDLConfig
+
+
+class SnowDDLChangeScope:
+    # Restricts resolvers to objects defined in changed config files and objects which depend on them
+    # Names are stored without arguments, so all overloads of functions and all constraints of tables are matched
+    def __init__(self, config: "SnowDDLConfig"):
+        self.config = config
+
+        self.full_names: Set[str] = set()
+        self.schemas: Set[str] = set()
+
+    def add_config_file(self, relative_path: Path):
+        # Returns False if file is not mapped to specific objects, all objects must be resolved in this case
+        parts = relative_path.parts
+
+        try:
+            # Account-level config file (warehouses, roles, users, placeholders, etc.)
+            if len(parts) == 1:
+                return False
+
+            # Database params
+            if len(parts) == 2:
+                if parts[1] == 'params.yaml':
+                    self.add_database(DatabaseIdent(self.config.env_prefix, parts[0]))
+
+                return True
+
+            # Schema params
+            if len(parts) == 3:
+                if parts[2] == 'params.yaml':
+                    self.add_schema(SchemaIdent(self.config.env_prefix, parts[0], parts[1]))
+
+                return True
+
+            # Schema object, file may be located in subdirectory (e.g. stage files), name may contain arguments
+            self.add_object(SchemaObjectIdent(self.config.env_prefix, parts[0], parts[1], self._get_base_name(Path(parts[3]).stem)))
+        except ValueError:
+            return False
+
+        return True
+
+    def add_database(self, database: DatabaseIdent):
+        self.add_object(database)
+
+        # Schemas inherit database params
+        for bp in self.config.get_blueprints_by_type(SchemaBlueprint).values():
+            if bp.full_name.database_full_name == database:
+                self.add_schema(bp.full_name)
+
+    def add_schema(self, schema: SchemaIdent):
+        self.add_object(schema)
+
+        # Schema roles are created by resolver from schema blueprints, other roles (e.g. business roles) refer to them by name
+        # Suffix is the same as SchemaRoleResolver.get_role_suffix()
+        for role_type in ('OWNER', 'READ', 'WRITE'):
+            self.add_object(build_role_ident(self.config.env_prefix, schema.database, schema.schema, role_type, self.config.SCHEMA_ROLE_SUFFIX))
+
+    def add_object(self, full_name: Union[AbstractIdent, str]):
+        self.full_names.add(self._get_base_name(str(full_name)))
+
+    def add_dependent_objects(self):
+        remaining_blueprints = {}
+
+        for bp_cls, bp_dict in self.config.blueprints.items():
+            for full_name, bp in bp_dict.items():
+                if not self.is_in_scope(full_name):
+                    remaining_blueprints[(bp_cls, full_name)] = self._get_referenced_names(bp)
+
+        # Repeat until no more objects are added, dependencies may be transitive (view -> view -> table, role -> role)
+        while True:
+            dependent_keys = [key for key, names in remaining_blueprints.items() if self._is_any_in_scope(names)]
+
+            if not dependent_keys:
+                break
+
+            for bp_cls, full_name in dependent_keys:
+                self.add_object(full_name)
+                del remaining_blueprints[(bp_cls, full_name)]
+
+        for full_name in self.full_names:
+            name_parts = full_name.split('.')
+
+            if len(name_parts) >= 2:
+                self.schemas.add(f"{name_parts[0]}.{name_parts[1]}")
+
+    def is_in_scope(self, full_name: str):
+        return self._get_base_name(full_name) in self.full_names
+
+    def is_dependent(self, bp: "AbstractBlueprint"):
+        return self._is_any_in_scope(self._get_referenced_names(bp))
+
+    def is_schema_in_scope(self, database: str, schema: str):
+        return f"{database}.{schema}" in self.schemas
+
+    def _get_base_name(self, full_name: str):
+        return full_name.split('(')[0]
+
+    def _is_any_in_scope(self, full_names: Set[str]):
+        return any(self.is_in_scope(full_name) for full_name in full_names)
+
+    def _get_referenced_names(self, bp: "AbstractBlueprint"):
+        names = set()
+
+        for f in fields(bp):
+            if f.name != 'full_name':
+                self._collect_referenced_names(getattr(bp, f.name), names)
+
+        return names
+
+    def _collect_referenced_names(self, obj, names: Set[str]):
+        if isinstance(obj, AbstractIdent):
+            names.add(str(obj))
+        elif is_dataclass(obj):
+            for f in fields(obj):
+                self._collect_referenced_names(getattr(obj, f.name), names)
+        elif isinstance(obj, (list, tuple, set)):
+            for item in obj:
+                self._collect_referenced_names(item, names)
+        elif isinstance(obj, dict):
+            for item in obj.values():
+                self._collect_referenced_names(item, names)
@@ -0,0 +1,163 @@
+from contextlib import contextmanager
+from re import compile, IGNORECASE
+from threading import Condition
+from time import perf_counter
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+from snowflake.connector import Error
+
+if TYPE_CHECKING:
+    from snowddl.engine import SnowDDLEngine
+
+replace_table_re = compile(r'^\s*CREATE\s+OR\s+REPLACE\s+(TRANSIENT\s+)?TABLE\b', IGNORECASE)
+
+
+class SnowDDLAdaptiveLimit:
+    # AIMD: limit grows by 1 after (limit) successful queries with normal latency
+    # Limit is halved when Snowflake throttles queries or when latency grows well above baseline
+    latency_tolerance = 2.0
+    ewma_alpha = 0.2
+
+    def __init__(self, engine: "SnowDDLEngine", name: str, min_limit: int, max_limit: int, initial_limit: int, is_latency_aware: bool):
+        self.engine = engine
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.is_latency_aware = is_latency_aware
+
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.in_flight = 0
+
+        self.latency_ewma = None
+        self.latency_baseline = None
+        self.completed_since_decrease = max_limit
+
+        self._condition = Condition()
+
+    def acquire(self, blocking=True):
+        # Returns False without waiting if slot is not available and blocking is disabled
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                if not blocking:
+                    return False
+
+                self._condition.wait()
+
+            self.in_flight += 1
+
+            return True
+
+    def release(self, latency: Optional[float], is_throttled: bool):
+        # Latency is None if it is not known precisely (e.g. completion of async query is detected by polling)
+        with self._condition:
+            self.in_flight -= 1
+            self.completed_since_decrease += 1
+
+            if is_throttled:
+                self._decrease("throttled")
+            elif self.is_latency_aware and latency is not None:
+                self._observe_latency(latency)
+            else:
+                self._increase()
+
+            self._condition.notify_all()
+
+    def _observe_latency(self, latency: float):
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+            self.latency_baseline = latency
+        else:
+            self.latency_ewma = self.ewma_alpha * latency + (1 - self.ewma_alpha) * self.latency_ewma
+            self.latency_baseline = min(self.latency_baseline, self.latency_ewma)
+
+        if self.latency_ewma > self.latency_baseline * self.latency_tolerance:
+            self._decrease(f"latency {self.latency_ewma:.3f}s, baseline {self.latency_baseline:.3f}s")
+        else:
+            self._increase()
+
+    def _increase(self):
+        old_limit = int(self.limit)
+        self.limit = min(self.limit + 1 / self.limit, float(self.max_limit))
+
+        if int(self.limit) != old_limit:
+            self.engine.logger.info(f"Concurrency [{self.name}]: {old_limit} -> {int(self.limit)}")
+
+    def _decrease(self, reason):
+        # Queries which were already running when limit was decreased should not decrease it again
+        if self.completed_since_decrease < int(self.limit):
+            return
+
+        old_limit = int(self.limit)
+        self.limit = max(self.limit / 2, float(self.min_limit))
+        self.completed_since_decrease = 0
+
+        # Baseline is re-learned after decrease, warehouse load may have changed permanently
+        self.latency_baseline = self.latency_ewma
+
+        if int(self.limit) != old_limit:
+            self.engine.logger.info(f"Concurrency [{self.name}]: {old_limit} -> {int(self.limit)} ({reason})")
+
+
+class SnowDDLConcurrencyController:
+    # Limits number of queries in flight for each statement class
+    # Worker threads above the current limit are waiting for a free slot
+    # Each class starts with max_workers and adapts within its own (min, max) range
+    default_limits = {
+        "META": (2, 32),
+        "DDL": (1, 16),
+        "REPLACE_TABLE": (1, 4),
+    }
+
+    # Duration of REPLACE TABLE depends mostly on amount of data, so latency is not a signal of overload
+    latency_unaware_classes = ("REPLACE_TABLE",)
+
+    # Statement reached its queued or running timeout
+    throttle_errnos = (625, 630)
+
+    def __init__(self, engine: "SnowDDLEngine", limits: Dict[str, Tuple[int, int]], initial_limit: int):
+        self.engine = engine
+        self.limits: Dict[str, SnowDDLAdaptiveLimit] = {}
+
+        for name, (min_limit, max_limit) in {**self.default_limits, **limits}.items():
+            self.limits[name] = SnowDDLAdaptiveLimit(engine, name, min_limit, max_limit, initial_limit, name not in self.latency_unaware_classes)
+
+    @property
+    def max_limit(self):
+        return max(limit.max_limit for limit in self.limits.values())
+
+    @contextmanager
+    def slot(self, sql: str, is_meta: bool):
+        limit = self.limits[self.get_statement_class(sql, is_meta)]
+        limit.acquire()
+
+        start = perf_counter()
+        is_throttled = False
+
+        try:
+            yield
+        except Error as e:
+            is_throttled = self.is_throttle_error(e)
+            raise
+        finally:
+            limit.release(perf_counter() - start, is_throttled)
+
+    def acquire(self, sql: str, is_meta: bool, blocking=True) -> Optional[SnowDDLAdaptiveLimit]:
+        # Same as slot(), but released explicitly, slot may be held after return to caller (e.g. by async query)
+        limit = self.limits[self.get_statement_class(sql, is_meta)]
+
+        if limit.acquire(blocking):
+            return limit
+
+        return None
+
+    def get_statement_class(self, sql: str, is_meta: bool):
+        if is_meta:
+            return "META"
+
+        if replace_table_re.match(sql):
+            return "REPLACE_TABLE"
+
+        return "DDL"
+
+    def is_throttle_error(self, e: Error):
+        return e.errno in self.throttle_errnos
@@ -1,12 +1,17 @@
 from collections import defaultdict
+from concurrent.futures import Executor
 from dataclasses import fields
 from fnmatch import translate
 from pathlib import Path
 from re import compile
-from typing import List, Dict, Type, Union
+from threading import Lock
+from typing import List, Dict, Optional, Type, Union, TYPE_CHECKING
 
 from snowddl.blueprint import AbstractBlueprint, AbstractIdentWithPrefix, T_Blueprint
 
+if TYPE_CHECKING:
+    from snowddl.parser import ParseCache
+
 
 class SnowDDLConfig:
     BUSINESS_ROLE_SUFFIX = 'B_ROLE'
@@ -23,6 +28,10 @@ class SnowDDLConfig:
         self.errors: List[dict] = []
 
         self.placeholders: Dict[str,Union[bool,float,int,str]] = {}
+        self.parse_cache: Optional["ParseCache"] = None
+        self.parse_executor: Optional[Executor] = None
+
+        self._lock = Lock()
 
     def get_blueprints_by_type(self, cls: Type[T_Blueprint]) -> Dict[str,T_Blueprint]:
         return self.blueprints.get(cls, {})
@@ -58,13 +67,16 @@ class SnowDDLConfig:
         return self.placeholders[name]
 
     def add_blueprint(self, bp: AbstractBlueprint):
-        self.blueprints[bp.__class__][str(bp.full_name)] = bp
+        # Parsers may run in parallel
+        with self._lock:
+            self.blueprints[bp.__class__][str(bp.full_name)] = bp
 
     def add_error(self, path: Path, e: Exception):
-        self.errors.append({
-            "path": path,
-            "error": e,
-        })
+        with self._lock:
+            self.errors.append({
+                "path": path,
+                "error": e,
+            })
 
     def add_placeholder(self, name: str, value: Union[bool,float,int,str]):
         self.placeholders[name] = value
@@ -0,0 +1,173 @@
+from itertools import cycle
+from threading import local, main_thread, current_thread, Condition, Lock
+from typing import Callable, List, Optional, TypeVar
+
+from snowflake.connector import SnowflakeConnection, Error
+
+
+T = TypeVar('T')
+
+
+class SnowDDLConnectionPool:
+    # Each thread leases a session once and keeps using it
+    # Main thread always uses primary connection, which was used to initialize context
+    # New sessions are opened outside of lock, slots are reserved beforehand, so pool never grows above max size
+
+    # Session expired or authentication token expired, statement was rejected before execution
+    SESSION_EXPIRED_ERRNOS = (390112, 390114)
+
+    def __init__(self, connection: SnowflakeConnection, connection_factory: Optional[Callable[[], SnowflakeConnection]], max_size: int):
+        self.connection = connection
+        self.connection_factory = connection_factory
+        self.max_size = max_size
+
+        self.pooled_connections: List[SnowflakeConnection] = []
+        self.session_statements: List[str] = []
+
+        self._local = local()
+        self._lock = Lock()
+        self._pool_changed = Condition(self._lock)
+        self._round_robin = None
+        self._reserved_count = 0
+
+    def get_connection(self) -> SnowflakeConnection:
+        connection = getattr(self._local, 'connection', None)
+
+        if connection is None or connection.is_closed():
+            connection = self._lease_connection()
+            self._local.connection = connection
+
+        return connection
+
+    def run(self, func: Callable[[SnowflakeConnection], T]) -> T:
+        # Session might expire while it was idle, such session is not closed on client side
+        # Statement is rejected before execution, so it is safe to run it again in new session
+        connection = self.get_connection()
+
+        try:
+            return func(connection)
+        except Error as e:
+            if e.errno not in self.SESSION_EXPIRED_ERRNOS or self.connection_factory is None:
+                raise
+
+        connection = self._replace_connection(connection)
+        self._local.connection = connection
+
+        return func(connection)
+
+    def execute_session_statement(self, sql):
+        # Statement changes session state (e.g. USE ROLE), it must be applied to all sessions, including future sessions
+        with self._lock:
+            self.session_statements.append(sql)
+
+            for connection in [self.connection] + self.pooled_connections:
+                if not connection.is_closed():
+                    connection.cursor().execute(sql)
+
+    def close(self):
+        with self._lock:
+            for connection in self.pooled_connections:
+                if not connection.is_closed():
+                    connection.close()
+
+            self.pooled_connections = []
+            self._round_robin = None
+
+    def _lease_connection(self):
+        if current_thread() is main_thread() or self.connection_factory is None:
+            return self.connection
+
+        with self._lock:
+            while True:
+                # Health check, forget sessions which were closed
+                healthy_connections = [c for c in self.pooled_connections if not c.is_closed()]
+
+                if len(healthy_connections) != len(self.pooled_connections):
+                    self.pooled_connections = healthy_connections
+                    self._round_robin = None
+
+                if len(self.pooled_connections) + self._reserved_count < self.max_size:
+                    self._reserved_count += 1
+                    break
+
+                if self.pooled_connections:
+                    # Pool is full, share existing sessions between remaining threads
+                    if self._round_robin is None:
+                        self._round_robin = cycle(list(self.pooled_connections))
+
+                    return next(self._round_robin)
+
+                # All slots are reserved by threads which are still opening sessions
+                self._pool_changed.wait()
+
+        return self._open_reserved_connection()
+
+    def _replace_connection(self, expired: SnowflakeConnection):
+        with self._lock:
+            if expired is self.connection:
+                is_primary = True
+            elif expired in self.pooled_connections:
+                is_primary = False
+
+                self.pooled_connections.remove(expired)
+                self._round_robin = None
+                self._reserved_count += 1
+            else:
+                # Shared session was already replaced by another thread
+                is_primary = None
+
+        if is_primary is None:
+            return self._lease_connection()
+
+        # Expired session is still open on client side, threads sharing it detect replacement by is_closed()
+        self._close_expired_connection(expired)
+
+        if is_primary:
+            return self._open_connection(self._set_primary_connection)
+
+        return self._open_reserved_connection()
+
+    def _close_expired_connection(self, expired: SnowflakeConnection):
+        # Session no longer exists on server side, errors on close are not relevant
+        try:
+            expired.close()
+        except Exception:
+            pass
+
+    def _open_reserved_connection(self):
+        try:
+            return self._open_connection(self._add_pooled_connection)
+        except Exception:
+            with self._lock:
+                self._reserved_count -= 1
+                self._pool_changed.notify_all()
+
+            raise
+
+    def _open_connection(self, register: Callable[[SnowflakeConnection], None]):
+        # Login and replay of session statements happen outside of lock
+        # Statements added by other threads in the meantime are replayed before session is registered
+        connection = self.connection_factory()
+        replayed_count = 0
+
+        while True:
+            with self._lock:
+                statements = self.session_statements[replayed_count:]
+
+                if not statements:
+                    register(connection)
+                    return connection
+
+            for sql in statements:
+                connection.cursor().execute(sql)
+
+            replayed_count += len(statements)
+
+    def _add_pooled_connection(self, connection: SnowflakeConnection):
+        self._reserved_count -= 1
+        self.pooled_connections.append(connection)
+        self._round_robin = None
+        self._pool_changed.notify_all()
+
+    def _set_primary_connection(self, connection: SnowflakeConnection):
+        self.connection = connection
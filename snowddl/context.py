@@ -84,18 +84,19 @@ class SnowDDLContext:
                 "current_role": self.current_role,
             })
 
-        self.engine.execute_meta("USE ROLE {role_with_prefix:i}", {
+        # Role is activated in all pooled sessions
+        self.engine.execute_session_meta("USE ROLE {role_with_prefix:i}", {
             "role_with_prefix": role_with_prefix,
         })
 
         self.current_role = str(role_with_prefix)
-        self.engine.flush_thread_buffers()
+        self.engine.flush_ddl_buffers()
 
     def destroy_role_with_prefix(self):
         if not self.engine.config.env_prefix:
             return
 
-        self.engine.execute_meta("USE ROLE {original_role:i}", {
+        self.engine.execute_session_meta("USE ROLE {original_role:i}", {
             "original_role": self.original_role,
         })
 
@@ -104,4 +105,4 @@ class SnowDDLContext:
         })
 
         self.current_role = self.original_role
-        self.engine.flush_thread_buffers()
+        self.engine.flush_ddl_buffers()
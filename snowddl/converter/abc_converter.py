@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum
 from concurrent.futures import as_completed
-from jsonschema import validate
 from pathlib import Path
 from traceback import format_exc
 from typing import Dict, List, TYPE_CHECKING
@@ -10,6 +9,7 @@ from yaml import dump_all
 from snowddl.error import SnowDDLExecuteError
 from snowddl.blueprint import ObjectType, Edition
 from snowddl.converter._yaml import SnowDDLDumper, YamlFoldedStr, YamlLiteralStr
+from snowddl.parser._json_schema import validate_json_schema
 
 if TYPE_CHECKING:
     from snowddl.engine import SnowDDLEngine
@@ -48,18 +48,19 @@ class AbstractConverter(ABC):
             self.engine.logger.info(f"Could not get existing objects for converter [{self.__class__.__name__}]: \n{e.verbose_message()}")
             raise e.snow_exc
 
-        tasks = {}
+        with self.engine.profile_phase(f"convert.{self.__class__.__name__}"):
+            tasks = {}
 
-        for full_name in sorted(self.existing_objects):
-            tasks[full_name] = (self.dump_object, self.existing_objects[full_name])
+            for full_name in sorted(self.existing_objects):
+                tasks[full_name] = (self.dump_object, self.existing_objects[full_name])
 
-        self._process_tasks(tasks)
+            self._process_tasks(tasks)
 
     def _process_tasks(self, tasks):
         futures = {}
 
         for full_name, args in tasks.items():
-            futures[self.engine.executor.submit(*args)] = full_name
+            futures[self.engine.executor.submit(self._run_task, *args)] = full_name
 
         for f in as_completed(futures):
             full_name = futures[f]
@@ -80,6 +81,10 @@ class AbstractConverter(ABC):
 
             self.converted_objects[result].append(full_name)
 
+    def _run_task(self, func, *args):
+        with self.engine.profile_task(f"task.{self.__class__.__name__}"):
+            return func(*args)
+
     def _is_skipped(self):
         if self.engine.context.edition < self.skip_min_edition:
             return True
@@ -92,12 +97,12 @@ class AbstractConverter(ABC):
 
         return False
 
-    def _dump_file(self, file_path: Path, data: Dict, json_schema: dict):
+    def _dump_file(self, file_path: Path, data: Dict, json_schema: dict, json_schema_key: str):
         # Remove None values
         data = {k:v for k,v in data.items() if v is not None}
 
         # Validate JSON schema
-        validate(data, json_schema)
+        validate_json_schema(data, json_schema, json_schema_key)
 
         # (Over)write file
         with file_path.open('w', encoding='utf-8') as f:
@@ -1,15 +1,31 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from snowddl.converter.abc_converter import AbstractConverter, ConvertResult, YamlLiteralStr, YamlFoldedStr
+from snowddl.metadata_snapshot import SnowDDLMetadataSnapshot
 
 
 class AbstractSchemaObjectConverter(AbstractConverter, ABC):
+    metadata_snapshot: Optional[SnowDDLMetadataSnapshot] = None
+
     def get_existing_objects(self):
         existing_objects = {}
+        self.metadata_snapshot = SnowDDLMetadataSnapshot(self.engine)
+
+        # Process databases in parallel, objects of all schemas in database are loaded by a single SHOW command
+        for database_objects in self.engine.executor.map(self.get_existing_objects_in_database, self.engine.schema_cache.schemas_by_database().values()):
+            existing_objects.update(database_objects)
+
+        # Raw metadata is no longer required
+        self.metadata_snapshot = None
+
+        return existing_objects
+
+    def get_existing_objects_in_database(self, schemas: list):
+        existing_objects = {}
 
-        # Process schemas in parallel
-        for schema_objects in self.engine.executor.map(self.get_existing_objects_in_schema, self.engine.schema_cache.schemas.values()):
-            existing_objects.update(schema_objects)
+        for schema in schemas:
+            existing_objects.update(self.get_existing_objects_in_schema(schema))
 
         return existing_objects
 
@@ -10,10 +10,7 @@ class SequenceConverter(AbstractSchemaObjectConverter):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta("SHOW SEQUENCES IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("SEQUENCES", schema)
 
         for r in cur:
             existing_objects[f"{r['database_name']}.{r['schema_name']}.{r['name']}"] = {
@@ -38,7 +35,7 @@ class SequenceConverter(AbstractSchemaObjectConverter):
         object_path.mkdir(mode=0o755, parents=True, exist_ok=True)
 
         if data:
-            self._dump_file(object_path / f"{self._normalise_name(row['name'])}.yaml", data, sequence_json_schema)
+            self._dump_file(object_path / f"{self._normalise_name(row['name'])}.yaml", data, sequence_json_schema, "snowddl.parser.sequence:sequence_json_schema")
             return ConvertResult.DUMP
 
         return ConvertResult.EMPTY
@@ -1,7 +1,9 @@
 from re import compile
+from typing import Optional
 
 from snowddl.blueprint import ObjectType
 from snowddl.converter.abc_schema_object_converter import AbstractSchemaObjectConverter, ConvertResult
+from snowddl.metadata_snapshot import SnowDDLMetadataSnapshot
 from snowddl.parser.table import table_json_schema
 
 
@@ -10,16 +12,24 @@ collate_type_syntax_re = compile(r'^(.*) COLLATE \'(.*)\'$')
 
 
 class TableConverter(AbstractSchemaObjectConverter):
+    columns_snapshot: Optional[SnowDDLMetadataSnapshot] = None
+
     def get_object_type(self) -> ObjectType:
         return ObjectType.TABLE
 
+    def convert(self):
+        # Columns of all tables in database are loaded by a single query instead of DESC TABLE for each table
+        self.columns_snapshot = SnowDDLMetadataSnapshot(self.engine)
+
+        try:
+            super().convert()
+        finally:
+            self.columns_snapshot = None
+
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta("SHOW TABLES IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("TABLES", schema)
 
         for r in cur:
             # Skip external tables
@@ -63,7 +73,7 @@ class TableConverter(AbstractSchemaObjectConverter):
         object_path.mkdir(mode=0o755, parents=True, exist_ok=True)
 
         if data:
-            self._dump_file(object_path / f"{self._normalise_name(row['name'])}.yaml", data, table_json_schema)
+            self._dump_file(object_path / f"{self._normalise_name(row['name'])}.yaml", data, table_json_schema, "snowddl.parser.table:table_json_schema")
             return ConvertResult.DUMP
 
         return ConvertResult.EMPTY
@@ -71,11 +81,16 @@ class TableConverter(AbstractSchemaObjectConverter):
     def _get_columns(self, row):
         cols = {}
 
-        cur = self.engine.execute_meta("DESC TABLE {database:i}.{schema:i}.{name:i}", {
-            "database": row['database'],
-            "schema": row['schema'],
-            "name": row['name'],
-        })
+        cur = self.columns_snapshot.desc_table(row['database'], row['schema'], row['name'])
+
+        # DESC TABLE is used if table was not found in snapshot or if it has virtual columns, same as in resolver
+        # Expressions of virtual columns must be dumped exactly as DESC TABLE returns them
+        if cur is None or any(r['expression'] for r in cur):
+            cur = self.engine.execute_meta("DESC TABLE {database:i}.{schema:i}.{name:i}", {
+                "database": row['database'],
+                "schema": row['schema'],
+                "name": row['name'],
+            })
 
         for r in cur:
             m = collate_type_syntax_re.match(r['type'])
@@ -97,6 +112,9 @@ class TableConverter(AbstractSchemaObjectConverter):
                 else:
                     col['default'] = str(r['default'])
 
+            if r['expression']:
+                col['expression'] = str(r['expression'])
+
             if r['comment']:
                 col['comment'] = r['comment']
 
@@ -14,10 +14,7 @@ class ViewConverter(AbstractSchemaObjectConverter):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta("SHOW VIEWS IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("VIEWS", schema)
 
         for r in cur:
             if r['is_materialized'] == 'true':
@@ -46,7 +43,7 @@ class ViewConverter(AbstractSchemaObjectConverter):
         object_path.mkdir(mode=0o755, parents=True, exist_ok=True)
 
         if data:
-            self._dump_file(object_path / f"{self._normalise_name(row['name'])}.yaml", data, view_json_schema)
+            self._dump_file(object_path / f"{self._normalise_name(row['name'])}.yaml", data, view_json_schema, "snowddl.parser.view:view_json_schema")
             return ConvertResult.DUMP
 
         return ConvertResult.EMPTY
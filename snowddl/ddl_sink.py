@@ -0,0 +1,63 @@
+from contextvars import ContextVar
+from gzip import open as gzip_open
+from pathlib import Path
+from sys import stdout
+from threading import Lock
+from typing import Optional
+
+# Full name of object resolved by current task, statements are grouped by object before output
+ddl_object_name = ContextVar('ddl_object_name', default='')
+
+
+class SnowDDLStatementSink:
+    # Writes statements as soon as engine flushes them, statements are not kept in memory
+    # Output goes to stdout by default, or to file if path was provided, file can be compressed with gzip
+    _stdout_lock = Lock()
+    _stdout_title = None
+
+    def __init__(self, title: str, path: Optional[Path] = None, is_gzip: bool = False):
+        self.title = title
+        self.path = path
+        self.is_gzip = bool(path) and (is_gzip or path.suffix == '.gz')
+
+        self.count = 0
+
+        self._file = None
+        self._lock = Lock()
+
+    def write(self, sql: str):
+        # Count is changed under the same lock as file, stdout has its own additional lock shared by all sinks
+        with self._lock:
+            if self.path:
+                self._write_file(sql)
+            else:
+                self._write_stdout(sql)
+
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _write_file(self, sql: str):
+        if self._file is None:
+            self._file = gzip_open(self.path, 'wt', encoding='utf-8') if self.is_gzip else self.path.open('w', encoding='utf-8')
+            self._file.write(f"--- {self.title} ---\n\n")
+
+        self._file.write(f"{sql};\n\n")
+
+        # Flush of gzip stream after each statement would ruin compression ratio
+        if not self.is_gzip:
+            self._file.flush()
+
+    def _write_stdout(self, sql: str):
+        # Executed and suggested statements may be streamed to stdout at the same time, title is repeated when sink changes
+        with self._stdout_lock:
+            if SnowDDLStatementSink._stdout_title != self.title:
+                stdout.write(f"--- {self.title} ---\n\n")
+                SnowDDLStatementSink._stdout_title = self.title
+
+            stdout.write(f"{sql};\n\n")
+            stdout.flush()
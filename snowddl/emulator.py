@@ -0,0 +1,1091 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from itertools import count
+from json import dumps
+from re import compile, IGNORECASE, DOTALL
+from threading import RLock
+from time import sleep, monotonic
+from typing import Dict, List, Optional, Set, Tuple
+
+from snowflake.connector.errors import ProgrammingError
+
+from snowddl.version import __version__
+
+ident_part = r'(?:"(?:[^"]|"")+"|[A-Za-z_][A-Za-z0-9_$]*)'
+ident = rf'{ident_part}(?:\.{ident_part})*'
+string_literal = r"'(?:[^'\\]|''|\\.)*'"
+
+ident_part_re = compile(r'"((?:[^"]|"")+)"|([A-Za-z_][A-Za-z0-9_$]*)')
+string_literal_re = compile(string_literal, DOTALL)
+property_re = compile(rf"(\w+)\s*=\s*({string_literal}|[^\s,()]+)", IGNORECASE | DOTALL)
+statement_kind_re = compile(r'^\s*(\w+)')
+data_type_re = compile(r'^(\w+)(?:\((\d+)(?:,(\d+))?\))?$')
+
+column_re = compile(
+    rf"^\s*(?:,\s*)?(?P<name>{ident_part})\s+(?P<type>\w+(?:\(\d+(?:,\d+)?\))?)"
+    rf"(?:\s+COLLATE\s+(?P<collate>{string_literal}))?"
+    rf"(?:\s+DEFAULT\s+(?P<default>.+?))?"
+    rf"(?P<not_null>\s+NOT\s+NULL)?"
+    rf"(?:\s+AS\s+\((?P<expression>.*)\))?"
+    rf"(?:\s+COMMENT\s+(?P<comment>{string_literal}))?\s*$",
+    IGNORECASE | DOTALL,
+)
+
+# Object types with full support, DDL for other object types is accepted and ignored
+account_object_types = ('ROLE', 'WAREHOUSE')
+schema_object_types = ('TABLE', 'VIEW', 'SEQUENCE')
+
+
+def _re(pattern):
+    return compile(rf'^\s*{pattern}\s*$', IGNORECASE | DOTALL)
+
+
+class SnowDDLEmulatorCatalog:
+    # In-memory state of emulated Snowflake account, shared by all connections
+    # Only a subset of SQL used by SnowDDL resolvers is understood, output of SHOW and DESC commands mimics Snowflake
+    def __init__(self, user='EMULATOR', role='SYSADMIN', warehouse='EMULATOR_WH', edition='ENTERPRISE'):
+        self.user = user
+        self.role = role
+        self.warehouse = warehouse
+        self.edition = edition
+
+        self.databases: Dict[str, Dict] = {}
+        self.schemas: Dict[str, Dict[str, Dict]] = defaultdict(dict)
+        self.account_objects: Dict[str, Dict[str, Dict]] = defaultdict(dict)
+        self.schema_objects: Dict[str, Dict[str, Dict[Tuple[str, str], Dict]]] = defaultdict(lambda: defaultdict(dict))
+
+        self.grants: Dict[str, Set[Tuple[str, str, Tuple[str, ...]]]] = defaultdict(set)
+        self.future_grants: Dict[str, Set[Tuple[str, str, Tuple[str, str]]]] = defaultdict(set)
+
+        self.statement_count = 0
+        self.ignored_statement_count = 0
+
+        self.lock = RLock()
+
+    def connect(self, latency: Optional[Dict[str, float]] = None):
+        return SnowDDLEmulatorConnection(self, latency)
+
+
+class SnowDDLEmulatorConnection:
+    # Drop-in replacement for SnowflakeConnection, each connection is a separate session
+    # Latency is configured in seconds per statement kind (SHOW, DESC, CREATE, GRANT, ...), DEFAULT applies to other kinds
+    session_ids = count(1)
+
+    def __init__(self, catalog: SnowDDLEmulatorCatalog, latency: Optional[Dict[str, float]] = None):
+        self.catalog = catalog
+        self.latency = {k.upper(): v for k, v in (latency or {}).items()}
+
+        self.session_id = next(self.session_ids)
+        self.current_role = catalog.role
+        self.current_warehouse = catalog.warehouse
+
+        self.async_queries: Dict[str, Tuple[float, Optional[ProgrammingError]]] = {}
+        self.query_ids = count(1)
+
+        self._is_closed = False
+        self._is_expired = False
+
+    def cursor(self, cursor_class=None):
+        return SnowDDLEmulatorCursor(self)
+
+    def is_closed(self):
+        return self._is_closed
+
+    def close(self):
+        self._is_closed = True
+
+    def expire(self):
+        # Same as session expired on server side, connection is not closed, but all statements are rejected
+        self._is_expired = True
+
+    def get_query_status_throw_if_error(self, query_id):
+        ready_at, error = self.async_queries[query_id]
+
+        if monotonic() < ready_at:
+            return 'RUNNING'
+
+        if error:
+            raise error
+
+        return 'SUCCESS'
+
+    @staticmethod
+    def is_still_running(status):
+        return status == 'RUNNING'
+
+    def get_latency(self, sql):
+        match = statement_kind_re.match(sql)
+        kind = match.group(1).upper() if match else 'DEFAULT'
+
+        return self.latency.get(kind, self.latency.get('DEFAULT', 0))
+
+    def next_query_id(self):
+        return f"emulator-{self.session_id}-{next(self.query_ids)}"
+
+
+class SnowDDLEmulatorCursor:
+    # Statements are matched against patterns in order, the first matching handler is called
+    handlers = [
+        (_re(r'SELECT\s+CURRENT_SESSION\(\).*'), '_select_context'),
+        (_re(r'SELECT\s+.*\bsnowflake\.account_usage\..*'), '_select_account_usage'),
+        (_re(rf'SELECT\s+.*\bFROM\s+(?P<database>{ident})\.information_schema\.columns\b.*'), '_select_columns'),
+        (_re(r'SELECT\s+.*'), '_empty'),
+        (_re(rf'SHOW\s+DATABASES(?:\s+LIKE\s+(?P<like>{string_literal}))?'), '_show_databases'),
+        (_re(rf'SHOW\s+SCHEMAS\s+IN\s+DATABASE\s+(?P<database>{ident})'), '_show_schemas'),
+        (_re(rf'SHOW\s+(?P<plural>ROLES|WAREHOUSES)(?:\s+LIKE\s+(?P<like>{string_literal}))?'), '_show_account_objects'),
+        (_re(rf'SHOW\s+(?P<plural>TABLES|VIEWS|SEQUENCES)\s+IN\s+(?P<scope>DATABASE|SCHEMA)\s+(?P<name>{ident})'), '_show_schema_objects'),
+        (_re(rf'SHOW\s+GRANTS\s+TO\s+ROLE\s+(?P<role>{ident})'), '_show_grants_to_role'),
+        (_re(rf'SHOW\s+FUTURE\s+GRANTS\s+TO\s+ROLE\s+(?P<role>{ident})'), '_show_future_grants_to_role'),
+        (_re(rf'SHOW\s+FUTURE\s+GRANTS\s+IN\s+SCHEMA\s+(?P<schema>{ident})'), '_show_future_grants_in_schema'),
+        (_re(rf'SHOW\s+COLUMNS\s+IN\s+(?P<scope>DATABASE|SCHEMA)\s+(?P<name>{ident})'), '_show_columns'),
+        (_re(r'SHOW\s+.*'), '_empty'),
+        (_re(rf'DESC(?:RIBE)?\s+TABLE\s+(?P<name>{ident})'), '_desc_table'),
+        (_re(r'DESC(?:RIBE)?\s+.*'), '_empty'),
+        (_re(rf'USE\s+ROLE\s+(?P<name>{ident})'), '_use_role'),
+        (_re(rf'USE\s+WAREHOUSE\s+(?P<name>{ident})'), '_use_warehouse'),
+        (_re(rf'CREATE\s+(?P<replace>OR\s+REPLACE\s+)?(?P<transient>TRANSIENT\s+)?DATABASE\s+(?P<name>{ident})(?P<rest>.*)'), '_create_database'),
+        (_re(rf'CREATE\s+(?P<replace>OR\s+REPLACE\s+)?(?P<transient>TRANSIENT\s+)?SCHEMA\s+(?P<name>{ident})(?P<rest>.*)'), '_create_schema'),
+        (_re(rf'CREATE\s+(?P<replace>OR\s+REPLACE\s+)?(?P<object_type>ROLE|WAREHOUSE)\s+(?P<name>{ident})(?P<rest>.*)'), '_create_account_object'),
+        (_re(rf'CREATE\s+(?P<replace>OR\s+REPLACE\s+)?(?P<transient>TRANSIENT\s+)?TABLE\s+(?P<name>{ident})(?P<rest>.*)'), '_create_table'),
+        (_re(rf'CREATE\s+(?P<replace>OR\s+REPLACE\s+)?(?P<secure>SECURE\s+)?VIEW\s+(?P<name>{ident})(?P<rest>.*)'), '_create_view'),
+        (_re(rf'CREATE\s+(?P<replace>OR\s+REPLACE\s+)?SEQUENCE\s+(?P<name>{ident})(?P<rest>.*)'), '_create_sequence'),
+        (_re(rf'ALTER\s+DATABASE\s+(?P<name>{ident})\s+(?P<rest>.*)'), '_alter_database'),
+        (_re(rf'ALTER\s+SCHEMA\s+(?P<name>{ident})\s+(?P<rest>.*)'), '_alter_schema'),
+        (_re(rf'ALTER\s+(?P<object_type>ROLE|WAREHOUSE)\s+(?P<name>{ident})\s+(?P<rest>.*)'), '_alter_account_object'),
+        (_re(rf'ALTER\s+TABLE\s+(?P<name>{ident})\s+(?P<rest>.*)'), '_alter_table'),
+        (_re(rf'ALTER\s+(?P<object_type>VIEW|SEQUENCE)\s+(?P<name>{ident})\s+(?P<rest>.*)'), '_alter_schema_object'),
+        (_re(rf'COMMENT\s+ON\s+(?P<object_type>TABLE|VIEW|SEQUENCE)\s+(?P<name>{ident})\s+IS\s+(?P<comment>{string_literal})'), '_comment_on_schema_object'),
+        (_re(rf'DROP\s+DATABASE\s+(?:IF\s+EXISTS\s+)?(?P<name>{ident})'), '_drop_database'),
+        (_re(rf'DROP\s+SCHEMA\s+(?:IF\s+EXISTS\s+)?(?P<name>{ident})'), '_drop_schema'),
+        (_re(rf'DROP\s+(?P<object_type>ROLE|WAREHOUSE)\s+(?:IF\s+EXISTS\s+)?(?P<name>{ident})'), '_drop_account_object'),
+        (_re(rf'DROP\s+(?P<object_type>TABLE|VIEW|SEQUENCE)\s+(?:IF\s+EXISTS\s+)?(?P<name>{ident})'), '_drop_schema_object'),
+        (_re(rf'(?P<action>GRANT|REVOKE)\s+ROLE\s+(?P<name>{ident})\s+(?:TO|FROM)\s+(?P<grantee_type>ROLE|USER)\s+(?P<grantee>{ident})'), '_grant_role'),
+        (_re(rf'(?P<action>GRANT|REVOKE)\s+(?P<privileges>.+?)\s+ON\s+FUTURE\s+(?P<plural>[A-Z ]+?)\s+IN\s+SCHEMA\s+(?P<schema>{ident})\s+(?:TO|FROM)\s+ROLE\s+(?P<grantee>{ident})'), '_grant_future'),
+        (_re(rf'(?P<action>GRANT|REVOKE)\s+(?P<privileges>.+?)\s+ON\s+ALL\s+(?P<plural>[A-Z ]+?)\s+IN\s+SCHEMA\s+(?P<schema>{ident})\s+(?:TO|FROM)\s+ROLE\s+(?P<grantee>{ident})'), '_grant_all'),
+        (_re(rf'(?P<action>GRANT|REVOKE)\s+(?P<privileges>.+?)\s+ON\s+(?P<singular>[A-Z ]+?)\s+(?P<name>{ident})\s+(?:TO|FROM)\s+ROLE\s+(?P<grantee>{ident})'), '_grant'),
+    ]
+
+    def __init__(self, connection: SnowDDLEmulatorConnection):
+        self.connection = connection
+        self.catalog = connection.catalog
+
+        self.rows: List[Dict] = []
+        self.rowcount = None
+        self.sfqid = None
+
+        self._pos = 0
+
+    # Cursor interface
+
+    def execute(self, sql, params=None, file_stream=None, num_statements=None, **kwargs):
+        self._check_session()
+        statements = self._split_statements(sql)
+
+        if num_statements is not None and num_statements != len(statements):
+            raise self._error(f"Actual statement count {len(statements)} did not match the desired statement count {num_statements}.", errno=8)
+
+        if num_statements is None and len(statements) > 1:
+            raise self._error(f"Actual statement count {len(statements)} did not match the desired statement count 1.", errno=8)
+
+        self.sfqid = self.connection.next_query_id()
+        sleep(sum(self.connection.get_latency(s) for s in statements))
+
+        rows = []
+
+        for idx, statement in enumerate(statements):
+            statement_rows = self._execute_statement(statement)
+
+            # Multi-statement request returns result of the first statement
+            if idx == 0:
+                rows = statement_rows
+
+        self._set_rows(rows)
+
+        return self
+
+    def execute_async(self, sql, **kwargs):
+        self._check_session()
+        self.sfqid = self.connection.next_query_id()
+        error = None
+
+        try:
+            self._execute_statement(sql)
+        except ProgrammingError as e:
+            error = e
+
+        self.connection.async_queries[self.sfqid] = (monotonic() + self.connection.get_latency(sql), error)
+
+        return {"queryId": self.sfqid}
+
+    def describe(self, sql, *args, **kwargs):
+        self._check_session()
+        self.sfqid = self.connection.next_query_id()
+        sleep(self.connection.get_latency('DESC'))
+
+        match = _re(rf'SELECT\s+\*\s+FROM\s+(?P<name>{ident})').match(sql)
+
+        if match:
+            parts = self._parse_ident(match.group('name'))
+
+            if len(parts) == 3:
+                for object_type in schema_object_types:
+                    obj = self.catalog.schema_objects[object_type][parts[0]].get((parts[1], parts[2]))
+
+                    if obj:
+                        return [{"name": c['name']} for c in obj.get('columns', [])]
+
+            raise self._does_not_exist('Object', parts)
+
+        return []
+
+    def fetchone(self):
+        if self._pos >= len(self.rows):
+            return None
+
+        self._pos += 1
+
+        return self.rows[self._pos - 1]
+
+    def fetchall(self):
+        rows = self.rows[self._pos:]
+        self._pos = len(self.rows)
+
+        return rows
+
+    def __iter__(self):
+        while self._pos < len(self.rows):
+            self._pos += 1
+            yield self.rows[self._pos - 1]
+
+    def close(self):
+        pass
+
+    # Statement processing
+
+    def _check_session(self):
+        if self.connection._is_expired:
+            raise self._error("Authentication token has expired.  The user must authenticate again.", errno=390114)
+
+    def _execute_statement(self, sql):
+        with self.catalog.lock:
+            self.catalog.statement_count += 1
+
+            for regexp, handler_name in self.handlers:
+                match = regexp.match(sql)
+
+                if match:
+                    return getattr(self, handler_name)(match, sql) or []
+
+            self.catalog.ignored_statement_count += 1
+
+        return []
+
+    def _set_rows(self, rows):
+        self.rows = rows
+        self.rowcount = len(rows)
+        self._pos = 0
+
+    def _empty(self, match, sql):
+        return []
+
+    def _select_context(self, match, sql):
+        return [{
+            "CURRENT_SESSION": str(self.connection.session_id),
+            "CURRENT_USER": self.catalog.user,
+            "CURRENT_ROLE": self.connection.current_role,
+            "CURRENT_WAREHOUSE": self.connection.current_warehouse,
+            "IS_ACCOUNT_ADMIN": False,
+            "IS_SYS_ADMIN": True,
+            "IS_SECURITY_ADMIN": True,
+            "BOOTSTRAP_ACCOUNT": dumps({
+                "serverVersion": f"emulator-{__version__}",
+                "accountInfo": {"serviceLevelName": self.catalog.edition},
+            }),
+        }]
+
+    def _select_account_usage(self, match, sql):
+        raise self._error("Database 'SNOWFLAKE' does not exist or not authorized.", errno=2003)
+
+    def _select_columns(self, match, sql):
+        database = self._parse_ident(match.group('database'))[0]
+        rows = []
+
+        for (schema, name), obj in sorted(self.catalog.schema_objects['TABLE'][database].items()):
+            for c in obj['columns']:
+                type_match = data_type_re.match(c['type'])
+                base_type, val1, val2 = type_match.groups() if type_match else (c['type'], None, None)
+
+                row = {
+                    "TABLE_SCHEMA": schema,
+                    "TABLE_NAME": name,
+                    "COLUMN_NAME": c['name'],
+                    "DATA_TYPE": base_type,
+                    "CHARACTER_MAXIMUM_LENGTH": None,
+                    "NUMERIC_PRECISION": None,
+                    "NUMERIC_SCALE": None,
+                    "DATETIME_PRECISION": None,
+                    "COLLATION_NAME": c['collate'],
+                    "IS_NULLABLE": 'NO' if c['not_null'] else 'YES',
+                    "COLUMN_DEFAULT": c['default'],
+                    "COMMENT": c['comment'],
+                }
+
+                if base_type == 'VARCHAR':
+                    row.update({"DATA_TYPE": 'TEXT', "CHARACTER_MAXIMUM_LENGTH": int(val1)})
+                elif base_type == 'BINARY':
+                    row.update({"CHARACTER_MAXIMUM_LENGTH": int(val1)})
+                elif base_type == 'NUMBER':
+                    row.update({"NUMERIC_PRECISION": int(val1), "NUMERIC_SCALE": int(val2)})
+                elif base_type in ('TIME', 'TIMESTAMP_LTZ', 'TIMESTAMP_NTZ', 'TIMESTAMP_TZ'):
+                    row.update({"DATETIME_PRECISION": int(val1)})
+
+                rows.append(row)
+
+        return rows
+
+    def _show_databases(self, match, sql):
+        like_re = self._like_to_re(match.group('like'))
+
+        return [self._database_row(db) for name, db in sorted(self.catalog.databases.items()) if like_re.match(name)]
+
+    def _show_schemas(self, match, sql):
+        database = self._parse_ident(match.group('database'))[0]
+
+        if database not in self.catalog.databases:
+            raise self._does_not_exist('Database', [database])
+
+        return [self._schema_row(s) for name, s in sorted(self.catalog.schemas[database].items())]
+
+    def _show_account_objects(self, match, sql):
+        object_type = match.group('plural').upper()[:-1]
+        like_re = self._like_to_re(match.group('like'))
+
+        return [self._account_object_row(obj) for name, obj in sorted(self.catalog.account_objects[object_type].items()) if like_re.match(name)]
+
+    def _show_schema_objects(self, match, sql):
+        object_type = match.group('plural').upper()[:-1]
+        parts = self._parse_ident(match.group('name'))
+
+        if parts[0] not in self.catalog.databases:
+            raise self._does_not_exist('Database', parts[:1])
+
+        if match.group('scope').upper() == 'SCHEMA' and parts[1] not in self.catalog.schemas[parts[0]]:
+            raise self._does_not_exist('Schema', parts)
+
+        rows = []
+
+        for (schema, name), obj in sorted(self.catalog.schema_objects[object_type][parts[0]].items()):
+            if len(parts) == 1 or schema == parts[1]:
+                rows.append(self._schema_object_row(obj))
+
+        return rows
+
+    def _show_columns(self, match, sql):
+        parts = self._parse_ident(match.group('name'))
+        database = parts[0]
+        rows = []
+
+        if match.group('scope').upper() == 'SCHEMA' and parts[1] not in self.catalog.schemas[database]:
+            raise self._does_not_exist('Schema', parts)
+
+        for (schema, name), obj in sorted(self.catalog.schema_objects['TABLE'][database].items()):
+            if len(parts) > 1 and schema != parts[1]:
+                continue
+
+            for c in obj['columns']:
+                rows.append({
+                    "table_name": name,
+                    "schema_name": schema,
+                    "column_name": c['name'],
+                    "data_type": dumps({"type": c['type']}),
+                    "null?": 'false' if c['not_null'] else 'true',
+                    "default": c['default'] or '',
+                    "kind": 'VIRTUAL_COLUMN' if c['expression'] else 'COLUMN',
+                    "expression": c['expression'] or '',
+                    "comment": c['comment'] or '',
+                    "database_name": database,
+                    "autoincrement": '',
+                })
+
+        return rows
+
+    def _show_grants_to_role(self, match, sql):
+        role = self._parse_ident(match.group('role'))[0]
+        self._get_account_object('ROLE', role)
+
+        return [{
+            "created_on": None,
+            "privilege": privilege,
+            "granted_on": object_type,
+            "name": '.'.join(name),
+            "granted_to": 'ROLE',
+            "grantee_name": role,
+            "grant_option": 'false',
+            "granted_by": self.connection.current_role,
+        } for privilege, object_type, name in sorted(self.catalog.grants[role])]
+
+    def _show_future_grants_to_role(self, match, sql):
+        role = self._parse_ident(match.group('role'))[0]
+        self._get_account_object('ROLE', role)
+
+        return [self._future_grant_row(role, privilege, object_type, schema) for privilege, object_type, schema in sorted(self.catalog.future_grants[role])]
+
+    def _show_future_grants_in_schema(self, match, sql):
+        parts = self._parse_ident(match.group('schema'))
+        rows = []
+
+        for role, role_future_grants in sorted(self.catalog.future_grants.items()):
+            for privilege, object_type, schema in sorted(role_future_grants):
+                if schema == tuple(parts):
+                    rows.append(self._future_grant_row(role, privilege, object_type, schema))
+
+        return rows
+
+    def _desc_table(self, match, sql):
+        obj = self._get_schema_object('TABLE', self._parse_ident(match.group('name')))
+
+        return [{
+            "name": c['name'],
+            "type": f"{c['type']} COLLATE '{c['collate']}'" if c['collate'] else c['type'],
+            "kind": 'COLUMN',
+            "null?": 'N' if c['not_null'] else 'Y',
+            "default": c['default'],
+            "primary key": 'N',
+            "unique key": 'N',
+            "check": None,
+            "expression": c['expression'],
+            "comment": c['comment'],
+        } for c in obj['columns']]
+
+    def _use_role(self, match, sql):
+        role = self._parse_ident(match.group('name'))[0]
+
+        if role != self.catalog.role:
+            self._get_account_object('ROLE', role)
+
+        self.connection.current_role = role
+
+    def _use_warehouse(self, match, sql):
+        self.connection.current_warehouse = self._parse_ident(match.group('name'))[0]
+
+    def _create_database(self, match, sql):
+        name = self._parse_ident(match.group('name'))[0]
+
+        if name in self.catalog.databases and not match.group('replace'):
+            raise self._already_exists('Database', [name])
+
+        props = self._parse_properties(match.group('rest'))
+
+        self.catalog.databases[name] = self._new_object({
+            "name": name,
+            "is_transient": bool(match.group('transient')),
+            "retention_time": props.get('DATA_RETENTION_TIME_IN_DAYS', '1'),
+            "comment": props.get('COMMENT', ''),
+        })
+
+        # Schema PUBLIC is created automatically
+        self.catalog.schemas[name] = {'PUBLIC': self._new_object({"database": name, "name": 'PUBLIC', "is_transient": False, "is_managed_access": False, "retention_time": '1', "comment": ''})}
+
+    def _create_schema(self, match, sql):
+        database, name = self._parse_ident(match.group('name'))
+        self._get_database(database)
+
+        if name in self.catalog.schemas[database] and not match.group('replace'):
+            raise self._already_exists('Schema', [database, name])
+
+        props = self._parse_properties(match.group('rest'))
+
+        self.catalog.schemas[database][name] = self._new_object({
+            "database": database,
+            "name": name,
+            "is_transient": bool(match.group('transient')),
+            "is_managed_access": bool(_re(r'.*\bWITH\s+MANAGED\s+ACCESS\b.*').match(match.group('rest'))),
+            "retention_time": props.get('DATA_RETENTION_TIME_IN_DAYS', '1'),
+            "comment": props.get('COMMENT', ''),
+        })
+
+    def _create_account_object(self, match, sql):
+        object_type = match.group('object_type').upper()
+        name = self._parse_ident(match.group('name'))[0]
+
+        if name in self.catalog.account_objects[object_type] and not match.group('replace'):
+            raise self._already_exists(object_type.capitalize(), [name])
+
+        props = self._parse_properties(match.group('rest'))
+
+        self.catalog.account_objects[object_type][name] = self._new_object({
+            "object_type": object_type,
+            "name": name,
+            "comment": props.get('COMMENT', ''),
+            "properties": props,
+        })
+
+    def _create_table(self, match, sql):
+        parts = self._parse_ident(match.group('name'))
+        columns_sql, rest = self._split_parentheses(match.group('rest'))
+
+        # CREATE TABLE ... AS SELECT without column list is not supported
+        if columns_sql is None:
+            raise self._error("Emulator supports only CREATE TABLE with explicit list of columns", errno=1003)
+
+        columns = []
+
+        for column_sql in self._split_columns(columns_sql):
+            column_match = column_re.match(column_sql)
+
+            if not column_match:
+                raise self._error(f"Emulator could not parse column definition [{column_sql.strip()}]", errno=1003)
+
+            columns.append({
+                "name": self._parse_ident(column_match.group('name'))[0],
+                "type": column_match.group('type').upper(),
+                "collate": self._parse_string(column_match.group('collate')),
+                "default": column_match.group('default'),
+                "not_null": bool(column_match.group('not_null')),
+                "expression": column_match.group('expression'),
+                "comment": self._parse_string(column_match.group('comment')),
+            })
+
+        props = self._parse_properties(rest)
+        cluster_by_match = _re(r'.*\bCLUSTER\s+BY\s+\((?P<cluster_by>[^)]*)\).*').match(rest)
+
+        self._put_schema_object('TABLE', parts, match.group('replace'), {
+            "columns": columns,
+            "is_transient": bool(match.group('transient')),
+            "cluster_by": f"LINEAR({cluster_by_match.group('cluster_by')})" if cluster_by_match else '',
+            "change_tracking": props.get('CHANGE_TRACKING', 'FALSE').upper() == 'TRUE',
+            "search_optimization": False,
+            "retention_time": props.get('DATA_RETENTION_TIME_IN_DAYS', '1'),
+            "comment": props.get('COMMENT', ''),
+        })
+
+    def _create_view(self, match, sql):
+        parts = self._parse_ident(match.group('name'))
+        columns_sql, rest = self._split_parentheses(match.group('rest'))
+
+        columns = []
+
+        if columns_sql is not None:
+            for column_sql in self._split_columns(columns_sql):
+                columns.append({"name": self._parse_ident(column_sql.lstrip(' ,').split()[0])[0]})
+
+        self._put_schema_object('VIEW', parts, match.group('replace'), {
+            "columns": columns,
+            "text": sql,
+            "is_secure": bool(match.group('secure')),
+            "comment": '',
+        })
+
+    def _create_sequence(self, match, sql):
+        parts = self._parse_ident(match.group('name'))
+        props = self._parse_properties(match.group('rest'))
+
+        self._put_schema_object('SEQUENCE', parts, match.group('replace'), {
+            "next_value": int(props.get('START', 1)),
+            "interval": int(props.get('INCREMENT', 1)),
+            "comment": props.get('COMMENT', ''),
+        })
+
+    def _alter_database(self, match, sql):
+        self._alter_properties(self._get_database(self._parse_ident(match.group('name'))[0]), match.group('rest'))
+
+    def _alter_schema(self, match, sql):
+        database, name = self._parse_ident(match.group('name'))
+        self._get_database(database)
+
+        if name not in self.catalog.schemas[database]:
+            raise self._does_not_exist('Schema', [database, name])
+
+        self._alter_properties(self.catalog.schemas[database][name], match.group('rest'))
+
+    def _alter_account_object(self, match, sql):
+        obj = self._get_account_object(match.group('object_type').upper(), self._parse_ident(match.group('name'))[0])
+        self._alter_properties(obj, match.group('rest'))
+
+    def _alter_schema_object(self, match, sql):
+        obj = self._get_schema_object(match.group('object_type').upper(), self._parse_ident(match.group('name')))
+        self._alter_properties(obj, match.group('rest'))
+
+    def _alter_table(self, match, sql):
+        obj = self._get_schema_object('TABLE', self._parse_ident(match.group('name')))
+        rest = match.group('rest').strip()
+        columns = {c['name']: c for c in obj['columns']}
+
+        add_match = _re(r'ADD\s+COLUMN\s+(?P<column>.*)').match(rest)
+        drop_match = _re(rf'DROP\s+COLUMN\s+(?P<name>{ident_part})').match(rest)
+        modify_match = _re(rf'MODIFY\s+COLUMN\s+(?P<name>{ident_part})\s+(?P<action>.*)').match(rest)
+        cluster_match = _re(r'CLUSTER\s+BY\s+\((?P<cluster_by>.*)\)').match(rest)
+
+        if add_match:
+            column_match = column_re.match(add_match.group('column'))
+
+            if not column_match:
+                raise self._error(f"Emulator could not parse column definition [{add_match.group('column')}]", errno=1003)
+
+            obj['columns'].append({
+                "name": self._parse_ident(column_match.group('name'))[0],
+                "type": column_match.group('type').upper(),
+                "collate": self._parse_string(column_match.group('collate')),
+                "default": column_match.group('default'),
+                "not_null": bool(column_match.group('not_null')),
+                "expression": column_match.group('expression'),
+                "comment": self._parse_string(column_match.group('comment')),
+            })
+        elif drop_match:
+            name = self._parse_ident(drop_match.group('name'))[0]
+            obj['columns'] = [c for c in obj['columns'] if c['name'] != name]
+        elif modify_match:
+            column = columns.get(self._parse_ident(modify_match.group('name'))[0])
+
+            if column is None:
+                raise self._error(f"Column [{modify_match.group('name')}] does not exist", errno=904)
+
+            self._modify_column(column, modify_match.group('action').strip())
+        elif cluster_match:
+            obj['cluster_by'] = f"LINEAR({cluster_match.group('cluster_by')})"
+        elif _re(r'DROP\s+CLUSTERING\s+KEY').match(rest):
+            obj['cluster_by'] = ''
+        elif _re(r'ADD\s+SEARCH\s+OPTIMIZATION').match(rest):
+            obj['search_optimization'] = True
+        elif _re(r'DROP\s+SEARCH\s+OPTIMIZATION').match(rest):
+            obj['search_optimization'] = False
+        else:
+            props = self._alter_properties(obj, rest)
+
+            if 'CHANGE_TRACKING' in props:
+                obj['change_tracking'] = props['CHANGE_TRACKING'].upper() == 'TRUE'
+
+    def _modify_column(self, column, action):
+        type_match = _re(r'TYPE\s+(?P<type>.*)').match(action)
+        comment_match = _re(rf'COMMENT\s+(?P<comment>{string_literal})').match(action)
+        default_match = _re(r'SET\s+DEFAULT\s+(?P<default>.*)').match(action)
+
+        if type_match:
+            column['type'] = type_match.group('type').upper()
+        elif comment_match:
+            column['comment'] = self._parse_string(comment_match.group('comment')) or None
+        elif default_match:
+            column['default'] = default_match.group('default')
+        elif _re(r'DROP\s+DEFAULT').match(action):
+            column['default'] = None
+        elif _re(r'SET\s+NOT\s+NULL').match(action):
+            column['not_null'] = True
+        elif _re(r'DROP\s+NOT\s+NULL').match(action):
+            column['not_null'] = False
+
+    def _comment_on_schema_object(self, match, sql):
+        obj = self._get_schema_object(match.group('object_type').upper(), self._parse_ident(match.group('name')))
+        obj['comment'] = self._parse_string(match.group('comment'))
+
+    def _drop_database(self, match, sql):
+        name = self._parse_ident(match.group('name'))[0]
+        self._get_database(name)
+
+        del self.catalog.databases[name]
+        self.catalog.schemas.pop(name, None)
+
+        for object_type in schema_object_types:
+            self.catalog.schema_objects[object_type].pop(name, None)
+
+        self._revoke_all_on(lambda n: n[0] == name)
+
+    def _drop_schema(self, match, sql):
+        database, name = self._parse_ident(match.group('name'))
+        self._get_database(database)
+
+        if self.catalog.schemas[database].pop(name, None) is None:
+            raise self._does_not_exist('Schema', [database, name])
+
+        for object_type in schema_object_types:
+            objects = self.catalog.schema_objects[object_type][database]
+
+            for key in [key for key in objects if key[0] == name]:
+                del objects[key]
+
+        self._revoke_all_on(lambda n: n[:2] == (database, name))
+
+    def _drop_account_object(self, match, sql):
+        object_type = match.group('object_type').upper()
+        name = self._parse_ident(match.group('name'))[0]
+        self._get_account_object(object_type, name)
+
+        del self.catalog.account_objects[object_type][name]
+
+        if object_type == 'ROLE':
+            self.catalog.grants.pop(name, None)
+            self.catalog.future_grants.pop(name, None)
+
+        self._revoke_all_on(lambda n: n == (name,))
+
+    def _drop_schema_object(self, match, sql):
+        object_type = match.group('object_type').upper()
+        parts = self._parse_ident(match.group('name'))
+        self._get_schema_object(object_type, parts)
+
+        del self.catalog.schema_objects[object_type][parts[0]][(parts[1], parts[2])]
+
+        self._revoke_all_on(lambda n: n == tuple(parts))
+
+    def _grant_role(self, match, sql):
+        name = self._parse_ident(match.group('name'))[0]
+        grantee = self._parse_ident(match.group('grantee'))[0]
+
+        # Grants to users and system roles are accepted, but not stored
+        if match.group('grantee_type').upper() == 'USER' or grantee not in self.catalog.account_objects['ROLE']:
+            return
+
+        self._apply_grant(match.group('action'), grantee, ('USAGE', 'ROLE', (name,)))
+
+    def _grant_future(self, match, sql):
+        grantee = self._get_account_object('ROLE', self._parse_ident(match.group('grantee'))[0])['name']
+        schema = tuple(self._parse_ident(match.group('schema')))
+        object_type = self._plural_to_object_type(match.group('plural'))
+
+        for privilege in self._parse_privileges(match.group('privileges')):
+            item = (privilege, object_type, schema)
+
+            if match.group('action').upper() == 'GRANT':
+                self.catalog.future_grants[grantee].add(item)
+            else:
+                self.catalog.future_grants[grantee].discard(item)
+
+    def _grant_all(self, match, sql):
+        grantee = self._get_account_object('ROLE', self._parse_ident(match.group('grantee'))[0])['name']
+        database, schema = self._parse_ident(match.group('schema'))
+        object_type = self._plural_to_object_type(match.group('plural'))
+
+        for (obj_schema, obj_name) in self.catalog.schema_objects.get(object_type, {}).get(database, {}):
+            if obj_schema == schema:
+                for privilege in self._parse_privileges(match.group('privileges')):
+                    self._apply_grant(match.group('action'), grantee, (privilege, object_type, (database, obj_schema, obj_name)))
+
+    def _grant(self, match, sql):
+        grantee = self._get_account_object('ROLE', self._parse_ident(match.group('grantee'))[0])['name']
+        object_type = match.group('singular').upper().replace(' ', '_')
+        name = tuple(self._parse_ident(match.group('name')))
+
+        for privilege in self._parse_privileges(match.group('privileges')):
+            self._apply_grant(match.group('action'), grantee, (privilege, object_type, name))
+
+    # Helpers
+
+    def _apply_grant(self, action, grantee, item):
+        if action.upper() == 'GRANT':
+            self.catalog.grants[grantee].add(item)
+        else:
+            self.catalog.grants[grantee].discard(item)
+
+    def _revoke_all_on(self, name_filter):
+        for role_grants in self.catalog.grants.values():
+            for item in [item for item in role_grants if name_filter(item[2])]:
+                role_grants.discard(item)
+
+    def _put_schema_object(self, object_type, parts, is_replace, props):
+        database, schema, name = parts
+        self._get_database(database)
+
+        if schema not in self.catalog.schemas[database]:
+            raise self._does_not_exist('Schema', [database, schema])
+
+        objects = self.catalog.schema_objects[object_type][database]
+        existing = objects.get((schema, name))
+
+        if existing and not is_replace:
+            raise self._already_exists(object_type.capitalize(), parts)
+
+        objects[(schema, name)] = self._new_object({"object_type": object_type, "database": database, "schema": schema, "name": name, **props})
+
+        # Future grants are applied to new objects, existing grants are kept by COPY GRANTS
+        if not existing:
+            for role, role_future_grants in self.catalog.future_grants.items():
+                for privilege, future_object_type, future_schema in role_future_grants:
+                    if future_object_type == object_type and future_schema == (database, schema):
+                        self.catalog.grants[role].add((privilege, object_type, (database, schema, name)))
+
+    def _new_object(self, props):
+        return {"created_on": datetime.now(timezone.utc), "owner": self.connection.current_role, **props}
+
+    def _alter_properties(self, obj, sql):
+        props = {}
+        unset_match = _re(r'UNSET\s+(?P<names>.*)').match(sql)
+
+        if unset_match:
+            for name in unset_match.group('names').split(','):
+                name = name.strip().upper()
+
+                if name == 'COMMENT':
+                    obj['comment'] = ''
+                else:
+                    obj.get('properties', {}).pop(name, None)
+
+            return props
+
+        props = self._parse_properties(sql)
+
+        for name, value in props.items():
+            if name == 'COMMENT':
+                obj['comment'] = value
+            elif name == 'DATA_RETENTION_TIME_IN_DAYS':
+                obj['retention_time'] = value
+            elif name == 'INCREMENT' and 'interval' in obj:
+                obj['interval'] = int(value)
+            elif 'properties' in obj:
+                obj['properties'][name] = value
+
+        return props
+
+    def _get_database(self, name):
+        if name not in self.catalog.databases:
+            raise self._does_not_exist('Database', [name])
+
+        return self.catalog.databases[name]
+
+    def _get_account_object(self, object_type, name):
+        obj = self.catalog.account_objects[object_type].get(name)
+
+        if obj is None:
+            raise self._does_not_exist(object_type.capitalize(), [name])
+
+        return obj
+
+    def _get_schema_object(self, object_type, parts):
+        if len(parts) != 3:
+            raise self._does_not_exist(object_type.capitalize(), parts)
+
+        obj = self.catalog.schema_objects[object_type][parts[0]].get((parts[1], parts[2]))
+
+        if obj is None:
+            raise self._does_not_exist(object_type.capitalize(), parts)
+
+        return obj
+
+    def _database_row(self, db):
+        return {
+            "created_on": db['created_on'],
+            "name": db['name'],
+            "is_default": 'N',
+            "is_current": 'N',
+            "origin": '',
+            "owner": db['owner'],
+            "comment": db['comment'],
+            "options": 'TRANSIENT' if db['is_transient'] else '',
+            "retention_time": str(db['retention_time']),
+        }
+
+    def _schema_row(self, s):
+        options = []
+
+        if s['is_transient']:
+            options.append('TRANSIENT')
+
+        if s['is_managed_access']:
+            options.append('MANAGED ACCESS')
+
+        return {
+            "created_on": s['created_on'],
+            "name": s['name'],
+            "is_default": 'N',
+            "is_current": 'N',
+            "database_name": s['database'],
+            "owner": s['owner'],
+            "comment": s['comment'],
+            "options": ', '.join(options),
+            "retention_time": str(s['retention_time']),
+        }
+
+    def _account_object_row(self, obj):
+        row = {
+            "created_on": obj['created_on'],
+            "name": obj['name'],
+            "owner": obj['owner'],
+            "comment": obj['comment'],
+        }
+
+        if obj['object_type'] == 'WAREHOUSE':
+            props = obj['properties']
+
+            row.update({
+                "state": 'SUSPENDED',
+                "type": 'STANDARD',
+                "size": props.get('WAREHOUSE_SIZE', 'XSMALL'),
+                "min_cluster_count": int(props.get('MIN_CLUSTER_COUNT', 1)),
+                "max_cluster_count": int(props.get('MAX_CLUSTER_COUNT', 1)),
+                "scaling_policy": props.get('SCALING_POLICY', 'STANDARD'),
+                "auto_suspend": int(props.get('AUTO_SUSPEND', 600)),
+                "auto_resume": 'true',
+                "resource_monitor": props.get('RESOURCE_MONITOR', 'null'),
+            })
+
+        return row
+
+    def _schema_object_row(self, obj):
+        row = {
+            "created_on": obj['created_on'],
+            "name": obj['name'],
+            "database_name": obj['database'],
+            "schema_name": obj['schema'],
+            "owner": obj['owner'],
+            "comment": obj['comment'],
+        }
+
+        if obj['object_type'] == 'TABLE':
+            row.update({
+                "kind": 'TRANSIENT' if obj['is_transient'] else 'TABLE',
+                "cluster_by": obj['cluster_by'],
+                "rows": 0,
+                "bytes": 0,
+                "retention_time": str(obj['retention_time']),
+                "change_tracking": 'ON' if obj['change_tracking'] else 'OFF',
+                "search_optimization": 'ON' if obj['search_optimization'] else 'OFF',
+                "is_external": 'N',
+            })
+        elif obj['object_type'] == 'VIEW':
+            row.update({
+                "text": obj['text'],
+                "is_secure": 'true' if obj['is_secure'] else 'false',
+                "is_materialized": 'false',
+            })
+        elif obj['object_type'] == 'SEQUENCE':
+            row.update({
+                "next_value": obj['next_value'],
+                "interval": obj['interval'],
+            })
+
+        return row
+
+    def _future_grant_row(self, role, privilege, object_type, schema):
+        return {
+            "created_on": None,
+            "privilege": privilege,
+            "grant_on": object_type,
+            "name": f"{'.'.join(schema)}.<{object_type}>",
+            "grant_to": 'ROLE',
+            "grantee_name": role,
+            "grant_option": 'false',
+        }
+
+    def _plural_to_object_type(self, plural):
+        plural = ' '.join(plural.upper().split())
+
+        if plural.endswith('IES'):
+            return plural[:-3].replace(' ', '_') + 'Y'
+
+        if plural.endswith('SES'):
+            return plural[:-2].replace(' ', '_')
+
+        return plural[:-1].replace(' ', '_')
+
+    def _parse_privileges(self, privileges):
+        return [' '.join(p.upper().split()) for p in privileges.split(',')]
+
+    def _parse_ident(self, ident_sql):
+        return [quoted.replace('""', '"') if quoted else unquoted.upper() for quoted, unquoted in ident_part_re.findall(ident_sql)]
+
+    def _parse_string(self, string_sql):
+        if string_sql is None:
+            return None
+
+        return string_sql[1:-1].replace("''", "'").replace("\\\\", "\\")
+
+    def _parse_properties(self, sql):
+        props = {}
+
+        for name, value in property_re.findall(sql or ''):
+            props[name.upper()] = self._parse_string(value) if value.startswith("'") else value
+
+        return props
+
+    def _like_to_re(self, like_sql):
+        if like_sql is None:
+            return compile('.*', DOTALL)
+
+        pattern = self._parse_string(like_sql)
+        regexp = ''
+        idx = 0
+
+        while idx < len(pattern):
+            char = pattern[idx]
+
+            if char == '\\' and idx + 1 < len(pattern):
+                regexp += '\\' + pattern[idx + 1] if not pattern[idx + 1].isalnum() else pattern[idx + 1]
+                idx += 2
+                continue
+
+            if char == '%':
+                regexp += '.*'
+            elif char == '_':
+                regexp += '.'
+            elif char.isalnum():
+                regexp += char
+            else:
+                regexp += '\\' + char
+
+            idx += 1
+
+        return compile(f'^{regexp}$', IGNORECASE | DOTALL)
+
+    def _split_parentheses(self, sql):
+        # Returns content of the first top-level parentheses and remaining SQL after them
+        start = sql.find('(')
+
+        if start == -1 or sql[:start].strip():
+            return None, sql
+
+        depth = 0
+        quote = None
+
+        for idx in range(start, len(sql)):
+            char = sql[idx]
+
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in ("'", '"'):
+                quote = char
+            elif char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+
+                if depth == 0:
+                    return sql[start + 1:idx], sql[idx + 1:]
+
+        return None, sql
+
+    def _split_columns(self, sql):
+        # Columns are formatted one per line, first line starts with spaces, other lines start with comma
+        return [line for line in sql.split('\n') if line.strip()]
+
+    def _split_statements(self, sql):
+        statements = []
+        current = ''
+        quote = None
+
+        for char in sql:
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in ("'", '"'):
+                quote = char
+            elif char == ';':
+                if current.strip():
+                    statements.append(current.strip())
+
+                current = ''
+                continue
+
+            current += char
+
+        if current.strip():
+            statements.append(current.strip())
+
+        return statements
+
+    def _error(self, msg, errno):
+        return ProgrammingError(msg=msg, errno=errno, sqlstate='42000', sfqid=self.sfqid)
+
+    def _does_not_exist(self, object_type, parts):
+        return ProgrammingError(msg=f"{object_type} '{'.'.join(parts)}' does not exist or not authorized.", errno=2003, sqlstate='02000', sfqid=self.sfqid)
+
+    def _already_exists(self, object_type, parts):
+        return ProgrammingError(msg=f"Object '{'.'.join(parts)}' already exists.", errno=2002, sqlstate='42710', sfqid=self.sfqid)
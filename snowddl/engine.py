@@ -1,17 +1,28 @@
 from logging import getLogger, NullHandler
-from threading import get_ident
+from threading import local, Lock
+from time import perf_counter
 
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
 from snowflake.connector import DictCursor, SnowflakeConnection, Error
+from typing import Callable, Optional
 
+from snowddl.async_query_poller import SnowDDLAsyncQueryPoller, SnowDDLPipeline
+from snowddl.concurrency import SnowDDLConcurrencyController
 from snowddl.config import SnowDDLConfig
+from snowddl.connection_pool import SnowDDLConnectionPool
 from snowddl.settings import SnowDDLSettings
 from snowddl.formatter import SnowDDLFormatter
+from snowddl.meta_cache import SnowDDLCachedResult, SnowDDLMetaCache
+from snowddl.metrics import SnowDDLContextThreadPoolExecutor, SnowDDLMetrics, metrics_tags
+from snowddl.profiler import SnowDDLProfiler
 from snowddl.query_builder import SnowDDLQueryBuilder
 from snowddl.context import SnowDDLContext
+from snowddl.ddl_sink import SnowDDLStatementSink, ddl_object_name
 from snowddl.error import SnowDDLExecuteError
+from snowddl.role_grant_cache import SnowDDLRoleGrantCache
 from snowddl.schema_cache import SnowDDLSchemaCache
+from snowddl.state_snapshot import SnowDDLStateSnapshot
 
 
 logger = getLogger(__name__)
@@ -19,8 +30,7 @@ logger.addHandler(NullHandler())
 
 
 class SnowDDLEngine:
-    def __init__(self, connection: SnowflakeConnection, config: SnowDDLConfig, settings: SnowDDLSettings):
-        self.connection = connection
+    def __init__(self, connection: SnowflakeConnection, config: SnowDDLConfig, settings: SnowDDLSettings, connection_factory: Optional[Callable[[], SnowflakeConnection]] = None):
         self.config = config
         self.settings = settings
         self.logger = logger
@@ -28,37 +38,127 @@ class SnowDDLEngine:
         self.formatter = SnowDDLFormatter()
         self.format = self.formatter.format_sql
 
-        self.executor = ThreadPoolExecutor(max_workers=self.settings.max_workers, thread_name_prefix=self.__class__.__name__)
+        # Optional metrics, enabled by application only if report was requested
+        self.metrics: Optional[SnowDDLMetrics] = None
+        self.meta_cache = SnowDDLMetaCache()
+
+        # Optional controller of queries in flight, executor must have enough threads for the highest limit
+        self.concurrency: Optional[SnowDDLConcurrencyController] = None
+        executor_max_workers = self.settings.max_workers
+
+        if self.settings.adaptive_concurrency:
+            self.concurrency = SnowDDLConcurrencyController(self, self.settings.concurrency_limits, initial_limit=self.settings.max_workers)
+            executor_max_workers = max(executor_max_workers, self.concurrency.max_limit)
+
+        # Additional sessions are opened only if connection factory was provided
+        # Pool is sized like executor, otherwise threads above max_workers would share sessions and serialize on them
+        self.connection_pool = SnowDDLConnectionPool(connection, connection_factory, max_size=executor_max_workers)
+
+        self.executor = SnowDDLContextThreadPoolExecutor(max_workers=executor_max_workers, thread_name_prefix=self.__class__.__name__)
+        self.async_query_poller = SnowDDLAsyncQueryPoller(self)
 
         self.executed_ddl = []
         self.suggested_ddl = []
 
+        self.executed_ddl_count = 0
+        self.suggested_ddl_count = 0
+
+        # Optional sinks enabled by application, statements are written on flush instead of being kept in lists above
+        self.executed_ddl_sink: Optional[SnowDDLStatementSink] = None
+        self.suggested_ddl_sink: Optional[SnowDDLStatementSink] = None
+
+        # Statements are buffered per (resolver, object) until object is resolved
         self._executed_ddl_buffer = defaultdict(list)
         self._suggested_ddl_buffer = defaultdict(list)
+        self._ddl_buffer_lock = Lock()
+        self._ddl_pipeline = local()
+
+        # Flushed statements of resolvers running ahead of preceding resolvers in sequence are held until released
+        self._held_executed_ddl = {}
+        self._held_suggested_ddl = {}
+
+        # Statements are taken from buffers under buffer lock and written to sinks outside of it
+        # Batches are queued in the same order as they were taken, any thread holding write lock writes all queued batches
+        self._ddl_write_queue = deque()
+        self._ddl_write_lock = Lock()
 
         self.context = SnowDDLContext(self)
         self.context.activate_role_with_prefix()
 
         self.schema_cache = SnowDDLSchemaCache(self)
+        self.role_grant_cache = SnowDDLRoleGrantCache(self)
+
+        # Optional snapshot of objects without changes, enabled by application
+        self.state_snapshot: Optional[SnowDDLStateSnapshot] = None
+
+        # Optional profiler, enabled by application
+        self.profiler: Optional[SnowDDLProfiler] = None
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.executor.shutdown()
+        self.async_query_poller.shutdown()
+        self.connection_pool.close()
+
+    @property
+    def connection(self) -> SnowflakeConnection:
+        # Primary connection is owned by pool, it is replaced if session expires
+        return self.connection_pool.connection
 
     def query_builder(self):
         return SnowDDLQueryBuilder(self.formatter)
 
     def describe_meta(self, sql, params=None):
-        return self._describe(sql, params)
+        sql = self.format(sql, params)
+
+        if not self._is_meta_cache_allowed():
+            return self._describe(sql, None)
+
+        key = ('DESCRIBE', sql)
+        result = self.meta_cache.get(key)
+
+        if result is None:
+            generation = self.meta_cache.get_generation(sql)
+            result = self._describe(sql, None)
+
+            self.meta_cache.put(key, sql, result, generation)
+
+        return list(result)
 
     def execute_meta(self, sql, params=None):
-        return self._execute(sql, params, is_meta=True)
+        sql = self.format(sql, params)
+
+        if not self._is_meta_cache_allowed() or not self.meta_cache.is_cacheable(sql):
+            return self._execute(sql, None, is_meta=True)
+
+        key = ('EXECUTE', sql)
+        cached = self.meta_cache.get(key)
+
+        if cached is None:
+            generation = self.meta_cache.get_generation(sql)
+            cur = self._execute(sql, None, is_meta=True)
+            cached = (cur.fetchall(), cur.rowcount, cur.sfqid)
+
+            self.meta_cache.put(key, sql, cached, generation)
+
+        return SnowDDLCachedResult(*cached)
 
     def execute_context_ddl(self, sql, params=None):
         return self._execute(sql, params)
 
+    def execute_session_meta(self, sql, params=None):
+        sql = self.format(sql, params)
+
+        try:
+            self.connection_pool.execute_session_statement(sql)
+        except Error as e:
+            raise SnowDDLExecuteError(e, sql)
+        finally:
+            # Session state (e.g. current role) affects output of all SHOW and DESC commands
+            self.meta_cache.clear()
+
     def execute_safe_ddl(self, sql, params=None, condition=True, file_stream=None):
         if self.settings.execute_safe_ddl and condition:
             self._execute(sql, params, False, file_stream)
@@ -71,41 +171,262 @@ class SnowDDLEngine:
         else:
             self._suggest(sql, params)
 
-    def flush_thread_buffers(self):
-        for thread_sql in self._executed_ddl_buffer.values():
-            for sql in thread_sql:
-                self.executed_ddl.append(sql)
+    @contextmanager
+    def ddl_pipeline(self):
+        # DDL executed in this context is sent to Snowflake as a single multi-statement request on exit
+        # Only statements which are safe to execute more than once (e.g. GRANT, REVOKE) should be used
+        if getattr(self._ddl_pipeline, 'current', None) is not None:
+            yield
+            return
 
-        for thread_sql in self._suggested_ddl_buffer.values():
-            for sql in thread_sql:
-                self.suggested_ddl.append(sql)
+        pipeline = self._ddl_pipeline.current = SnowDDLPipeline(is_async=False)
 
-        self._executed_ddl_buffer = defaultdict(list)
-        self._suggested_ddl_buffer = defaultdict(list)
+        try:
+            yield
+        finally:
+            self._ddl_pipeline.current = None
+
+        self._execute_pipeline(pipeline.statements)
+
+    @contextmanager
+    def async_ddl(self):
+        # DDL executed in this context is submitted on exit without waiting for completion, statements are executed one by one
+        # Resolver should return future from .then(), so worker thread is released while Snowflake is running statements
+        pipeline = SnowDDLPipeline(is_async=True)
+
+        if not self.settings.async_ddl or getattr(self._ddl_pipeline, 'current', None) is not None:
+            yield pipeline
+            return
+
+        self._ddl_pipeline.current = pipeline
+
+        try:
+            yield pipeline
+        finally:
+            self._ddl_pipeline.current = None
+
+        if pipeline.statements:
+            pipeline.future = self.async_query_poller.submit(pipeline.statements)
+
+    def record_executed_ddl(self, sql):
+        self.meta_cache.invalidate(sql)
+
+        with self._ddl_buffer_lock:
+            self._executed_ddl_buffer[self._get_ddl_buffer_key()].append(sql)
+
+    def flush_ddl_buffers(self, resolver_name=None, object_name=None):
+        # Multiple resolvers may run in parallel and share the same worker threads
+        # Statements of each object are flushed together, optionally only for specific resolver or object
+        with self._ddl_buffer_lock:
+            self.executed_ddl_count += self._flush_ddl_buffer(self._executed_ddl_buffer, self._held_executed_ddl, True, resolver_name, object_name)
+            self.suggested_ddl_count += self._flush_ddl_buffer(self._suggested_ddl_buffer, self._held_suggested_ddl, False, resolver_name, object_name)
+
+        self._write_queued_ddl()
+
+    def hold_ddl(self, resolver_name):
+        # Statements flushed by resolver are kept aside until release_ddl() is called
+        with self._ddl_buffer_lock:
+            self._held_executed_ddl.setdefault(resolver_name, [])
+            self._held_suggested_ddl.setdefault(resolver_name, [])
+
+    def release_ddl(self, resolver_name):
+        # Held statements are written out, following statements of resolver are written on flush
+        with self._ddl_buffer_lock:
+            self.executed_ddl_count += self._queue_ddl(self._held_executed_ddl.pop(resolver_name, []), True)
+            self.suggested_ddl_count += self._queue_ddl(self._held_suggested_ddl.pop(resolver_name, []), False)
+
+        self._write_queued_ddl()
+
+    def set_ddl_sinks(self, executed_ddl_sink: Optional[SnowDDLStatementSink], suggested_ddl_sink: Optional[SnowDDLStatementSink]):
+        # Statements flushed before sinks were set (e.g. by context) are written first
+        self._write_queued_ddl()
+
+        with self._ddl_write_lock:
+            if executed_ddl_sink:
+                for sql in self.executed_ddl:
+                    executed_ddl_sink.write(sql)
+
+                self.executed_ddl = []
+                self.executed_ddl_sink = executed_ddl_sink
+
+            if suggested_ddl_sink:
+                for sql in self.suggested_ddl:
+                    suggested_ddl_sink.write(sql)
+
+                self.suggested_ddl = []
+                self.suggested_ddl_sink = suggested_ddl_sink
+
+    def close_ddl_sinks(self):
+        self._write_queued_ddl()
+
+        for sink in (self.executed_ddl_sink, self.suggested_ddl_sink):
+            if sink:
+                sink.close()
+
+    def _flush_ddl_buffer(self, buffer, held, is_executed, resolver_name, object_name):
+        flushed_count = 0
+
+        for key in list(buffer):
+            if (resolver_name is not None and key[0] != resolver_name) or (object_name is not None and key[1] != object_name):
+                continue
+
+            if key[0] in held:
+                held[key[0]].extend(buffer.pop(key))
+            else:
+                flushed_count += self._queue_ddl(buffer.pop(key), is_executed)
+
+        return flushed_count
+
+    def _queue_ddl(self, statements, is_executed):
+        if statements:
+            self._ddl_write_queue.append((statements, is_executed))
+
+        return len(statements)
+
+    def _write_queued_ddl(self):
+        # Slow sink (e.g. stdout redirected to pipe) blocks only threads which are writing, not threads which are buffering
+        with self._ddl_write_lock:
+            while self._ddl_write_queue:
+                statements, is_executed = self._ddl_write_queue.popleft()
+
+                target = self.executed_ddl if is_executed else self.suggested_ddl
+                sink = self.executed_ddl_sink if is_executed else self.suggested_ddl_sink
+
+                for sql in statements:
+                    if sink:
+                        sink.write(sql)
+                    else:
+                        target.append(sql)
+
+    def _get_ddl_buffer_key(self):
+        return metrics_tags.get()[0], ddl_object_name.get()
 
     def _execute(self, sql, params, is_meta=False, file_stream=None):
         sql = self.format(sql, params)
+        pipeline = getattr(self._ddl_pipeline, 'current', None)
+
+        if pipeline is not None:
+            if not is_meta and file_stream is None:
+                pipeline.statements.append(sql)
+                return None
+
+            # Preserve order of execution, pending statements are executed first
+            pending_statements = pipeline.statements
+            pipeline.statements = []
+
+            self._ddl_pipeline.current = None
+
+            try:
+                if pipeline.is_async:
+                    for pending_sql in pending_statements:
+                        self._execute(pending_sql, None)
+                else:
+                    self._execute_pipeline(pending_statements)
+            finally:
+                self._ddl_pipeline.current = pipeline
+
+        start = perf_counter()
 
         try:
-            result = self.connection.cursor(DictCursor).execute(sql, file_stream=file_stream)
+            with self._query_slot(sql, is_meta):
+                result = self.connection_pool.run(lambda c: c.cursor(DictCursor).execute(sql, file_stream=file_stream))
         except Error as e:
+            self.record_query_metrics(sql, perf_counter() - start, None, e.sfqid, True)
             raise SnowDDLExecuteError(e, sql)
 
+        self.record_query_metrics(sql, perf_counter() - start, result.rowcount, result.sfqid, False)
+
         if not is_meta:
-            self._executed_ddl_buffer[get_ident()].append(sql)
+            self.record_executed_ddl(sql)
 
         return result
 
+    def _execute_pipeline(self, statements):
+        if not statements:
+            return
+
+        if len(statements) == 1:
+            self._execute(statements[0], None)
+            return
+
+        pipeline_sql = ';\n'.join(statements)
+        start = perf_counter()
+
+        try:
+            with self._query_slot(pipeline_sql, False):
+                cur = self.connection_pool.run(lambda c: c.cursor(DictCursor).execute(pipeline_sql, num_statements=len(statements)))
+        except Error as e:
+            self.record_query_metrics(pipeline_sql, perf_counter() - start, None, e.sfqid, True, len(statements))
+
+            # Execution stops on the first failed statement, but response does not tell which one
+            # Statements are executed again one by one to find it and to keep the list of executed statements accurate
+            for sql in statements:
+                self._execute(sql, None)
+
+            return
+
+        self.record_query_metrics(pipeline_sql, perf_counter() - start, None, cur.sfqid, False, len(statements))
+
+        for sql in statements:
+            self.record_executed_ddl(sql)
+
     def _describe(self, sql, params):
         sql = self.format(sql, params)
 
+        start = perf_counter()
+
         try:
-            result = self.connection.cursor(DictCursor).describe(sql)
+            with self._query_slot(sql, True):
+                cur, result = self.connection_pool.run(lambda c: self._describe_cursor(c, sql))
         except Error as e:
+            self.record_query_metrics(sql, perf_counter() - start, None, e.sfqid, True)
             raise SnowDDLExecuteError(e, sql)
 
+        self.record_query_metrics(sql, perf_counter() - start, len(result) if result else 0, cur.sfqid, False)
+
         return result
 
+    def _describe_cursor(self, connection, sql):
+        cur = connection.cursor(DictCursor)
+
+        return cur, cur.describe(sql)
+
+    def record_query_metrics(self, sql, duration, row_count, query_id, is_error, statement_count=1):
+        if self.metrics is None:
+            return
+
+        self.metrics.record_query(sql, duration, row_count, query_id, is_error, statement_count)
+
+    def record_task_metrics(self, full_name, duration, result):
+        if self.metrics is None:
+            return
+
+        self.metrics.record_task(full_name, duration, result)
+
+    def profile_phase(self, name):
+        if self.profiler is None:
+            return nullcontext()
+
+        return self.profiler.phase(name)
+
+    def profile_task(self, name):
+        if self.profiler is None:
+            return nullcontext()
+
+        return self.profiler.task(name)
+
+    def _query_slot(self, sql, is_meta):
+        if self.concurrency is None:
+            return nullcontext()
+
+        return self.concurrency.slot(sql, is_meta)
+
+    def _is_meta_cache_allowed(self):
+        # Pending statements of pipeline must be executed before metadata is loaded, cache would skip this step
+        return getattr(self._ddl_pipeline, 'current', None) is None
+
     def _suggest(self, sql, params):
         sql = self.format(sql, params)
-        self._suggested_ddl_buffer[get_ident()].append(sql)
+
+        with self._ddl_buffer_lock:
+            self._suggested_ddl_buffer[self._get_ddl_buffer_key()].append(sql)
@@ -1,6 +1,8 @@
 import re
 import string
 
+from functools import lru_cache
+
 from snowddl.blueprint import AbstractIdent
 
 
@@ -9,6 +11,11 @@ class SnowDDLFormatter(string.Formatter):
     safe_decimal_regexp = re.compile(r'^[+-]?[0-9]+(\.[0-9]+)?$')
     safe_float_regexp = re.compile(r'^[+-]?[0-9]+(\.[0-9]+([e|E][+-][0-9]+)?)?$')
 
+    # Simple field names only, attributes, indexes and positional fields are handled by string.Formatter
+    simple_field_name_regexp = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+    compiled_template_cache_size = 4096
+
     def __init__(self):
         self.smart_transformations = {
             's': self.quote,
@@ -30,14 +37,64 @@ class SnowDDLFormatter(string.Formatter):
 
         self.default_transformation = 's'
 
+        # Each template is parsed once, most statements are produced by a few hundred static templates
+        self.compile_template = lru_cache(maxsize=self.compiled_template_cache_size)(self._compile_template)
+
     def format_sql(self, sql, params=None):
         sql = str(sql)
 
         if params:
-            return self.vformat(sql, [], params)
+            ops = self.compile_template(sql)
+
+            if ops is None:
+                return self.vformat(sql, [], params)
+
+            return ''.join([literal_text if field_name is None else transformation(params[field_name]) for literal_text, field_name, transformation in ops])
 
         return sql
 
+    def _compile_template(self, sql):
+        # Template is converted into list of ops: (literal_text, None, None) or (None, field_name, transformation)
+        # None is returned for templates with features not supported by compiled ops, such templates are formatted by vformat
+        ops = []
+
+        for literal_text, field_name, format_spec, conversion in self.parse(sql):
+            if literal_text:
+                ops.append((literal_text, None, None))
+
+            if field_name is None:
+                continue
+
+            if conversion is not None or '{' in format_spec or not self.simple_field_name_regexp.match(field_name):
+                return None
+
+            ops.append((None, field_name, self._compile_transformation(format_spec)))
+
+        return ops
+
+    def _compile_transformation(self, format_spec):
+        if not format_spec:
+            format_spec = self.default_transformation
+
+        if format_spec in self.raw_transformations:
+            return self.raw_transformations[format_spec]
+
+        if format_spec not in self.smart_transformations:
+            # Error is raised on formatting, same as vformat
+            return lambda value: self.format_field(value, format_spec)
+
+        transformation = self.smart_transformations[format_spec]
+
+        def format_smart(value):
+            if isinstance(value, list):
+                if not value:
+                    raise ValueError("Attempt to format an empty list")
+                return ', '.join([transformation(v) for v in value])
+
+            return transformation(value)
+
+        return format_smart
+
     def convert_field(self, value, conversion):
         if conversion is not None:
             raise ValueError("Conversions are disabled for SnowDDLFormatter")
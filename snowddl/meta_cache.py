@@ -0,0 +1,146 @@
+from re import compile
+from threading import Lock
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+statement_kind_re = compile(r'^\s*(\w+)')
+ident_chain_re = compile(r'"((?:[^"]|"")+)"(?:\."(?:[^"]|"")+")*')
+
+
+class SnowDDLCachedResult:
+    # Mimics the part of cursor interface used by resolvers, rows are shared between all results of the same query
+    def __init__(self, rows: List, rowcount: Optional[int], sfqid: Optional[str]):
+        self.rows = rows
+        self.rowcount = rowcount
+        self.sfqid = sfqid
+
+        self._pos = 0
+
+    def __iter__(self):
+        while self._pos < len(self.rows):
+            self._pos += 1
+            yield self.rows[self._pos - 1]
+
+    def fetchone(self):
+        if self._pos >= len(self.rows):
+            return None
+
+        self._pos += 1
+
+        return self.rows[self._pos - 1]
+
+    def fetchall(self):
+        rows = self.rows[self._pos:]
+        self._pos = len(self.rows)
+
+        return rows
+
+
+class SnowDDLMetaCache:
+    # Results of SHOW and DESC commands are reused for the duration of the run
+    # Entry is invalidated by DDL which mentions the same top-level object (database, role, user, warehouse, etc.)
+    # Entries without quoted identifiers (e.g. SHOW ROLES LIKE ...) are invalidated by any DDL
+    # DDL without quoted identifiers invalidates only such entries
+    cached_statement_kinds = ('SHOW', 'DESC', 'DESCRIBE')
+
+    def __init__(self):
+        self.entries: Dict[tuple, Tuple[object, FrozenSet[str]]] = {}
+        self.hit_count = 0
+
+        self._keys_by_name: Dict[str, Set[tuple]] = {}
+        self._unnamed_keys: Set[tuple] = set()
+
+        # Generation is checked when result is stored, DDL executed while query was running makes result outdated
+        # Each name has its own generation, so unrelated DDL does not prevent caching
+        self._epoch = 0
+        self._unnamed_generation = 0
+        self._name_generations: Dict[str, int] = {}
+
+        self._lock = Lock()
+
+    def is_cacheable(self, sql: str):
+        match = statement_kind_re.match(sql)
+
+        return bool(match) and match.group(1).upper() in self.cached_statement_kinds
+
+    def get(self, key: tuple):
+        with self._lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                return None
+
+            self.hit_count += 1
+
+            return entry[0]
+
+    def get_generation(self, sql: str):
+        names = self._get_top_level_names(sql)
+
+        with self._lock:
+            return self._get_generation(names)
+
+    def put(self, key: tuple, sql: str, value, generation):
+        names = self._get_top_level_names(sql)
+
+        with self._lock:
+            # DDL was executed while query was running, result might be outdated already
+            if generation != self._get_generation(names):
+                return
+
+            self._remove_entry(key)
+            self.entries[key] = (value, names)
+
+            if not names:
+                self._unnamed_keys.add(key)
+
+            for name in names:
+                self._keys_by_name.setdefault(name, set()).add(key)
+
+    def invalidate(self, ddl_sql: str):
+        names = self._get_top_level_names(ddl_sql)
+
+        with self._lock:
+            self._unnamed_generation += 1
+            invalidated_keys = self._unnamed_keys
+
+            self._unnamed_keys = set()
+
+            for name in names:
+                self._name_generations[name] = self._name_generations.get(name, 0) + 1
+                invalidated_keys = invalidated_keys | self._keys_by_name.get(name, set())
+
+            for key in invalidated_keys:
+                self._remove_entry(key)
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+
+            self.entries = {}
+            self._keys_by_name = {}
+            self._unnamed_keys = set()
+
+    def _get_generation(self, names):
+        if not names:
+            return self._epoch, self._unnamed_generation
+
+        return self._epoch, tuple(self._name_generations.get(name, 0) for name in sorted(names))
+
+    def _remove_entry(self, key):
+        entry = self.entries.pop(key, None)
+
+        if entry is None:
+            return
+
+        if not entry[1]:
+            self._unnamed_keys.discard(key)
+
+        for name in entry[1]:
+            keys = self._keys_by_name[name]
+            keys.discard(key)
+
+            if not keys:
+                del self._keys_by_name[name]
+
+    def _get_top_level_names(self, sql: str):
+        return frozenset(m.group(1) for m in ident_chain_re.finditer(sql))
@@ -0,0 +1,169 @@
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from snowddl.engine import SnowDDLEngine
+
+
+class SnowDDLMetadataSnapshot:
+    # SHOW commands return a limited number of rows
+    # If this limit is reached, objects are loaded for each schema individually
+    show_row_limit = 10000
+
+    def __init__(self, engine: "SnowDDLEngine"):
+        self.engine = engine
+
+        self._rows: Dict[tuple, Optional[Dict]] = {}
+        self._locks: Dict[tuple, Lock] = defaultdict(Lock)
+        self._locks_lock = Lock()
+
+    def show_in_schema(self, object_type_plural: str, schema: dict, schema_column='schema_name') -> List[Dict]:
+        key = (object_type_plural, schema['database'], schema_column)
+
+        with self._get_lock(key):
+            if key not in self._rows:
+                self._rows[key] = self._load_database(object_type_plural, schema['database'], schema_column)
+
+        rows_by_schema = self._rows[key]
+
+        # Database was too large for a single SHOW command
+        if rows_by_schema is None:
+            return self._load_schema(object_type_plural, schema)
+
+        return rows_by_schema.get(schema['schema'], [])
+
+    def desc_table(self, database: str, schema: str, name: str) -> Optional[List[Dict]]:
+        # Columns of all tables in database are loaded by a single query
+        # Rows have the same shape as DESC TABLE output, table is None if it was not found
+        # Table is also None if virtual columns in its schema could not be detected, DESC TABLE must be used instead
+        key = ("COLUMNS", database, None)
+
+        with self._get_lock(key):
+            if key not in self._rows:
+                self._rows[key] = self._load_database_columns(database)
+
+        return self._rows[key].get((schema, name))
+
+    def _load_database(self, object_type_plural, database, schema_column):
+        rows_by_schema = defaultdict(list)
+
+        cur = self.engine.execute_meta("SHOW {object_type_plural:r} IN DATABASE {database:i}", {
+            "object_type_plural": object_type_plural,
+            "database": database,
+        })
+
+        if cur.rowcount is not None and cur.rowcount >= self.show_row_limit:
+            return None
+
+        for r in cur:
+            rows_by_schema[r[schema_column]].append(r)
+
+        return rows_by_schema
+
+    def _load_schema(self, object_type_plural, schema):
+        cur = self.engine.execute_meta("SHOW {object_type_plural:r} IN SCHEMA {database:i}.{schema:i}", {
+            "object_type_plural": object_type_plural,
+            "database": schema['database'],
+            "schema": schema['schema'],
+        })
+
+        return cur.fetchall()
+
+    def _load_database_columns(self, database):
+        columns_by_table = defaultdict(list)
+
+        cur = self.engine.execute_meta("""
+            SELECT table_schema
+                , table_name
+                , column_name
+                , data_type
+                , character_maximum_length
+                , numeric_precision
+                , numeric_scale
+                , datetime_precision
+                , collation_name
+                , is_nullable
+                , column_default
+                , comment
+            FROM {database:i}.information_schema.columns
+            WHERE table_schema != 'INFORMATION_SCHEMA'
+            ORDER BY table_schema, table_name, ordinal_position
+        """, {
+            "database": database,
+        })
+
+        rows = cur.fetchall()
+        expressions, unknown_schemas = self._load_database_column_expressions(database, sorted({r['TABLE_SCHEMA'] for r in rows}))
+
+        for r in rows:
+            if r['TABLE_SCHEMA'] in unknown_schemas:
+                continue
+
+            columns_by_table[(r['TABLE_SCHEMA'], r['TABLE_NAME'])].append({
+                "name": r['COLUMN_NAME'],
+                "type": f"{self._build_column_type(r)} COLLATE '{r['COLLATION_NAME']}'" if r['COLLATION_NAME'] else self._build_column_type(r),
+                "null?": 'Y' if r['IS_NULLABLE'] == 'YES' else 'N',
+                "default": r['COLUMN_DEFAULT'],
+                "expression": expressions.get((r['TABLE_SCHEMA'], r['TABLE_NAME'], r['COLUMN_NAME'])),
+                "comment": r['COMMENT'],
+            })
+
+        return columns_by_table
+
+    def _load_database_column_expressions(self, database, schemas):
+        # Expressions of virtual columns are not available in INFORMATION_SCHEMA, but SHOW COLUMNS returns them
+        # Output of SHOW COLUMNS is limited, expressions are loaded for each schema individually if this limit is reached
+        # Expressions are unknown only for schemas which reach this limit on their own
+        cur = self.engine.execute_meta("SHOW COLUMNS IN DATABASE {database:i}", {
+            "database": database,
+        })
+
+        if cur.rowcount is None or cur.rowcount < self.show_row_limit:
+            return self._build_column_expressions(cur), set()
+
+        expressions = {}
+        unknown_schemas = set()
+
+        for schema in schemas:
+            cur = self.engine.execute_meta("SHOW COLUMNS IN SCHEMA {database:i}.{schema:i}", {
+                "database": database,
+                "schema": schema,
+            })
+
+            if cur.rowcount is not None and cur.rowcount >= self.show_row_limit:
+                unknown_schemas.add(schema)
+                continue
+
+            expressions.update(self._build_column_expressions(cur))
+
+        return expressions, unknown_schemas
+
+    def _build_column_expressions(self, cur):
+        expressions = {}
+
+        for r in cur:
+            if r['expression']:
+                expressions[(r['schema_name'], r['table_name'], r['column_name'])] = r['expression']
+
+        return expressions
+
+    def _build_column_type(self, r):
+        # Convert to data type string used by DESC TABLE
+        if r['DATA_TYPE'] == 'TEXT':
+            return f"VARCHAR({r['CHARACTER_MAXIMUM_LENGTH']})"
+
+        if r['DATA_TYPE'] == 'BINARY':
+            return f"BINARY({r['CHARACTER_MAXIMUM_LENGTH']})"
+
+        if r['DATA_TYPE'] == 'NUMBER':
+            return f"NUMBER({r['NUMERIC_PRECISION']},{r['NUMERIC_SCALE']})"
+
+        if r['DATA_TYPE'] in ('TIME', 'TIMESTAMP_LTZ', 'TIMESTAMP_NTZ', 'TIMESTAMP_TZ'):
+            return f"{r['DATA_TYPE']}({r['DATETIME_PRECISION']})"
+
+        return r['DATA_TYPE']
+
+    def _get_lock(self, key):
+        with self._locks_lock:
+            return self._locks[key]
@@ -0,0 +1,174 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from json import dumps
+from math import ceil
+from os import replace
+from pathlib import Path
+from re import compile
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import time
+from typing import Dict, List, Optional, Tuple
+
+statement_kind_re = compile(r'^\s*(\w+)')
+
+# Resolver class name and object type name of current task
+metrics_tags = ContextVar('metrics_tags', default=('', ''))
+
+
+class SnowDDLContextThreadPoolExecutor(ThreadPoolExecutor):
+    # Tasks inherit context variables (e.g. metrics tags) of the thread which submitted them
+    def submit(self, fn, *args, **kwargs):
+        return super().submit(copy_context().run, fn, *args, **kwargs)
+
+
+class SnowDDLMetrics:
+    # Collects timing of individual queries and resolver tasks
+    # Percentiles are calculated per category at the end of the run
+    percentiles = (0.5, 0.95, 0.99)
+
+    def __init__(self):
+        self.queries: List[Dict] = []
+        self.tasks: List[Dict] = []
+
+        self.started_at = time()
+        self._lock = Lock()
+
+    def record_query(self, sql: str, duration: float, row_count: Optional[int], query_id: Optional[str], is_error: bool, statement_count=1):
+        resolver_name, object_type = metrics_tags.get()
+
+        with self._lock:
+            self.queries.append({
+                "resolver": resolver_name,
+                "object_type": object_type,
+                "kind": self.get_statement_kind(sql),
+                "query_id": query_id,
+                "duration": duration,
+                "row_count": row_count,
+                "statement_count": statement_count,
+                "is_error": is_error,
+            })
+
+    def record_task(self, full_name: str, duration: float, result: str):
+        resolver_name, object_type = metrics_tags.get()
+
+        with self._lock:
+            self.tasks.append({
+                "resolver": resolver_name,
+                "object_type": object_type,
+                "full_name": full_name,
+                "duration": duration,
+                "result": result,
+            })
+
+    def get_statement_kind(self, sql: str):
+        match = statement_kind_re.match(sql)
+
+        if not match:
+            return 'OTHER'
+
+        kind = match.group(1).upper()
+
+        if kind == 'DESCRIBE':
+            return 'DESC'
+
+        return kind
+
+    def build_report(self):
+        with self._lock:
+            queries = list(self.queries)
+            tasks = list(self.tasks)
+
+        return {
+            "duration": time() - self.started_at,
+            "queries_by_kind": self._summarize(queries, ('kind',)),
+            "queries_by_resolver": self._summarize(queries, ('resolver', 'object_type')),
+            "tasks_by_resolver": self._summarize(tasks, ('resolver', 'object_type')),
+            "queries": queries,
+            "tasks": tasks,
+        }
+
+    def write_json(self, path: Path):
+        self._write_atomic(path, dumps(self.build_report(), indent=2))
+
+    def write_prometheus(self, path: Path):
+        report = self.build_report()
+        lines = []
+
+        self._add_prometheus_summary(lines, "snowddl_query_duration_seconds", "Duration of queries", report['queries_by_kind'], ('kind',))
+        self._add_prometheus_summary(lines, "snowddl_resolver_query_duration_seconds", "Duration of queries by resolver", report['queries_by_resolver'], ('resolver', 'object_type'))
+        self._add_prometheus_summary(lines, "snowddl_task_duration_seconds", "Duration of resolver tasks", report['tasks_by_resolver'], ('resolver', 'object_type'))
+
+        self._add_prometheus_counter(lines, "snowddl_query_rows_total", "Rows returned by queries", report['queries_by_kind'], ('kind',), 'row_count')
+        self._add_prometheus_counter(lines, "snowddl_query_errors_total", "Failed queries", report['queries_by_kind'], ('kind',), 'error_count')
+        self._add_prometheus_counter(lines, "snowddl_task_errors_total", "Failed resolver tasks", report['tasks_by_resolver'], ('resolver', 'object_type'), 'error_count')
+
+        lines.append("# HELP snowddl_run_duration_seconds Duration of the run")
+        lines.append("# TYPE snowddl_run_duration_seconds gauge")
+        lines.append(f"snowddl_run_duration_seconds {report['duration']:.6f}")
+
+        self._write_atomic(path, '\n'.join(lines) + '\n')
+
+    def _summarize(self, records: List[Dict], tag_names: Tuple[str, ...]):
+        groups = defaultdict(list)
+
+        for r in records:
+            groups[tuple(r[t] for t in tag_names)].append(r)
+
+        summary = []
+
+        for tags, group_records in sorted(groups.items()):
+            durations = sorted(r['duration'] for r in group_records)
+
+            item = dict(zip(tag_names, tags))
+            item.update({
+                "count": len(group_records),
+                "error_count": sum(1 for r in group_records if r.get('is_error') or r.get('result') == 'ERROR'),
+                "row_count": sum(r.get('row_count') or 0 for r in group_records),
+                "sum": sum(durations),
+            })
+
+            for p in self.percentiles:
+                item[f"p{int(p * 100)}"] = self._percentile(durations, p)
+
+            summary.append(item)
+
+        return summary
+
+    def _percentile(self, sorted_values: List[float], p: float):
+        # Nearest-rank method
+        return sorted_values[max(ceil(p * len(sorted_values)) - 1, 0)]
+
+    def _add_prometheus_summary(self, lines: List[str], name: str, help_text: str, summary: List[Dict], tag_names: Tuple[str, ...]):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} summary")
+
+        for item in summary:
+            labels = self._format_labels(item, tag_names)
+
+            for p in self.percentiles:
+                lines.append(f"{name}{{{labels},quantile=\"{p}\"}} {item[f'p{int(p * 100)}']:.6f}")
+
+            lines.append(f"{name}_sum{{{labels}}} {item['sum']:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {item['count']}")
+
+    def _add_prometheus_counter(self, lines: List[str], name: str, help_text: str, summary: List[Dict], tag_names: Tuple[str, ...], key: str):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+
+        for item in summary:
+            lines.append(f"{name}{{{self._format_labels(item, tag_names)}}} {item[key]}")
+
+    def _format_labels(self, item: Dict, tag_names: Tuple[str, ...]):
+        return ','.join(f"{t}=\"{self._escape_label(item[t])}\"" for t in tag_names)
+
+    def _escape_label(self, value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def _write_atomic(self, path: Path, data: str):
+        # Textfile collector may read file at any moment, it should never observe incomplete file
+        with NamedTemporaryFile('w', encoding='utf-8', dir=path.parent, suffix='.tmp', delete=False) as f:
+            f.write(data)
+
+        replace(f.name, path)
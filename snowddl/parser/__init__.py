@@ -1,3 +1,4 @@
+from ._parse_cache import ParseCache
 from ._parsed_file import ParsedFile
 from .account_params import AccountParameterParser
 from .business_role import BusinessRoleParser
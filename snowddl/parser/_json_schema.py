@@ -0,0 +1,45 @@
+from importlib import import_module
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from typing import Dict, Optional
+
+
+# Schemas are module-level constants, each schema is identified by "module:name" of constant, key is passed by parser explicitly
+# Key is the same in all processes, so worker processes receive key instead of schema
+# Each schema is loaded, checked and compiled only once per key
+_json_schemas: Dict[str, dict] = {}
+_validators: Dict[str, object] = {}
+
+
+def load_json_schema(json_schema_key: str) -> dict:
+    if json_schema_key not in _json_schemas:
+        module_name, name = json_schema_key.split(':')
+        _json_schemas[json_schema_key] = getattr(import_module(module_name), name)
+
+    return _json_schemas[json_schema_key]
+
+
+def get_json_schema_validator(json_schema: dict, json_schema_key: Optional[str] = None):
+    # Schema without key (e.g. created dynamically) is compiled every time
+    if json_schema_key is None:
+        return _compile_validator(json_schema)
+
+    if json_schema_key not in _validators:
+        _validators[json_schema_key] = _compile_validator(json_schema)
+
+    return _validators[json_schema_key]
+
+
+def validate_json_schema(params: dict, json_schema: dict, json_schema_key: Optional[str] = None):
+    # Raise the same error as jsonschema.validate()
+    error = best_match(get_json_schema_validator(json_schema, json_schema_key).iter_errors(params))
+
+    if error is not None:
+        raise error
+
+
+def _compile_validator(json_schema: dict):
+    validator_cls = validator_for(json_schema)
+    validator_cls.check_schema(json_schema)
+
+    return validator_cls(json_schema)
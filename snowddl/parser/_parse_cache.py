@@ -0,0 +1,117 @@
+from hashlib import sha256
+from json import dumps, loads
+from os import replace, utime
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import time
+from typing import Dict, Optional
+
+from snowddl.version import __version__
+
+
+class ParseCache:
+    # Entries which were not used for this number of seconds are evicted
+    max_age = 7 * 24 * 3600
+
+    def __init__(self, cache_path: Path, placeholders: Dict, is_trusted=False):
+        self.cache_path = cache_path
+        self.is_trusted = is_trusted
+        self.cache_path.mkdir(mode=0o755, parents=True, exist_ok=True)
+
+        self.placeholders_hash = self._hash_json(placeholders)
+        self.schema_hashes: Dict[str, str] = {}
+
+        self.hit_count = 0
+        self.miss_count = 0
+
+        self._lock = Lock()
+
+    def __getstate__(self):
+        # Cache is sent to worker processes, lock cannot be pickled
+        state = self.__dict__.copy()
+        del state['_lock']
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def build_key(self, content: bytes, json_schema: dict, json_schema_key: Optional[str] = None):
+        key = sha256()
+
+        key.update(__version__.encode('utf-8'))
+        key.update(self._get_schema_hash(json_schema, json_schema_key).encode('utf-8'))
+        key.update(self.placeholders_hash.encode('utf-8'))
+        key.update(content)
+
+        return key.hexdigest()
+
+    def get(self, key) -> Optional[Dict]:
+        entry_path = self._get_entry_path(key)
+
+        try:
+            params = loads(entry_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.count(False)
+            return None
+
+        # Refresh access time, so entry is not evicted while it is still in use
+        utime(entry_path)
+        self.count(True)
+
+        return params
+
+    def count(self, is_hit: bool):
+        with self._lock:
+            if is_hit:
+                self.hit_count += 1
+            else:
+                self.miss_count += 1
+
+    def put(self, key, params: Dict):
+        # Params which do not survive JSON round trip (e.g. dates, non-string keys) are not cached
+        # Keys are not sorted, order of columns and other mappings must be preserved
+        try:
+            data = dumps(params)
+        except (TypeError, ValueError):
+            return
+
+        if loads(data) != params:
+            return
+
+        entry_path = self._get_entry_path(key)
+        entry_path.parent.mkdir(mode=0o755, exist_ok=True)
+
+        # Write to temporary file and rename it, so concurrent readers never observe incomplete entry
+        with NamedTemporaryFile('w', encoding='utf-8', dir=entry_path.parent, suffix='.tmp', delete=False) as f:
+            f.write(data)
+
+        replace(f.name, entry_path)
+
+    def evict_stale(self):
+        min_mtime = time() - self.max_age
+
+        for entry_path in self.cache_path.glob('*/*.json'):
+            try:
+                if entry_path.stat().st_mtime < min_mtime:
+                    entry_path.unlink()
+            except OSError:
+                pass
+
+    def _get_entry_path(self, key) -> Path:
+        return self.cache_path / key[:2] / f"{key}.json"
+
+    def _get_schema_hash(self, json_schema: dict, json_schema_key: Optional[str]):
+        # Hash is calculated only once per schema key, schema without key is hashed every time
+        if json_schema_key is None:
+            return self._hash_json(json_schema)
+
+        if json_schema_key not in self.schema_hashes:
+            self.schema_hashes[json_schema_key] = self._hash_json(json_schema)
+
+        return self.schema_hashes[json_schema_key]
+
+    def _hash_json(self, data):
+        return sha256(dumps(data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
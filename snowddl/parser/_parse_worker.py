@@ -0,0 +1,51 @@
+from pathlib import Path
+from pickle import dumps, PicklingError
+from typing import Dict, Optional, Union, TYPE_CHECKING
+
+from snowddl.config import SnowDDLConfig
+from snowddl.parser._json_schema import load_json_schema
+from snowddl.parser._parse_cache import ParseCache
+from snowddl.parser._parsed_file import ParsedFile
+
+if TYPE_CHECKING:
+    from snowddl.parser.abc_parser import AbstractParser
+
+
+# Parser used by worker process to load params of config files
+# Worker does not create any blueprints, only parent process has access to complete config
+_worker_parser: Optional["AbstractParser"] = None
+
+
+def init_parse_worker(base_path: Path, env_prefix: str, placeholders: Dict[str,Union[bool,float,int,str]], parse_cache: Optional[ParseCache]):
+    from snowddl.parser.placeholder import PlaceholderParser
+
+    global _worker_parser
+
+    config = SnowDDLConfig()
+    config.env_prefix = env_prefix
+    config.parse_cache = parse_cache
+
+    for name, value in placeholders.items():
+        config.add_placeholder(name, value)
+
+    _worker_parser = PlaceholderParser(config, base_path)
+
+
+def parse_file_params(path: Path, json_schema_key: str):
+    # Exceptions are returned instead of being raised, so one broken file does not stop processing of other files
+    try:
+        file = ParsedFile(_worker_parser, path, load_json_schema(json_schema_key), json_schema_key=json_schema_key)
+    except Exception as e:
+        return None, False, _picklable_exception(e)
+
+    return file.params, file.is_cached, None
+
+
+def _picklable_exception(e: Exception):
+    # Some exceptions (e.g. jsonschema ValidationError) cannot be sent back to parent process as is
+    try:
+        dumps(e)
+    except (PicklingError, AttributeError, TypeError):
+        return ValueError(f"{e.__class__.__name__}: {e}")
+
+    return e
@@ -1,9 +1,10 @@
-from jsonschema import validate
 from pathlib import Path
 from re import compile, IGNORECASE
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 from yaml import safe_load
 
+from snowddl.parser._json_schema import validate_json_schema
+
 if TYPE_CHECKING:
     from snowddl.parser.abc_parser import AbstractParser
 
@@ -12,21 +13,30 @@ class ParsedFile:
     placeholder_end = ' }}'
     placeholder_re = compile(r'\${{\s([a-z0-9._-]+)\s}}', IGNORECASE)
 
-    def __init__(self, parser: "AbstractParser", path: Path, json_schema: dict):
+    def __init__(self, parser: "AbstractParser", path: Path, json_schema: dict, params: Optional[dict] = None, json_schema_key: Optional[str] = None):
         self.parser = parser
 
         self.path = path
         self.name = path.stem
         self.json_schema = json_schema
+        self.json_schema_key = json_schema_key
 
         self.database = None
         self.schema = None
+        self.is_cached = False
 
         self._guess_database_schema_from_path()
-        self._load_params()
 
-        self._apply_placeholders(self.params)
-        self._validate_json_schema()
+        if params is not None:
+            # Params were loaded and validated by parse worker process
+            self.params = params
+        elif self.parser.config.parse_cache:
+            self._load_params_with_cache()
+        else:
+            self._load_params()
+
+            self._apply_placeholders(self.params)
+            self._validate_json_schema()
 
     def _guess_database_schema_from_path(self):
         try:
@@ -44,6 +54,30 @@ class ParsedFile:
         with self.path.open('r', encoding='utf-8') as f:
             self.params = safe_load(f) or {}
 
+    def _load_params_with_cache(self):
+        parse_cache = self.parser.config.parse_cache
+
+        content = self.path.read_bytes()
+        cache_key = parse_cache.build_key(content, self.json_schema, self.json_schema_key)
+
+        params = parse_cache.get(cache_key)
+
+        if params is None:
+            self.params = safe_load(content.decode('utf-8')) or {}
+
+            self._apply_placeholders(self.params)
+            self._validate_json_schema()
+
+            parse_cache.put(cache_key, self.params)
+        else:
+            # Cached params had placeholders applied before they were stored
+            # Validation is skipped only if cache directory is trusted not to be modified externally
+            self.params = params
+            self.is_cached = True
+
+            if not parse_cache.is_trusted:
+                self._validate_json_schema()
+
     def _apply_placeholders(self, data: dict):
         for k, v in data.items():
             if isinstance(v, dict):
@@ -67,4 +101,4 @@ class ParsedFile:
         return val
 
     def _validate_json_schema(self):
-        validate(self.params, self.json_schema)
+        validate_json_schema(self.params, self.json_schema, self.json_schema_key)
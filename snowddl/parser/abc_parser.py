@@ -1,44 +1,84 @@
 from abc import ABC, abstractmethod
+from itertools import repeat
 from pathlib import Path
 from typing import Callable, Dict, List, Union
 
 from snowddl.config import SnowDDLConfig
 from snowddl.blueprint import NameWithType
 from snowddl.parser._parsed_file import ParsedFile
+from snowddl.parser._parse_worker import parse_file_params
 
 
 class AbstractParser(ABC):
+    # Parser looks up blueprints created by other parsers, it must run after all other parsers are finished
+    is_dependent_on_blueprints = False
+
     def __init__(self, config: SnowDDLConfig, base_path: Path):
         self.config = config
         self.base_path = base_path
 
         self.env_prefix = config.env_prefix
 
+        # Results of worker processes which were not applied yet, see apply_worker_results()
+        self._pending_worker_results = []
+
     @abstractmethod
     def load_blueprints(self):
         pass
 
-    def parse_single_file(self, path: Path, json_schema: dict, callback: Callable[[ParsedFile],Union[None,Dict]] = None):
+    def parse_single_file(self, path: Path, json_schema: dict, json_schema_key: str, callback: Callable[[ParsedFile],Union[None,Dict]] = None):
         if not callback:
             callback = lambda f: f.params
 
         if path.exists():
             try:
-                file = ParsedFile(self, path, json_schema)
+                file = ParsedFile(self, path, json_schema, json_schema_key=json_schema_key)
                 return callback(file)
             except Exception as e:
                 self.config.add_error(path, e)
 
         return {}
 
-    def parse_schema_object_files(self, object_type: str, json_schema: dict, callback: Callable[[ParsedFile],None]):
+    def parse_schema_object_files(self, object_type: str, json_schema: dict, json_schema_key: str, callback: Callable[[ParsedFile],None]):
+        # Worker processes load schema by key
+        if self.config.parse_executor:
+            self._parse_schema_object_files_in_workers(object_type, json_schema, json_schema_key, callback)
+            return
+
         for path in self.base_path.glob(f"*/*/{object_type}/*.yaml"):
             try:
-                file = ParsedFile(self, path, json_schema)
+                file = ParsedFile(self, path, json_schema, json_schema_key=json_schema_key)
                 callback(file)
             except Exception as e:
                 self.config.add_error(path, e)
 
+    def apply_worker_results(self):
+        # Blueprints are created by callbacks in parent process, in the same order as files were submitted
+        for paths, json_schema, json_schema_key, results, callback in self._pending_worker_results:
+            for path, (params, is_cached, error) in zip(paths, results):
+                if self.config.parse_cache:
+                    self.config.parse_cache.count(is_cached)
+
+                if error:
+                    self.config.add_error(path, error)
+                    continue
+
+                try:
+                    file = ParsedFile(self, path, json_schema, params, json_schema_key)
+                    callback(file)
+                except Exception as e:
+                    self.config.add_error(path, e)
+
+        self._pending_worker_results = []
+
+    def _parse_schema_object_files_in_workers(self, object_type: str, json_schema: dict, json_schema_key: str, callback: Callable[[ParsedFile],None]):
+        paths = list(self.base_path.glob(f"*/*/{object_type}/*.yaml"))
+
+        # All files are submitted to worker processes at once, results are applied later by apply_worker_results()
+        results = self.config.parse_executor.map(parse_file_params, paths, repeat(json_schema_key), chunksize=16)
+
+        self._pending_worker_results.append((paths, json_schema, json_schema_key, results, callback))
+
     def normalise_params_dict(self, params):
         if params is None:
             return None
@@ -58,8 +58,10 @@ business_role_json_schema = {
 
 
 class BusinessRoleParser(AbstractParser):
+    is_dependent_on_blueprints = True
+
     def load_blueprints(self):
-        self.parse_single_file(self.base_path / 'business_role.yaml', business_role_json_schema, self.process_business_role)
+        self.parse_single_file(self.base_path / 'business_role.yaml', business_role_json_schema, "snowddl.parser.business_role:business_role_json_schema", self.process_business_role)
 
     def process_business_role(self, file: ParsedFile):
         for business_role_name, business_role in file.params.items():
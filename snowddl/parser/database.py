@@ -28,7 +28,7 @@ class DatabaseParser(AbstractParser):
             if not database_path.is_dir():
                 continue
 
-            params = self.parse_single_file(database_path / 'params.yaml', database_json_schema)
+            params = self.parse_single_file(database_path / 'params.yaml', database_json_schema, "snowddl.parser.database:database_json_schema")
 
             bp = DatabaseBlueprint(
                 full_name=DatabaseIdent(self.env_prefix, database_path.name),
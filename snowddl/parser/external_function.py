@@ -65,7 +65,7 @@ external_function_json_schema = {
 
 class ExternalFunctionParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("external_function", external_function_json_schema, self.process_function)
+        self.parse_schema_object_files("external_function", external_function_json_schema, "snowddl.parser.external_function:external_function_json_schema", self.process_function)
 
     def process_function(self, f: ParsedFile):
         arguments = [NameWithType(name=Ident(k), type=DataType(t)) for k, t in f.params.get('arguments', {}).items()]
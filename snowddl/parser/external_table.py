@@ -129,7 +129,7 @@ external_table_json_schema = table_json_schema = {
 
 class ExternalTableParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files('external_table', external_table_json_schema, self.process_external_table)
+        self.parse_schema_object_files('external_table', external_table_json_schema, "snowddl.parser.external_table:external_table_json_schema", self.process_external_table)
 
     def process_external_table(self, f: ParsedFile):
         column_blueprints = []
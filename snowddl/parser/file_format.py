@@ -25,7 +25,7 @@ file_format_json_schema = {
 
 class FileFormatParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("file_format", file_format_json_schema, self.process_file_format)
+        self.parse_schema_object_files("file_format", file_format_json_schema, "snowddl.parser.file_format:file_format_json_schema", self.process_file_format)
 
     def process_file_format(self, f: ParsedFile):
         bp = FileFormatBlueprint(
@@ -87,7 +87,7 @@ function_json_schema = {
 
 class FunctionParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("function", function_json_schema, self.process_function)
+        self.parse_schema_object_files("function", function_json_schema, "snowddl.parser.function:function_json_schema", self.process_function)
 
     def process_function(self, f: ParsedFile):
         arguments = [NameWithType(name=Ident(k), type=DataType(t)) for k, t in f.params.get('arguments', {}).items()]
@@ -21,7 +21,7 @@ inbound_share_json_schema = {
 
 class InboundShareParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_single_file(self.base_path / 'inbound_share.yaml', inbound_share_json_schema, self.process_inbound_share)
+        self.parse_single_file(self.base_path / 'inbound_share.yaml', inbound_share_json_schema, "snowddl.parser.inbound_share:inbound_share_json_schema", self.process_inbound_share)
 
     def process_inbound_share(self, f: ParsedFile):
         for database_name, share in f.params.items():
@@ -52,7 +52,7 @@ masking_policy_json_schema = {
 
 class MaskingPolicyParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("masking_policy", masking_policy_json_schema, self.process_masking_policy)
+        self.parse_schema_object_files("masking_policy", masking_policy_json_schema, "snowddl.parser.masking_policy:masking_policy_json_schema", self.process_masking_policy)
 
     def process_masking_policy(self, f: ParsedFile):
         arguments = [NameWithType(name=Ident(k), type=DataType(t)) for k, t in f.params.get('arguments', {}).items()]
@@ -35,7 +35,7 @@ materialized_view_json_schema = {
 
 class MaterializedViewParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("materialized_view", materialized_view_json_schema, self.process_materialized_view)
+        self.parse_schema_object_files("materialized_view", materialized_view_json_schema, "snowddl.parser.materialized_view:materialized_view_json_schema", self.process_materialized_view)
 
     def process_materialized_view(self, f: ParsedFile):
         column_blueprints = []
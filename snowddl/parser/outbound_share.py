@@ -36,8 +36,10 @@ outbound_share_json_schema = {
 
 
 class OutboundShareParser(AbstractParser):
+    is_dependent_on_blueprints = True
+
     def load_blueprints(self):
-        self.parse_single_file(self.base_path / 'outbound_share.yaml', outbound_share_json_schema, self.process_inbound_share)
+        self.parse_single_file(self.base_path / 'outbound_share.yaml', outbound_share_json_schema, "snowddl.parser.outbound_share:outbound_share_json_schema", self.process_inbound_share)
 
     def process_inbound_share(self, f: ParsedFile):
         for share_name, share in f.params.items():
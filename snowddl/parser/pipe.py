@@ -59,7 +59,7 @@ pipe_json_schema = {
 
 class PipeParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("pipe", pipe_json_schema, self.process_pipe)
+        self.parse_schema_object_files("pipe", pipe_json_schema, "snowddl.parser.pipe:pipe_json_schema", self.process_pipe)
 
     def process_pipe(self, f: ParsedFile):
         copy = f.params['copy']
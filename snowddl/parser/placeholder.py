@@ -24,11 +24,11 @@ class PlaceholderParser(AbstractParser):
         }
 
         # 2) Merge with placeholders from normal config file
-        placeholders.update(self.normalise_params_dict(self.parse_single_file(self.base_path / 'placeholder.yaml', placeholder_json_schema)))
+        placeholders.update(self.normalise_params_dict(self.parse_single_file(self.base_path / 'placeholder.yaml', placeholder_json_schema, "snowddl.parser.placeholder:placeholder_json_schema")))
 
         # 3) Merge with placeholders from override config file
         if placeholder_path:
-            placeholders.update(self.normalise_params_dict(self.parse_single_file(placeholder_path, placeholder_json_schema)))
+            placeholders.update(self.normalise_params_dict(self.parse_single_file(placeholder_path, placeholder_json_schema, "snowddl.parser.placeholder:placeholder_json_schema")))
 
         # 4) Merge with explicit placeholder values
         if placeholder_values:
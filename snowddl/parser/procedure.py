@@ -84,7 +84,7 @@ procedure_json_schema = {
 
 class ProcedureParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("procedure", procedure_json_schema, self.process_procedure)
+        self.parse_schema_object_files("procedure", procedure_json_schema, "snowddl.parser.procedure:procedure_json_schema", self.process_procedure)
 
     def process_procedure(self, f: ParsedFile):
         arguments = [NameWithType(name=Ident(k), type=DataType(t)) for k, t in f.params.get('arguments', {}).items()]
@@ -49,7 +49,7 @@ row_access_policy_json_schema = {
 
 class RowAccessPolicyParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("row_access_policy", row_access_policy_json_schema, self.process_row_access_policy)
+        self.parse_schema_object_files("row_access_policy", row_access_policy_json_schema, "snowddl.parser.row_access_policy:row_access_policy_json_schema", self.process_row_access_policy)
 
     def process_row_access_policy(self, f: ParsedFile):
         arguments = [NameWithType(name=Ident(k), type=DataType(t)) for k, t in f.params.get('arguments', {}).items()]
@@ -41,13 +41,13 @@ class SchemaParser(AbstractParser):
             if not database_path.is_dir():
                 continue
 
-            database_params = self.parse_single_file(database_path / 'params.yaml', database_json_schema)
+            database_params = self.parse_single_file(database_path / 'params.yaml', database_json_schema, "snowddl.parser.database:database_json_schema")
 
             for schema_path in database_path.iterdir():
                 if not schema_path.is_dir():
                     continue
 
-                schema_params = self.parse_single_file(schema_path / 'params.yaml', schema_json_schema)
+                schema_params = self.parse_single_file(schema_path / 'params.yaml', schema_json_schema, "snowddl.parser.schema:schema_json_schema")
 
                 combined_params = {
                     "is_transient": database_params.get('is_transient', False) or schema_params.get('is_transient', False),
@@ -21,7 +21,7 @@ sequence_json_schema = {
 
 class SequenceParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("sequence", sequence_json_schema, self.process_sequence)
+        self.parse_schema_object_files("sequence", sequence_json_schema, "snowddl.parser.sequence:sequence_json_schema", self.process_sequence)
 
     def process_sequence(self, f: ParsedFile):
         bp = SequenceBlueprint(
@@ -42,7 +42,7 @@ stage_json_schema = {
 
 class StageParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("stage", stage_json_schema, self.process_stage)
+        self.parse_schema_object_files("stage", stage_json_schema, "snowddl.parser.stage:stage_json_schema", self.process_stage)
 
     def process_stage(self, f: ParsedFile):
         stage_files_dir = (f.path.parent / f.name)
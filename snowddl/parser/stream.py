@@ -31,7 +31,7 @@ stream_json_schema = {
 
 class StreamParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("stream", stream_json_schema, self.process_stream)
+        self.parse_schema_object_files("stream", stream_json_schema, "snowddl.parser.stream:stream_json_schema", self.process_stream)
 
     def process_stream(self, f: ParsedFile):
         bp = StreamBlueprint(
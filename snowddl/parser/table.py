@@ -127,14 +127,14 @@ class TableParser(AbstractParser):
             if not database_path.is_dir():
                 continue
 
-            database_params = self.parse_single_file(database_path / 'params.yaml', database_json_schema)
+            database_params = self.parse_single_file(database_path / 'params.yaml', database_json_schema, "snowddl.parser.database:database_json_schema")
             combined_params[database_path.name] = {}
 
             for schema_path in database_path.iterdir():
                 if not schema_path.is_dir():
                     continue
 
-                schema_params = self.parse_single_file(schema_path / 'params.yaml', schema_json_schema)
+                schema_params = self.parse_single_file(schema_path / 'params.yaml', schema_json_schema, "snowddl.parser.schema:schema_json_schema")
 
                 combined_params[database_path.name][schema_path.name] = {
                     "is_transient": database_params.get('is_transient', False) or schema_params.get('is_transient', False),
@@ -144,7 +144,7 @@ class TableParser(AbstractParser):
         return combined_params
 
     def load_blueprints(self):
-        self.parse_schema_object_files('table', table_json_schema, self.process_table)
+        self.parse_schema_object_files('table', table_json_schema, "snowddl.parser.table:table_json_schema", self.process_table)
 
     def process_table(self, f: ParsedFile):
         column_blueprints = []
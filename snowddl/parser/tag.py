@@ -38,7 +38,7 @@ tag_json_schema = {
 
 class TagParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("tag", tag_json_schema, self.process_tag)
+        self.parse_schema_object_files("tag", tag_json_schema, "snowddl.parser.tag:tag_json_schema", self.process_tag)
 
     def process_tag(self, f: ParsedFile):
         references = []
@@ -49,7 +49,7 @@ task_json_schema = {
 
 class TaskParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("task", task_json_schema, self.process_task)
+        self.parse_schema_object_files("task", task_json_schema, "snowddl.parser.task:task_json_schema", self.process_task)
 
     def process_task(self, f: ParsedFile):
         if f.params.get('after'):
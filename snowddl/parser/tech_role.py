@@ -28,8 +28,10 @@ tech_role_json_schema = {
 
 
 class TechRoleParser(AbstractParser):
+    is_dependent_on_blueprints = True
+
     def load_blueprints(self):
-        self.parse_single_file(self.base_path / 'tech_role.yaml', tech_role_json_schema, self.process_tech_role)
+        self.parse_single_file(self.base_path / 'tech_role.yaml', tech_role_json_schema, "snowddl.parser.tech_role:tech_role_json_schema", self.process_tech_role)
 
     def process_tech_role(self, f: ParsedFile):
         for tech_role_name, tech_role in f.params.items():
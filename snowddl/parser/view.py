@@ -34,7 +34,7 @@ view_json_schema = {
 
 class ViewParser(AbstractParser):
     def load_blueprints(self):
-        self.parse_schema_object_files("view", view_json_schema, self.process_view)
+        self.parse_schema_object_files("view", view_json_schema, "snowddl.parser.view:view_json_schema", self.process_view)
 
     def process_view(self, f: ParsedFile):
         column_blueprints = []
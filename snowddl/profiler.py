@@ -0,0 +1,220 @@
+from collections import Counter
+from contextlib import contextmanager
+from cProfile import Profile
+from logging import getLogger, NullHandler
+from os.path import basename, sep
+from pathlib import Path
+from pstats import Stats
+from re import compile
+from sys import _current_frames
+from threading import Event, Lock, Thread, enumerate as enumerate_threads, get_ident
+from time import perf_counter
+from typing import Dict, Optional, Tuple
+
+import tracemalloc
+
+logger = getLogger(__name__)
+logger.addHandler(NullHandler())
+
+thread_name_suffix_re = compile(r'_\d+$')
+unsafe_file_name_re = compile(r'[^A-Za-z0-9_.-]+')
+
+
+class SnowDDLProfiler:
+    # Deterministic cProfile of phases (config parsing, resolvers) and worker tasks, one .pstats file per phase
+    # Sampling of all threads for collapsed stacks (flamegraph.pl, speedscope), threads of the same pool are merged
+    # Tracemalloc snapshot at the end of phase with the highest peak of memory use
+    # Peak itself cannot be captured, snapshot shows memory still allocated when phase with the highest peak ended
+    sample_interval = 0.005
+    memory_top_lines = 20
+
+    # Snapshot is expensive, it is taken again only if peak grew significantly
+    memory_snapshot_growth = 1.1
+
+    # Threads waiting for work or for other threads are not included into collapsed stacks
+    idle_frames = (('threading.py', 'wait'), ('queue.py', 'get'), ('thread.py', '_worker'))
+
+    # Memory allocated by profiler itself is excluded from snapshots
+    memory_filters = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '*/cProfile.py'),
+        tracemalloc.Filter(False, '*/pstats.py'),
+        tracemalloc.Filter(False, __file__),
+    )
+
+    def __init__(self, path: Path):
+        self.path = path
+
+        self.phases = []
+        self.stacks = Counter()
+
+        # Profile of each worker thread is reused by all tasks of the same phase, profiles are merged on stop
+        self.task_profiles: Dict[Tuple[str, int], Profile] = {}
+
+        self.peak_snapshot_phase = None
+        self.peak_snapshot_memory = 0
+        self.peak_snapshot_top_lines = []
+
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._sampler_thread = None
+        self._started_at = None
+
+    def start(self):
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        tracemalloc.start()
+
+        self._started_at = perf_counter()
+        self._sampler_thread = Thread(target=self._sample, name=self.__class__.__name__, daemon=True)
+        self._sampler_thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self._sampler_thread.join()
+
+        with self._lock:
+            task_stats: Dict[str, Stats] = {}
+
+            for (name, _), profile in self.task_profiles.items():
+                try:
+                    stats = Stats(profile)
+                except TypeError:
+                    # Profile is empty, it could not be enabled while another profiler was active
+                    continue
+
+                if name in task_stats:
+                    task_stats[name].add(stats)
+                else:
+                    task_stats[name] = stats
+
+            for name, stats in task_stats.items():
+                stats.dump_stats(self.path / f"{self._get_file_name(name)}.tasks.pstats")
+
+            self._write_collapsed_stacks()
+            self._write_memory_report()
+
+        tracemalloc.stop()
+
+        logger.info(f"Profile was written to [{self.path}]")
+
+    @contextmanager
+    def phase(self, name: str):
+        profile = self._enable_profile(name)
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+
+            if profile:
+                profile.disable()
+                profile.dump_stats(self.path / f"{self._get_file_name(name)}.pstats")
+
+            self._record_memory(name, duration)
+
+    @contextmanager
+    def task(self, name: str):
+        # Tasks of the same phase are merged into a single file
+        key = (name, get_ident())
+
+        with self._lock:
+            if key not in self.task_profiles:
+                self.task_profiles[key] = Profile()
+
+        profile = self._enable_profile(name, self.task_profiles[key])
+
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+
+    def _enable_profile(self, name: str, profile: Optional[Profile] = None):
+        # Starting from Python 3.12 only one profiler can be active in the whole process
+        # Nested and parallel phases are covered by active profiler in this case, and by sampling
+        if profile is None:
+            profile = Profile()
+
+        try:
+            profile.enable()
+        except ValueError:
+            logger.debug(f"Could not enable profiler for [{name}], another profiler is already active")
+            return None
+
+        return profile
+
+    def _record_memory(self, name: str, duration: float):
+        current, peak = tracemalloc.get_traced_memory()
+
+        # Peak is process-wide, phases running in parallel share the same peak
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+
+        with self._lock:
+            self.phases.append({
+                "name": name,
+                "duration": duration,
+                "current": current,
+                "peak": peak,
+            })
+
+            if peak > self.peak_snapshot_memory * self.memory_snapshot_growth:
+                snapshot = tracemalloc.take_snapshot().filter_traces(self.memory_filters)
+                snapshot.dump(str(self.path / 'peak_phase.tracemalloc'))
+
+                self.peak_snapshot_phase = name
+                self.peak_snapshot_memory = peak
+                self.peak_snapshot_top_lines = snapshot.statistics('lineno')[:self.memory_top_lines]
+
+    def _sample(self):
+        sampler_ident = get_ident()
+        labels = {}
+
+        while not self._stop_event.wait(self.sample_interval):
+            thread_names = {t.ident: thread_name_suffix_re.sub('', t.name) for t in enumerate_threads()}
+            samples = []
+
+            for thread_ident, frame in _current_frames().items():
+                if thread_ident == sampler_ident or (basename(frame.f_code.co_filename), frame.f_code.co_name) in self.idle_frames:
+                    continue
+
+                frames = []
+
+                while frame is not None:
+                    code = frame.f_code
+
+                    if code not in labels:
+                        labels[code] = f"{code.co_name} ({'/'.join(code.co_filename.split(sep)[-2:])}:{code.co_firstlineno})".replace(';', ':')
+
+                    frames.append(labels[code])
+                    frame = frame.f_back
+
+                frames.append(thread_names.get(thread_ident, 'unknown'))
+                samples.append(';'.join(reversed(frames)))
+
+            with self._lock:
+                self.stacks.update(samples)
+
+    def _write_collapsed_stacks(self):
+        with (self.path / 'stacks.collapsed').open('w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def _write_memory_report(self):
+        with (self.path / 'memory.txt').open('w', encoding='utf-8') as f:
+            f.write(f"Total duration: {perf_counter() - self._started_at:.3f}s\n")
+
+            for p in self.phases:
+                f.write(f"{p['name']}: {p['duration']:.3f}s, current {p['current'] / 1048576:.1f} MiB, peak {p['peak'] / 1048576:.1f} MiB\n")
+
+            if self.peak_snapshot_phase:
+                f.write(f"\nTop allocations in peak_phase.tracemalloc, taken at the end of [{self.peak_snapshot_phase}] with peak {self.peak_snapshot_memory / 1048576:.1f} MiB:\n")
+                f.write("Memory released before the end of this phase is not included\n")
+
+                for stat in self.peak_snapshot_top_lines:
+                    f.write(f"    {stat}\n")
+
+    def _get_file_name(self, name: str):
+        return unsafe_file_name_re.sub('_', name)
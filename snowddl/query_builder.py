@@ -1,6 +1,6 @@
 from base64 import urlsafe_b64encode
 from hashlib import sha1
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
@@ -12,13 +12,19 @@ class SnowDDLQueryBuilder:
         self.formatter = formatter
         self.fragments: List[List[str]] = [[]]
 
+        # Rendered SQL and hash are cached until the next append
+        self._sql: Optional[str] = None
+        self._short_hash_value: Optional[str] = None
+
     def append(self, sql, params=None):
-        sql = self.formatter.format_sql(sql, params)
+        sql = self._format_fragment(sql, params)
         self.fragments[-1].append(sql)
+        self._invalidate()
 
     def append_nl(self, sql, params=None):
-        sql = self.formatter.format_sql(sql, params)
+        sql = self._format_fragment(sql, params)
         self.fragments.append([sql])
+        self._invalidate()
 
     def fragment_count(self):
         return sum([len(f) for f in self.fragments])
@@ -35,9 +41,26 @@ class SnowDDLQueryBuilder:
 
         return str(comment).endswith(self._short_hash())
 
+    def _format_fragment(self, sql, params):
+        # Nested builder is already formatted, its cached SQL is used as is
+        if isinstance(sql, SnowDDLQueryBuilder) and not params:
+            return str(sql)
+
+        return self.formatter.format_sql(sql, params)
+
+    def _invalidate(self):
+        self._sql = None
+        self._short_hash_value = None
+
     def _short_hash(self):
-        sha1_digest = sha1(str(self).encode('UTF-8')).digest()
-        return f"#{urlsafe_b64encode(sha1_digest[:12]).decode('ascii')}"
+        if self._short_hash_value is None:
+            sha1_digest = sha1(str(self).encode('UTF-8')).digest()
+            self._short_hash_value = f"#{urlsafe_b64encode(sha1_digest[:12]).decode('ascii')}"
+
+        return self._short_hash_value
 
     def __str__(self):
-        return '\n'.join([' '.join(line) for line in self.fragments])
+        if self._sql is None:
+            self._sql = '\n'.join([' '.join(line) for line in self.fragments])
+
+        return self._sql
@@ -97,3 +97,45 @@ singledb_resolver_sequence = [
     MaskingPolicyResolver,
     RowAccessPolicyResolver,
 ]
+
+
+# Resolvers listed here start as soon as all their dependencies are resolved
+# Dependencies must be a subset of resolvers which precede each resolver in default sequence
+default_resolver_dependencies = {
+    AccountParameterResolver: [],
+    NetworkPolicyResolver: [],
+    ResourceMonitorResolver: [],
+    WarehouseResolver: [ResourceMonitorResolver],
+    WarehouseRoleResolver: [WarehouseResolver],
+    DatabaseResolver: [],
+    SchemaResolver: [DatabaseResolver],
+    SchemaRoleResolver: [SchemaResolver],
+    InboundShareResolver: [],
+    InboundShareRoleResolver: [InboundShareResolver],
+    # Schema objects depend on schema roles, ownership is transferred by future grants
+    FileFormatResolver: [SchemaRoleResolver],
+    StageResolver: [SchemaRoleResolver, FileFormatResolver],
+    StageFileResolver: [StageResolver],
+    SequenceResolver: [SchemaRoleResolver],
+    FunctionResolver: [SchemaRoleResolver, StageFileResolver],
+    ExternalFunctionResolver: [FunctionResolver],
+    ProcedureResolver: [SchemaRoleResolver, StageFileResolver],
+    TableResolver: [SchemaRoleResolver, SequenceResolver],
+    ExternalTableResolver: [SchemaRoleResolver, StageResolver, FileFormatResolver],
+    PrimaryKeyResolver: [TableResolver],
+    UniqueKeyResolver: [TableResolver],
+    ForeignKeyResolver: [PrimaryKeyResolver, UniqueKeyResolver],
+    StreamResolver: [TableResolver, ExternalTableResolver],
+    MaterializedViewResolver: [TableResolver, ExternalTableResolver, FunctionResolver, ExternalFunctionResolver],
+    ViewResolver: [SequenceResolver, ProcedureResolver, StreamResolver, MaterializedViewResolver],
+    PipeResolver: [TableResolver, StageResolver, FileFormatResolver, FunctionResolver],
+    TaskResolver: [WarehouseResolver, ProcedureResolver, ViewResolver, PipeResolver],
+    MaskingPolicyResolver: [ViewResolver],
+    RowAccessPolicyResolver: [ViewResolver],
+    OutboundShareResolver: [ViewResolver],
+    # Technical roles may hold grants on any object
+    TechRoleResolver: [WarehouseRoleResolver, ForeignKeyResolver, TaskResolver, MaskingPolicyResolver, RowAccessPolicyResolver],
+    BusinessRoleResolver: [SchemaRoleResolver, WarehouseRoleResolver, TechRoleResolver],
+    UserRoleResolver: [BusinessRoleResolver],
+    UserResolver: [UserRoleResolver, WarehouseResolver, SchemaResolver],
+}
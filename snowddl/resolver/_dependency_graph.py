@@ -0,0 +1,116 @@
+from collections import defaultdict, deque
+from typing import Dict, List, Tuple
+
+
+def sort_by_dependencies(dependencies: Dict[str, List[str]]) -> Tuple[Dict[str, int], List[List[str]]]:
+    # Kahn's algorithm, linear time
+    # Level of each node is the length of the longest chain of dependencies leading to it, nodes in cycles have no level
+    # Nodes depending on cycles are sorted as if cycles did not exist
+    successors = defaultdict(list)
+    waiting = {}
+
+    for node, predecessors in dependencies.items():
+        waiting[node] = len(predecessors)
+
+        for predecessor in predecessors:
+            successors[predecessor].append(node)
+
+    levels = {}
+    pending_levels = defaultdict(int)
+    queue = deque(node for node, count in waiting.items() if count == 0)
+
+    def release(node, level, skipped=()):
+        for successor in successors[node]:
+            if successor in skipped:
+                continue
+
+            waiting[successor] -= 1
+            pending_levels[successor] = max(pending_levels[successor], level)
+
+            if waiting[successor] == 0:
+                queue.append(successor)
+
+    def sort_queue():
+        while queue:
+            node = queue.popleft()
+            levels[node] = pending_levels[node]
+
+            release(node, levels[node] + 1)
+
+    sort_queue()
+
+    cycles = []
+
+    if len(levels) < len(dependencies):
+        unsorted = {node: [p for p in predecessors if p not in levels] for node, predecessors in dependencies.items() if node not in levels}
+        cycles = find_cycles(unsorted)
+        cycle_nodes = {node for cycle in cycles for node in cycle}
+
+        for node in cycle_nodes:
+            release(node, 0, cycle_nodes)
+
+        sort_queue()
+
+    return levels, cycles
+
+
+def find_cycles(dependencies: Dict[str, List[str]]) -> List[List[str]]:
+    # Tarjan's strongly connected components algorithm without recursion, linear time
+    # Component is a cycle if it has more than one node or node depends on itself
+    index = {}
+    low_link = {}
+    stack = []
+    on_stack = set()
+    cycles = []
+
+    for root in dependencies:
+        if root in index:
+            continue
+
+        index[root] = low_link[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+
+        work = [(root, iter(dependencies[root]))]
+
+        while work:
+            node, predecessors = work[-1]
+            is_descended = False
+
+            for predecessor in predecessors:
+                if predecessor not in index:
+                    index[predecessor] = low_link[predecessor] = len(index)
+                    stack.append(predecessor)
+                    on_stack.add(predecessor)
+
+                    work.append((predecessor, iter(dependencies.get(predecessor, []))))
+                    is_descended = True
+                    break
+
+                if predecessor in on_stack:
+                    low_link[node] = min(low_link[node], index[predecessor])
+
+            if is_descended:
+                continue
+
+            work.pop()
+
+            if work:
+                parent = work[-1][0]
+                low_link[parent] = min(low_link[parent], low_link[node])
+
+            if low_link[node] == index[node]:
+                component = []
+
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+
+                    if member == node:
+                        break
+
+                if len(component) > 1 or node in dependencies.get(node, []):
+                    cycles.append(sorted(component))
+
+    return sorted(cycles)
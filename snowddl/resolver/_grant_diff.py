@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Union
+
+from snowddl.blueprint import Grant, FutureGrant, ObjectType, SchemaObjectIdent
+
+
+GrantKey = Tuple[str, ObjectType, str]
+
+
+@dataclass
+class GrantDiff:
+    create_grants: List[Grant] = field(default_factory=list)
+    drop_grants: List[Grant] = field(default_factory=list)
+    create_future_grants: List[FutureGrant] = field(default_factory=list)
+    drop_future_grants: List[FutureGrant] = field(default_factory=list)
+
+
+def grant_key(grant: Union[Grant, FutureGrant]) -> GrantKey:
+    # Canonical hashable key, keys are equal if grants are equal
+    return grant.privilege, grant.on, str(grant.name)
+
+
+def covering_future_grant_key(grant: Grant) -> Optional[GrantKey]:
+    # Key of future grant in schema which implies existing grant, new identifiers are not created
+    if not grant.on.is_future_grant_supported:
+        return None
+
+    if isinstance(grant.name, SchemaObjectIdent):
+        core_parts, _ = grant.name.parts_for_format()
+        return grant.privilege, grant.on, '.'.join(core_parts[:2])
+
+    return grant_key(grant)
+
+
+def diff_grants(bp_grants: List[Grant], existing_grants: List[Grant], bp_future_grants: List[FutureGrant] = (), existing_future_grants: List[FutureGrant] = ()) -> GrantDiff:
+    # Linear time diff, order of grants in result is the same as order in input lists
+    # Existing grant is not dropped if it is implied by future grant in blueprint
+    bp_grant_keys = {grant_key(g) for g in bp_grants}
+    existing_grant_keys = {grant_key(g) for g in existing_grants}
+
+    bp_future_grant_keys = {grant_key(g) for g in bp_future_grants}
+    existing_future_grant_keys = {grant_key(g) for g in existing_future_grants}
+
+    return GrantDiff(
+        create_grants=[g for g in bp_grants if grant_key(g) not in existing_grant_keys],
+        drop_grants=[g for g in existing_grants if grant_key(g) not in bp_grant_keys and covering_future_grant_key(g) not in bp_future_grant_keys],
+        create_future_grants=[g for g in bp_future_grants if grant_key(g) not in existing_future_grant_keys],
+        drop_future_grants=[g for g in existing_future_grants if grant_key(g) not in bp_future_grant_keys],
+    )
@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
 from enum import Enum
+from time import perf_counter
 from traceback import format_exc
 
-from concurrent.futures import as_completed
-from typing import Dict, TYPE_CHECKING
+from concurrent.futures import wait, Future, FIRST_COMPLETED
+from typing import Dict, List, Optional, TYPE_CHECKING
 
+from snowddl.ddl_sink import ddl_object_name
 from snowddl.error import SnowDDLExecuteError, SnowDDLUnsupportedError
+from snowddl.metrics import metrics_tags
+from snowddl.resolver._dependency_graph import sort_by_dependencies
 from snowddl.blueprint import AbstractBlueprint, DependsOnMixin, Edition, ObjectType
 
 if TYPE_CHECKING:
@@ -28,6 +33,10 @@ class AbstractResolver(ABC):
     skip_on_empty_blueprints = False
     skip_min_edition = Edition.STANDARD
 
+    # Objects may be skipped by state snapshot only if all compared properties are present in blueprint and in row of existing object
+    # Resolvers comparing output of DESC, SHOW GRANTS or other additional queries must not use it, changes would not be detected
+    is_state_snapshot_supported = True
+
     def __init__(self, engine: "SnowDDLEngine"):
         self.engine = engine
         self.config = engine.config
@@ -39,11 +48,28 @@ class AbstractResolver(ABC):
         self.resolved_objects: Dict[str,ResolveResult] = {}
         self.errors: Dict[str,Exception] = {}
 
+        self._all_blueprints: Optional[Dict[str, AbstractBlueprint]] = None
+
     def resolve(self):
         if self._is_skipped():
             return
 
-        self.blueprints = self.get_blueprints()
+        token = metrics_tags.set((self.__class__.__name__, self.object_type.name))
+
+        try:
+            with self.engine.profile_phase(f"resolve.{self.__class__.__name__}"):
+                self._resolve()
+        finally:
+            self.engine.flush_ddl_buffers(self.__class__.__name__)
+            metrics_tags.reset(token)
+
+    def _resolve(self):
+
+        self.blueprints = self._get_all_blueprints()
+
+        if self.engine.settings.change_scope:
+            # Only objects affected by changed config files are resolved
+            self.blueprints = {full_name: bp for full_name, bp in self.blueprints.items() if self.is_blueprint_in_change_scope(bp)}
 
         try:
             self.existing_objects = self.get_existing_objects()
@@ -51,6 +77,9 @@ class AbstractResolver(ABC):
             self.engine.logger.info(f"Could not get existing objects for resolver [{self.__class__.__name__}]: \n{e.verbose_message()}")
             raise e.snow_exc
 
+        if self.engine.settings.change_scope:
+            self.existing_objects = {full_name: row for full_name, row in self.existing_objects.items() if self.is_in_change_scope(full_name)}
+
         self._pre_process()
         self._resolve_create_compare()
         self._resolve_drop()
@@ -60,6 +89,17 @@ class AbstractResolver(ABC):
         if self._is_skipped():
             return
 
+        token = metrics_tags.set((self.__class__.__name__, self.object_type.name))
+
+        try:
+            with self.engine.profile_phase(f"destroy.{self.__class__.__name__}"):
+                self._destroy()
+        finally:
+            self.engine.flush_ddl_buffers(self.__class__.__name__)
+            metrics_tags.reset(token)
+
+    def _destroy(self):
+
         try:
             self.existing_objects = self.get_existing_objects()
         except SnowDDLExecuteError as e:
@@ -70,18 +110,51 @@ class AbstractResolver(ABC):
         self._destroy_drop()
         self._post_process()
 
+    def is_blueprint_in_change_scope(self, bp: AbstractBlueprint):
+        # Blueprints created by resolvers (e.g. schema roles) are in scope if objects they were derived from are in scope
+        change_scope = self.engine.settings.change_scope
+
+        return change_scope.is_in_scope(str(bp.full_name)) or change_scope.is_dependent(bp)
+
+    def is_in_change_scope(self, full_name: str):
+        # Existing objects without blueprints remain in scope, so objects of deleted config files are dropped
+        return full_name in self.blueprints or self.engine.settings.change_scope.is_in_scope(full_name)
+
     def _resolve_create_compare(self):
-        # Process blueprints in batches sorted in order of dependencies
-        for blueprint_names_batch in self._split_blueprints_into_batches():
-            tasks = {}
+        # Each blueprint is processed as soon as blueprints it depends on are resolved
+        dependencies = self._get_blueprint_dependencies()
+        levels, cycles = sort_by_dependencies(dependencies)
+
+        for cycle in cycles:
+            self._process_cycle(cycle)
 
-            for full_name in sorted(blueprint_names_batch):
-                if full_name in self.existing_objects:
-                    tasks[full_name] = (self.compare_object, self.blueprints[full_name], self.existing_objects[full_name])
+        tasks = {}
+
+        # Tasks are ordered by dependency level and by name, statements are flushed in this order
+        for full_name in sorted(levels, key=lambda n: (levels[n], n)):
+            if full_name in self.existing_objects and self._is_state_snapshot_enabled():
+                if self.engine.state_snapshot.is_unchanged(self.__class__.__name__, full_name, self.blueprints[full_name], self.existing_objects[full_name]):
+                    # Blueprint and existing object are the same as during previous run without changes
+                    self.engine.logger.debug(f"Resolved {self.object_type.name} [{full_name}]: {ResolveResult.NOCHANGE.value} (state snapshot)")
+                    self.resolved_objects[full_name] = ResolveResult.NOCHANGE
                 else:
-                    tasks[full_name] = (self.create_object, self.blueprints[full_name])
+                    tasks[full_name] = (self._compare_object_and_record_state, self.blueprints[full_name], self.existing_objects[full_name])
+            elif full_name in self.existing_objects:
+                tasks[full_name] = (self.compare_object, self.blueprints[full_name], self.existing_objects[full_name])
+            else:
+                tasks[full_name] = (self.create_object, self.blueprints[full_name])
+
+        # Dependencies which are not processed as tasks are already resolved
+        self._process_tasks(tasks, {full_name: [d for d in dependencies[full_name] if d in tasks] for full_name in tasks})
+
+    def _compare_object_and_record_state(self, bp: AbstractBlueprint, row: Dict):
+        result = self.compare_object(bp, row)
 
-            self._process_tasks(tasks)
+        # Plan does not apply any changes, so objects are recorded only when DDL is executed
+        if result == ResolveResult.NOCHANGE and (self.engine.settings.execute_safe_ddl or self.engine.settings.execute_unsafe_ddl):
+            self.engine.state_snapshot.record(self.__class__.__name__, str(bp.full_name), bp, row)
+
+        return result
 
     def _resolve_drop(self):
         # Drop existing objects without blueprints
@@ -102,69 +175,122 @@ class AbstractResolver(ABC):
 
         self._process_tasks(tasks)
 
-    def _process_tasks(self, tasks):
+    def _process_tasks(self, tasks, dependencies: Optional[Dict[str, List[str]]] = None):
         futures = {}
+        started_at = {}
 
-        for full_name, args in tasks.items():
-            futures[self.engine.executor.submit(*args)] = full_name
+        # Task is submitted when all tasks it depends on are finished
+        successors = defaultdict(list)
+        waiting = {}
 
-        for f in as_completed(futures):
-            full_name = futures[f]
+        for full_name, predecessors in (dependencies or {}).items():
+            waiting[full_name] = len(predecessors)
 
-            try:
-                result = f.result()
-                if result == ResolveResult.NOCHANGE:
-                    self.engine.logger.debug(f"Resolved {self.object_type.name} [{full_name}]: {result.value}")
-                else:
-                    self.engine.logger.info(f"Resolved {self.object_type.name} [{full_name}]: {result.value}")
-            except Exception as e:
-                if isinstance(e, SnowDDLUnsupportedError):
-                    result = ResolveResult.UNSUPPORTED
-                else:
-                    result = ResolveResult.ERROR
+            for predecessor in predecessors:
+                successors[predecessor].append(full_name)
 
-                if isinstance(e, SnowDDLExecuteError):
-                    error_text = e.verbose_message()
-                else:
-                    error_text = format_exc()
+        # Statements executed before tasks (e.g. in _pre_process) are flushed first
+        self.engine.flush_ddl_buffers(self.__class__.__name__, '')
+
+        # Statements of objects are flushed in order of tasks as soon as all preceding objects are finished
+        flush_queue = deque(tasks)
+        finished_full_names = set()
+
+        def submit(full_name):
+            futures[self.engine.executor.submit(self._run_task, started_at, full_name, *tasks[full_name])] = full_name
+
+        for full_name in tasks:
+            if not waiting.get(full_name):
+                submit(full_name)
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
 
-                self.engine.logger.warning(f"Resolved {self.object_type.name} [{full_name}]: {result.value}\n{error_text}")
-                self.errors[full_name] = e
+            for f in done:
+                full_name = futures.pop(f)
+                is_finished = self._process_task_result(full_name, f, futures)
 
-            self.resolved_objects[full_name] = result
+                # Task is finished, including asynchronous statements
+                if is_finished and full_name in started_at:
+                    self.engine.record_task_metrics(full_name, perf_counter() - started_at[full_name], self.resolved_objects[full_name].value)
+                    finished_full_names.add(full_name)
 
-        self.engine.flush_thread_buffers()
+                    for successor in successors[full_name]:
+                        waiting[successor] -= 1
 
-    def _split_blueprints_into_batches(self):
-        all_batches = []
-        allocated_full_names = set()
+                        if waiting[successor] == 0:
+                            submit(successor)
 
-        remaining_blueprints = self.blueprints.copy()
+            while flush_queue and flush_queue[0] in finished_full_names:
+                self.engine.flush_ddl_buffers(self.__class__.__name__, flush_queue.popleft())
 
-        # Create new batches as long as at least one unallocated blueprint remains
-        while remaining_blueprints:
-            batch = []
+        self.engine.flush_ddl_buffers(self.__class__.__name__)
+
+    def _run_task(self, started_at: dict, full_name, func, *args):
+        # Time spent in executor queue is not included
+        started_at[full_name] = perf_counter()
+
+        # Each task runs in a copy of context, so variable does not have to be reset
+        ddl_object_name.set(full_name)
+
+        with self.engine.profile_task(f"task.{self.__class__.__name__}"):
+            return func(*args)
+
+    def _process_task_result(self, full_name, f: Future, futures: dict):
+        try:
+            result = f.result()
 
-            # Allocate blueprints with no dependencies or fully resolved dependencies
-            for full_name, bp in remaining_blueprints.items():
-                if not isinstance(bp, DependsOnMixin) \
-                or not bp.depends_on \
-                or all((str(d) in allocated_full_names) for d in bp.depends_on):
-                    batch.append(full_name)
+            # Statements were submitted asynchronously, worker thread was released before completion
+            if isinstance(result, Future):
+                futures[result] = full_name
+                return False
 
-            # Allocate blueprints with unresolved dependencies to the last batch
-            if len(batch) == 0:
-                for full_name in remaining_blueprints:
-                    batch.append(full_name)
+            if result == ResolveResult.NOCHANGE:
+                self.engine.logger.debug(f"Resolved {self.object_type.name} [{full_name}]: {result.value}")
+            else:
+                self.engine.logger.info(f"Resolved {self.object_type.name} [{full_name}]: {result.value}")
+        except Exception as e:
+            if isinstance(e, SnowDDLUnsupportedError):
+                result = ResolveResult.UNSUPPORTED
+            else:
+                result = ResolveResult.ERROR
 
-            # Forget blueprints allocated during this iteration
-            for full_name in batch:
-                del remaining_blueprints[full_name]
+            if isinstance(e, SnowDDLExecuteError):
+                error_text = e.verbose_message()
+            else:
+                error_text = format_exc()
 
-            all_batches.append(batch)
-            allocated_full_names.update(batch)
+            self.engine.logger.warning(f"Resolved {self.object_type.name} [{full_name}]: {result.value}\n{error_text}")
+            self.errors[full_name] = e
 
-        return all_batches
+        self.resolved_objects[full_name] = result
+
+        if self._is_state_snapshot_enabled() and result != ResolveResult.NOCHANGE:
+            self.engine.state_snapshot.forget(self.__class__.__name__, full_name)
+
+        return True
+
+    def _get_blueprint_dependencies(self) -> Dict[str, List[str]]:
+        # Only dependencies on blueprints of the same resolver are considered
+        # Other objects are either resolved by other resolvers or are expected to exist already
+        dependencies = {}
+
+        for full_name, bp in self.blueprints.items():
+            if isinstance(bp, DependsOnMixin) and bp.depends_on:
+                dependencies[full_name] = [d for d in dict.fromkeys(str(d) for d in bp.depends_on) if d in self.blueprints]
+            else:
+                dependencies[full_name] = []
+
+        return dependencies
+
+    def _process_cycle(self, cycle: List[str]):
+        # Objects with circular dependencies cannot be created in any order, they are reported as errors
+        for full_name in cycle:
+            e = ValueError(f"Circular dependency between {self.object_type.name} objects [{', '.join(cycle)}]")
+
+            self.engine.logger.warning(f"Resolved {self.object_type.name} [{full_name}]: {ResolveResult.ERROR.value}\n{e}")
+            self.errors[full_name] = e
+            self.resolved_objects[full_name] = ResolveResult.ERROR
 
     def _is_skipped(self):
         if self.engine.context.edition < self.skip_min_edition:
@@ -176,11 +302,21 @@ class AbstractResolver(ABC):
         if self.engine.settings.include_object_types:
             return not (self.object_type in self.engine.settings.include_object_types)
 
-        if self.skip_on_empty_blueprints and not self.get_blueprints():
+        if self.skip_on_empty_blueprints and not self._get_all_blueprints():
             return True
 
         return False
 
+    def _is_state_snapshot_enabled(self):
+        return self.engine.state_snapshot is not None and self.is_state_snapshot_supported
+
+    def _get_all_blueprints(self):
+        # Some resolvers generate blueprints on the fly (e.g. schema roles), so blueprints are generated only once
+        if self._all_blueprints is None:
+            self._all_blueprints = self.get_blueprints()
+
+        return self._all_blueprints
+
     def _pre_process(self):
         pass
 
@@ -1,10 +1,13 @@
 from abc import abstractmethod
 
-from snowddl.blueprint import RoleBlueprint, Grant, FutureGrant, SchemaIdent, SchemaObjectIdent, build_grant_name_ident_snowflake
+from snowddl.blueprint import RoleBlueprint, Grant, FutureGrant, build_grant_name_ident_snowflake
+from snowddl.resolver._grant_diff import diff_grants
 from snowddl.resolver.abc_resolver import AbstractResolver, ResolveResult, ObjectType
 
 
 class AbstractRoleResolver(AbstractResolver):
+    is_state_snapshot_supported = False
+
     @abstractmethod
     def get_role_suffix(self) -> str:
         pass
@@ -14,6 +17,7 @@ class AbstractRoleResolver(AbstractResolver):
 
     def get_existing_objects(self):
         existing_roles = {}
+        role_created_on = {}
 
         cur = self.engine.execute_meta("SHOW ROLES LIKE {pattern:lse}", {
             'pattern': (self.config.env_prefix, f"__{self.get_role_suffix()}"),
@@ -23,13 +27,32 @@ class AbstractRoleResolver(AbstractResolver):
             if r['owner'] != self.engine.context.current_role:
                 continue
 
+            # Grants are loaded only for roles affected by changed config files
+            if self.engine.settings.change_scope and not self.is_in_change_scope(r['name']):
+                continue
+
+            role_created_on[r['name']] = r['created_on']
+
             existing_roles[r['name']] = {
                 "role_name": r['name'],
                 "comment": r['comment'] if r['comment'] else None,
             }
 
+        remaining_role_names = list(existing_roles)
+
+        if self.engine.settings.bulk_role_grants:
+            remaining_role_names = []
+
+            for role_name in existing_roles:
+                role_grants = self.engine.role_grant_cache.get_role_grants(role_name, role_created_on[role_name])
+
+                if role_grants is None:
+                    remaining_role_names.append(role_name)
+                else:
+                    existing_roles[role_name]['grants'], existing_roles[role_name]['future_grants'] = role_grants
+
         # Process role grants in parallel
-        for role_name, grants, future_grants in self.engine.executor.map(self.get_existing_role_grants, existing_roles):
+        for role_name, grants, future_grants in self.engine.executor.map(self.get_existing_role_grants, remaining_role_names):
             existing_roles[role_name]['grants'] = grants
             existing_roles[role_name]['future_grants'] = future_grants
 
@@ -81,16 +104,18 @@ class AbstractRoleResolver(AbstractResolver):
 
         self.engine.execute_safe_ddl(query)
 
-        self.engine.execute_safe_ddl("GRANT ROLE {role_name:i} TO ROLE {current_role:i}", {
-            "role_name": bp.full_name,
-            "current_role": self.engine.context.current_role,
-        })
+        # Grants are sent in one request after role was created
+        with self.engine.ddl_pipeline():
+            self.engine.execute_safe_ddl("GRANT ROLE {role_name:i} TO ROLE {current_role:i}", {
+                "role_name": bp.full_name,
+                "current_role": self.engine.context.current_role,
+            })
 
-        for bp_grant in bp.grants:
-            self.create_grant(bp.full_name, bp_grant)
+            for bp_grant in bp.grants:
+                self.create_grant(bp.full_name, bp_grant)
 
-        for bp_future_grant in bp.future_grants:
-            self.create_future_grant(bp.full_name, bp_future_grant)
+            for bp_future_grant in bp.future_grants:
+                self.create_future_grant(bp.full_name, bp_future_grant)
 
         return ResolveResult.CREATE
 
@@ -105,28 +130,27 @@ class AbstractRoleResolver(AbstractResolver):
 
             result = ResolveResult.ALTER
 
-        for bp_grant in bp.grants:
-            if bp_grant not in row['grants']:
+        grant_diff = diff_grants(bp.grants, row['grants'], bp.future_grants, row['future_grants'])
+
+        with self.engine.ddl_pipeline():
+            for bp_grant in grant_diff.create_grants:
                 self.create_grant(bp.full_name, bp_grant)
                 result = ResolveResult.GRANT
 
-        for existing_grant in row['grants']:
-            if existing_grant not in bp.grants \
-            and self.grant_to_future_grant(existing_grant) not in bp.future_grants:
+            for existing_grant in grant_diff.drop_grants:
                 self.drop_grant(bp.full_name, existing_grant)
                 result = ResolveResult.GRANT
 
-        for bp_future_grant in bp.future_grants:
-            if bp_future_grant not in row['future_grants']:
+            for bp_future_grant in grant_diff.create_future_grants:
                 self.create_future_grant(bp.full_name, bp_future_grant)
                 result = ResolveResult.GRANT
 
             if self.engine.settings.refresh_future_grants:
-                self.refresh_future_grant(bp.full_name, bp_future_grant)
-                result = ResolveResult.GRANT
+                for bp_future_grant in bp.future_grants:
+                    self.refresh_future_grant(bp.full_name, bp_future_grant)
+                    result = ResolveResult.GRANT
 
-        for existing_future_grant in row['future_grants']:
-            if existing_future_grant not in bp.future_grants:
+            for existing_future_grant in grant_diff.drop_future_grants:
                 self.drop_future_grant(bp.full_name, existing_future_grant)
                 result = ResolveResult.GRANT
 
@@ -195,15 +219,3 @@ class AbstractRoleResolver(AbstractResolver):
             "name": grant.name,
             "role_name": role_name,
         })
-
-    def grant_to_future_grant(self, grant: Grant):
-        if not grant.on.is_future_grant_supported:
-            return None
-
-        future_grant = FutureGrant(
-            privilege=grant.privilege,
-            on=grant.on,
-            name=SchemaIdent(grant.name.env_prefix, grant.name.database, grant.name.schema) if isinstance(grant.name, SchemaObjectIdent) else grant.name
-        )
-
-        return future_grant
@@ -1,16 +1,43 @@
 from abc import abstractmethod
+from typing import Optional
 
 from snowddl.blueprint import SchemaBlueprint
+from snowddl.metadata_snapshot import SnowDDLMetadataSnapshot
 from snowddl.resolver.abc_resolver import AbstractResolver, ResolveResult, ObjectType
 
 
 class AbstractSchemaObjectResolver(AbstractResolver):
+    metadata_snapshot: Optional[SnowDDLMetadataSnapshot] = None
+
     def get_existing_objects(self):
         existing_objects = {}
+        self.metadata_snapshot = SnowDDLMetadataSnapshot(self.engine)
+
+        # Process databases in parallel, objects of all schemas in database are loaded by a single SHOW command
+        for database_objects in self.engine.executor.map(self.get_existing_objects_in_database, self._get_schemas_by_database().values()):
+            existing_objects.update(database_objects)
+
+        # Raw metadata is no longer required
+        self.metadata_snapshot = None
+
+        return existing_objects
+
+    def _get_schemas_by_database(self):
+        schemas_by_database = self.engine.schema_cache.schemas_by_database()
+        change_scope = self.engine.settings.change_scope
+
+        # Metadata is loaded only for schemas affected by changed config files
+        if change_scope:
+            schemas_by_database = {database: [s for s in schemas if change_scope.is_schema_in_scope(s['database'], s['schema'])] for database, schemas in schemas_by_database.items()}
+            schemas_by_database = {database: schemas for database, schemas in schemas_by_database.items() if schemas}
+
+        return schemas_by_database
+
+    def get_existing_objects_in_database(self, schemas: list):
+        existing_objects = {}
 
-        # Process schemas in parallel
-        for schema_objects in self.engine.executor.map(self.get_existing_objects_in_schema, self.engine.schema_cache.schemas.values()):
-            existing_objects.update(schema_objects)
+        for schema in schemas:
+            existing_objects.update(self.get_existing_objects_in_schema(schema))
 
         return existing_objects
 
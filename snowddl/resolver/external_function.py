@@ -10,10 +10,7 @@ class ExternalFunctionResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta("SHOW EXTERNAL FUNCTIONS IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("EXTERNAL FUNCTIONS", schema)
 
         for r in cur:
             full_name = f"{r['catalog_name']}.{r['schema_name']}.{r['name']}({dtypes_from_arguments(r['arguments'])})"
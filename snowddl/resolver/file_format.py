@@ -9,10 +9,7 @@ class FileFormatResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta("SHOW FILE FORMATS IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("FILE FORMATS", schema)
 
         for r in cur:
             existing_objects[f"{r['database_name']}.{r['schema_name']}.{r['name']}"] = {
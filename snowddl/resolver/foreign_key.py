@@ -10,10 +10,7 @@ class ForeignKeyResolver(AbstractSchemaObjectResolver):
         existing_objects = {}
         constraints_by_name = {}
 
-        cur = self.engine.execute_meta("SHOW IMPORTED KEYS IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("IMPORTED KEYS", schema, schema_column='fk_schema_name')
 
         for r in cur:
             if r['fk_name'] not in constraints_by_name:
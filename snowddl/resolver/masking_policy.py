@@ -5,6 +5,7 @@ from snowddl.resolver.abc_schema_object_resolver import AbstractSchemaObjectReso
 class MaskingPolicyResolver(AbstractSchemaObjectResolver):
     skip_on_empty_blueprints = True
     skip_min_edition = Edition.ENTERPRISE
+    is_state_snapshot_supported = False
 
     def get_object_type(self) -> ObjectType:
         return ObjectType.MASKING_POLICY
@@ -12,10 +13,7 @@ class MaskingPolicyResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta("SHOW MASKING POLICIES IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("MASKING POLICIES", schema)
 
         for r in cur:
             full_name = f"{r['database_name']}.{r['schema_name']}.{r['name']}"
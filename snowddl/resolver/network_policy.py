@@ -4,6 +4,7 @@ from snowddl.resolver.abc_resolver import AbstractResolver, ResolveResult, Objec
 
 class NetworkPolicyResolver(AbstractResolver):
     skip_on_empty_blueprints = True
+    is_state_snapshot_supported = False
 
     def get_object_type(self) -> ObjectType:
         return ObjectType.NETWORK_POLICY
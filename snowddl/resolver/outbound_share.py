@@ -1,9 +1,11 @@
 from snowddl.blueprint import OutboundShareBlueprint, Grant, build_grant_name_ident_snowflake
+from snowddl.resolver._grant_diff import diff_grants
 from snowddl.resolver.abc_resolver import AbstractResolver, ResolveResult, ObjectType
 
 
 class OutboundShareResolver(AbstractResolver):
     skip_on_empty_blueprints = True
+    is_state_snapshot_supported = False
 
     def get_object_type(self) -> ObjectType:
         return ObjectType.SHARE
@@ -62,15 +64,15 @@ class OutboundShareResolver(AbstractResolver):
 
         existing_grants = self.get_existing_share_grants(bp.full_name)
 
-        for bp_grant in bp.grants:
-            if bp_grant not in existing_grants:
-                self.create_grant(bp.full_name, bp_grant)
-                result = ResolveResult.GRANT
-
-        for ex_grant in existing_grants:
-            if ex_grant not in bp.grants:
-                self.drop_grant(bp.full_name, ex_grant)
-                result = ResolveResult.GRANT
+        grant_diff = diff_grants(bp.grants, existing_grants)
+
+        for bp_grant in grant_diff.create_grants:
+            self.create_grant(bp.full_name, bp_grant)
+            result = ResolveResult.GRANT
+
+        for ex_grant in grant_diff.drop_grants:
+            self.drop_grant(bp.full_name, ex_grant)
+            result = ResolveResult.GRANT
 
         # SHOW SHARES command returns only 3 accounts for each OUTBOUND SHARE
         # If you have to set more accounts, it will work, but SnowDDL will be forced to run SET ACCOUNTS every time
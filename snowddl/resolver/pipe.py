@@ -10,10 +10,7 @@ class PipeResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta("SHOW PIPES IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("PIPES", schema)
 
         for r in cur:
             existing_objects[f"{r['database_name']}.{r['schema_name']}.{r['name']}"] = {
@@ -10,10 +10,7 @@ class PrimaryKeyResolver(AbstractSchemaObjectResolver):
         existing_objects = {}
         constraints_by_name = {}
 
-        cur = self.engine.execute_meta("SHOW PRIMARY KEYS IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("PRIMARY KEYS", schema)
 
         for r in cur:
             if r['constraint_name'] not in constraints_by_name:
@@ -6,6 +6,15 @@ class SchemaRoleResolver(AbstractRoleResolver):
     def get_role_suffix(self):
         return self.config.SCHEMA_ROLE_SUFFIX
 
+    def is_in_change_scope(self, full_name: str):
+        if super().is_in_change_scope(full_name):
+            return True
+
+        # Roles of deleted schemas have no blueprints, schema is detected by role name
+        name_parts = full_name[len(self.config.env_prefix):].split('__')
+
+        return len(name_parts) == 4 and self.engine.settings.change_scope.is_in_scope(f"{self.config.env_prefix}{name_parts[0]}.{name_parts[1]}")
+
     def get_blueprints(self):
         blueprints = []
 
@@ -8,6 +8,9 @@ from snowddl.resolver.abc_resolver import AbstractResolver, ResolveResult, Objec
 
 
 class StageFileResolver(AbstractResolver):
+    # Content of local file is compared by md5, it is not part of blueprint or LIST row
+    is_state_snapshot_supported = False
+
     def get_object_type(self) -> ObjectType:
         return ObjectType.STAGE_FILE
 
@@ -1,7 +1,9 @@
 from itertools import islice
 from re import compile
+from typing import Optional
 
 from snowddl.blueprint import TableBlueprint, TableColumn, DataType, BaseDataType, SchemaObjectIdent
+from snowddl.metadata_snapshot import SnowDDLMetadataSnapshot
 from snowddl.resolver.abc_schema_object_resolver import AbstractSchemaObjectResolver, ResolveResult, ObjectType
 
 cluster_by_syntax_re = compile(r'^(\w+)?\((.*)\)$')
@@ -9,16 +11,16 @@ collate_type_syntax_re = compile(r'^(.*) COLLATE \'(.*)\'$')
 
 
 class TableResolver(AbstractSchemaObjectResolver):
+    is_state_snapshot_supported = False
+    columns_snapshot: Optional[SnowDDLMetadataSnapshot] = None
+
     def get_object_type(self) -> ObjectType:
         return ObjectType.TABLE
 
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta("SHOW TABLES IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("TABLES", schema)
 
         for r in cur:
             # Skip external tables
@@ -45,14 +47,16 @@ class TableResolver(AbstractSchemaObjectResolver):
 
     def create_object(self, bp: TableBlueprint):
         query = self._build_create_table(bp)
-        self.engine.execute_safe_ddl(query)
 
-        if bp.search_optimization:
-            self.engine.execute_safe_ddl("ALTER TABLE {full_name:i} ADD SEARCH OPTIMIZATION", {
-                "full_name": bp.full_name,
-            })
+        with self.engine.async_ddl() as async_ddl:
+            self.engine.execute_safe_ddl(query)
+
+            if bp.search_optimization:
+                self.engine.execute_safe_ddl("ALTER TABLE {full_name:i} ADD SEARCH OPTIMIZATION", {
+                    "full_name": bp.full_name,
+                })
 
-        return ResolveResult.CREATE
+        return async_ddl.then(ResolveResult.CREATE)
 
     def compare_object(self, bp: TableBlueprint, row: dict):
         alters = []
@@ -221,22 +225,25 @@ class TableResolver(AbstractSchemaObjectResolver):
                 alters.append(self.engine.format("UNSET COMMENT"))
 
         if is_replace_required:
-            self.engine.execute_unsafe_ddl(self._build_create_table(bp, snow_cols), condition=self.engine.settings.execute_replace_table)
+            # CREATE OR REPLACE TABLE ... AS SELECT may run for a long time
+            with self.engine.async_ddl() as async_ddl:
+                self.engine.execute_unsafe_ddl(self._build_create_table(bp, snow_cols), condition=self.engine.settings.execute_replace_table)
 
-            if bp.search_optimization:
-                self.engine.execute_safe_ddl("ALTER TABLE {full_name:i} ADD SEARCH OPTIMIZATION", {
-                    "full_name": bp.full_name,
-                })
+                if bp.search_optimization:
+                    self.engine.execute_safe_ddl("ALTER TABLE {full_name:i} ADD SEARCH OPTIMIZATION", {
+                        "full_name": bp.full_name,
+                    })
 
-            return ResolveResult.REPLACE
+            return async_ddl.then(ResolveResult.REPLACE)
         elif alters:
-            for alter in alters:
-                self.engine.execute_unsafe_ddl("ALTER TABLE {full_name:i} {alter:r}", {
-                    "full_name": bp.full_name,
-                    "alter": alter,
-                })
+            with self.engine.async_ddl() as async_ddl:
+                for alter in alters:
+                    self.engine.execute_unsafe_ddl("ALTER TABLE {full_name:i} {alter:r}", {
+                        "full_name": bp.full_name,
+                        "alter": alter,
+                    })
 
-            return ResolveResult.ALTER
+            return async_ddl.then(ResolveResult.ALTER)
 
         return ResolveResult.NOCHANGE
 
@@ -249,12 +256,28 @@ class TableResolver(AbstractSchemaObjectResolver):
 
         return ResolveResult.DROP
 
+    def _pre_process(self):
+        # Columns of all tables in database are loaded by a single query instead of DESC TABLE for each table
+        self.columns_snapshot = SnowDDLMetadataSnapshot(self.engine)
+
+    def _post_process(self):
+        self.columns_snapshot = None
+
     def _get_existing_columns(self, bp: TableBlueprint):
         existing_columns = {}
+        cur = None
 
-        cur = self.engine.execute_meta("DESC TABLE {full_name:i}", {
-            "full_name": bp.full_name,
-        })
+        # DESC TABLE returns expressions of virtual columns exactly as they are compared with blueprint
+        # Columns snapshot is only used for tables without virtual columns both in blueprint and in existing table
+        if not any(c.expression for c in bp.columns):
+            cur = self.columns_snapshot.desc_table(str(bp.full_name.database_full_name), bp.full_name.schema, bp.full_name.name)
+
+        # DESC TABLE is also used if table was not found in snapshot (e.g. it was created by another session after snapshot was loaded)
+        # If SHOW COLUMNS output for database was truncated, virtual columns cannot be detected, so every table in database is described individually
+        if cur is None or any(r['expression'] for r in cur):
+            cur = self.engine.execute_meta("DESC TABLE {full_name:i}", {
+                "full_name": bp.full_name,
+            })
 
         for r in cur:
             m = collate_type_syntax_re.match(r['type'])
@@ -4,6 +4,7 @@ from snowddl.resolver.abc_schema_object_resolver import AbstractSchemaObjectReso
 
 class TagResolver(AbstractSchemaObjectResolver):
     skip_on_empty_blueprints = True
+    is_state_snapshot_supported = False
 
     def get_object_type(self) -> ObjectType:
         return ObjectType.TAG
@@ -11,10 +12,7 @@ class TagResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta("SHOW TAGS IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("TAGS", schema)
 
         for r in cur:
             full_name = f"{r['database_name']}.{r['schema_name']}.{r['name']}"
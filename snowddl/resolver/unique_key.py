@@ -10,10 +10,7 @@ class UniqueKeyResolver(AbstractSchemaObjectResolver):
         existing_objects = {}
         constraints_by_name = {}
 
-        cur = self.engine.execute_meta("SHOW UNIQUE KEYS IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("UNIQUE KEYS", schema)
 
         for r in cur:
             if r['constraint_name'] not in constraints_by_name:
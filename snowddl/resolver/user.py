@@ -5,6 +5,8 @@ from snowddl.resolver._utils import compare_dynamic_param_value
 
 
 class UserResolver(AbstractResolver):
+    is_state_snapshot_supported = False
+
     def get_object_type(self) -> ObjectType:
         return ObjectType.USER
 
@@ -5,16 +5,15 @@ from snowddl.resolver.abc_schema_object_resolver import AbstractSchemaObjectReso
 
 
 class ViewResolver(AbstractSchemaObjectResolver):
+    is_state_snapshot_supported = False
+
     def get_object_type(self) -> ObjectType:
         return ObjectType.VIEW
 
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta("SHOW VIEWS IN SCHEMA {database:i}.{schema:i}", {
-            "database": schema['database'],
-            "schema": schema['schema'],
-        })
+        cur = self.metadata_snapshot.show_in_schema("VIEWS", schema)
 
         for r in cur:
             if r['is_materialized'] == 'true':
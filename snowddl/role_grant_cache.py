@@ -0,0 +1,165 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from snowddl.blueprint import Grant, FutureGrant, ObjectType, build_grant_name_ident_snowflake
+from snowddl.error import SnowDDLExecuteError
+
+if TYPE_CHECKING:
+    from snowddl.engine import SnowDDLEngine
+
+
+class SnowDDLRoleGrantCache:
+    # Grants of all roles are loaded by a single query to ACCOUNT_USAGE view
+    # Future grants of all roles are loaded by a single SHOW command per schema
+    # ACCOUNT_USAGE view is updated with latency, roles created after the latest update must be processed individually
+    # Grants changed after the latest update are not visible, so view is not used at all if its latest change is older than max lag
+    def __init__(self, engine: "SnowDDLEngine"):
+        self.engine = engine
+
+        self.grants: Dict[str, List[Grant]] = {}
+        self.future_grants: Dict[str, List[FutureGrant]] = {}
+        self.invalid_roles = set()
+
+        self.watermark: Optional[datetime] = None
+        self.current_timestamp: Optional[datetime] = None
+        self.max_lag = timedelta(seconds=engine.settings.bulk_role_grants_max_lag)
+
+        self.is_available = False
+        self.is_loaded = False
+
+        self._lock = Lock()
+
+    def get_role_grants(self, role_name: str, role_created_on: datetime) -> Optional[Tuple[List[Grant], List[FutureGrant]]]:
+        with self._lock:
+            if not self.is_loaded:
+                self.reload()
+
+        if not self.is_available or role_name in self.invalid_roles:
+            return None
+
+        # Role was created after the latest update of ACCOUNT_USAGE view, grants might be missing
+        if self.watermark is None or role_created_on >= self.watermark:
+            return None
+
+        return self.grants.get(role_name, []), self.future_grants.get(role_name, [])
+
+    def reload(self):
+        self.invalid_roles = set()
+
+        try:
+            self.watermark, self.current_timestamp = self._load_watermark()
+
+            if self.watermark is None or self.current_timestamp - self.watermark > self.max_lag:
+                self.engine.logger.info(f"Latest change in ACCOUNT_USAGE.GRANTS_TO_ROLES [{self.watermark}] is older than max lag [{self.max_lag}], roles will be processed individually")
+                self.is_available = False
+                self.is_loaded = True
+
+                return
+
+            self.grants = self._load_grants()
+            self.future_grants = self._load_future_grants()
+        except SnowDDLExecuteError as e:
+            self.engine.logger.info(f"Could not load grants of all roles at once, roles will be processed individually: \n{e.verbose_message()}")
+            self.is_available = False
+        else:
+            self.is_available = True
+
+        self.is_loaded = True
+
+    def _load_watermark(self):
+        # Current timestamp is taken from the same query, so local clock does not matter
+        cur = self.engine.execute_meta("""
+            SELECT MAX(GREATEST(created_on, NVL(modified_on, created_on), NVL(deleted_on, created_on))) AS watermark
+                , CURRENT_TIMESTAMP() AS current_timestamp
+            FROM snowflake.account_usage.grants_to_roles
+        """)
+
+        r = cur.fetchone()
+
+        return r['WATERMARK'], r['CURRENT_TIMESTAMP']
+
+    def _load_grants(self):
+        grants = defaultdict(list)
+
+        cur = self.engine.execute_meta("""
+            SELECT grantee_name, privilege, granted_on, table_catalog, table_schema, name
+            FROM snowflake.account_usage.grants_to_roles
+            WHERE granted_to = 'ROLE'
+                AND deleted_on IS NULL
+                AND grantee_name LIKE {env_prefix:ls}
+            ORDER BY grantee_name, granted_on, table_catalog, table_schema, name, privilege
+        """, {
+            "env_prefix": self.engine.config.env_prefix,
+        })
+
+        for r in cur:
+            try:
+                object_type = ObjectType[str(r['GRANTED_ON']).replace(' ', '_')]
+            except KeyError:
+                # Unknown object type, role must be processed individually to get the same error as before
+                self.invalid_roles.add(r['GRANTEE_NAME'])
+                continue
+
+            # Snowflake bug: phantom MATERIALIZED VIEW when SEARCH OPTIMIZATION is enabled for table
+            if object_type == ObjectType.MATERIALIZED_VIEW and str(r['NAME']).endswith('IDX_MV_'):
+                continue
+
+            grants[r['GRANTEE_NAME']].append(Grant(
+                privilege=r['PRIVILEGE'],
+                on=object_type,
+                name=build_grant_name_ident_snowflake(self._build_grant_name(object_type, r), object_type),
+            ))
+
+        return grants
+
+    def _load_future_grants(self):
+        future_grants = defaultdict(list)
+
+        for schema_future_grants in self.engine.executor.map(self._load_schema_future_grants, self.engine.schema_cache.schemas.values()):
+            for role_name, future_grant in schema_future_grants:
+                # Unknown object type, role must be processed individually to get the same error as before
+                if future_grant is None:
+                    self.invalid_roles.add(role_name)
+                    continue
+
+                future_grants[role_name].append(future_grant)
+
+        return future_grants
+
+    def _load_schema_future_grants(self, schema: dict):
+        schema_future_grants = []
+
+        cur = self.engine.execute_meta("SHOW FUTURE GRANTS IN SCHEMA {database:i}.{schema:i}", {
+            "database": schema['database'],
+            "schema": schema['schema'],
+        })
+
+        for r in cur:
+            if r['grant_to'] != 'ROLE':
+                continue
+
+            try:
+                object_type = ObjectType[r['grant_on']]
+            except KeyError:
+                schema_future_grants.append((r['grantee_name'], None))
+                continue
+
+            schema_future_grants.append((r['grantee_name'], FutureGrant(
+                privilege=r['privilege'],
+                on=object_type,
+                name=build_grant_name_ident_snowflake(r['name'], object_type),
+            )))
+
+        return schema_future_grants
+
+    def _build_grant_name(self, object_type: ObjectType, r):
+        # Build name in the same format as SHOW GRANTS output
+        if object_type == ObjectType.SCHEMA:
+            return f"{r['TABLE_CATALOG']}.{r['NAME']}"
+
+        if r['TABLE_CATALOG'] and r['TABLE_SCHEMA']:
+            return f"{r['TABLE_CATALOG']}.{r['TABLE_SCHEMA']}.{r['NAME']}"
+
+        return r['NAME']
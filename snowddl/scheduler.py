@@ -0,0 +1,114 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from snowddl.engine import SnowDDLEngine
+    from snowddl.resolver import AbstractResolver
+
+
+class SnowDDLResolverScheduler:
+    # Resolver starts as soon as all resolvers it depends on are finished
+    # Dependencies on resolvers which are not present in sequence are replaced with their own dependencies
+    # Resolvers only coordinate work, individual objects are processed by shared engine executor
+    # Statements are written in sequence order, statements of resolvers running ahead are held by engine until preceding resolvers are finished
+    def __init__(self, engine: "SnowDDLEngine", resolver_sequence: List[Type["AbstractResolver"]], resolver_dependencies: Dict[Type["AbstractResolver"], List[Type["AbstractResolver"]]]):
+        self.engine = engine
+        self.resolver_sequence = resolver_sequence
+        self.resolver_dependencies = resolver_dependencies
+
+        self.resolvers: List["AbstractResolver"] = []
+
+    def resolve(self):
+        remaining_dependencies = {}
+        dependents = {resolver_cls: [] for resolver_cls in self.resolver_sequence}
+
+        for idx, resolver_cls in enumerate(self.resolver_sequence):
+            if resolver_cls in self.resolver_dependencies:
+                remaining_dependencies[resolver_cls] = self._get_dependencies_in_sequence(resolver_cls)
+            else:
+                # Unknown resolver waits for all preceding resolvers
+                remaining_dependencies[resolver_cls] = set(self.resolver_sequence[:idx])
+
+            for dependency_cls in remaining_dependencies[resolver_cls]:
+                dependents[dependency_cls].append(resolver_cls)
+
+        ready = [resolver_cls for resolver_cls in self.resolver_sequence if not remaining_dependencies[resolver_cls]]
+        futures = {}
+        first_exception = None
+
+        output_queue = deque(self.resolver_sequence)
+        finished = set()
+
+        for resolver_cls in self.resolver_sequence[1:]:
+            self.engine.hold_ddl(resolver_cls.__name__)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.engine.settings.max_resolvers, thread_name_prefix=self.__class__.__name__) as executor:
+                while ready or futures:
+                    # Stop starting new resolvers after the first unexpected exception
+                    while ready and first_exception is None:
+                        resolver_cls = ready.pop(0)
+                        resolver = resolver_cls(self.engine)
+
+                        self.resolvers.append(resolver)
+                        futures[executor.submit(resolver.resolve)] = resolver_cls
+
+                    if not futures:
+                        break
+
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                    for f in done:
+                        resolver_cls = futures.pop(f)
+                        finished.add(resolver_cls)
+
+                        if f.exception() is not None:
+                            if first_exception is None:
+                                first_exception = f.exception()
+
+                            continue
+
+                        for dependent_cls in dependents[resolver_cls]:
+                            remaining_dependencies[dependent_cls].discard(resolver_cls)
+
+                            if not remaining_dependencies[dependent_cls]:
+                                ready.append(dependent_cls)
+
+                    # Keep original sequence order for resolvers which became ready at the same time
+                    ready.sort(key=self.resolver_sequence.index)
+
+                    self._release_ddl(output_queue, finished)
+        finally:
+            # Statements of resolvers which were not finished are written as well
+            for resolver_cls in output_queue:
+                self.engine.release_ddl(resolver_cls.__name__)
+
+        if first_exception is not None:
+            raise first_exception
+
+    def _release_ddl(self, output_queue, finished):
+        # Statements of the first unfinished resolver in sequence are written as soon as they are flushed
+        while output_queue:
+            self.engine.release_ddl(output_queue[0].__name__)
+
+            if output_queue[0] not in finished:
+                break
+
+            output_queue.popleft()
+
+    def _get_dependencies_in_sequence(self, resolver_cls):
+        dependencies = set()
+
+        for dependency_cls in self.resolver_dependencies.get(resolver_cls, []):
+            if dependency_cls in self.resolver_sequence:
+                dependencies.add(dependency_cls)
+            else:
+                # Resolver is missing in sequence, inherit its dependencies instead
+                dependencies.update(self._get_dependencies_in_sequence(dependency_cls))
+
+        return dependencies
+
+    @property
+    def error_count(self):
+        return sum(len(resolver.errors) for resolver in self.resolvers)
@@ -16,8 +16,9 @@ class SnowDDLSchemaCache:
         self.reload()
 
     def reload(self):
-        self.databases = {}
-        self.schemas = {}
+        # Build new dicts first and replace them at once, other resolvers may read cache in parallel
+        databases = {}
+        schemas = {}
 
         cur = self.engine.execute_meta("SHOW DATABASES LIKE {env_prefix:ls}", {
             'env_prefix': self.engine.config.env_prefix,
@@ -37,7 +38,7 @@ class SnowDDLSchemaCache:
             and Ident(r['name']) not in self.engine.settings.include_databases:
                 continue
 
-            self.databases[r['name']] = {
+            databases[r['name']] = {
                 "database": r['name'],
                 "owner": r['owner'],
                 "comment": r['comment'] if r['comment'] else None,
@@ -46,8 +47,19 @@ class SnowDDLSchemaCache:
             }
 
         # Process schemas in parallel
-        for database_schemas in self.engine.executor.map(self._get_database_schemas, self.databases):
-            self.schemas.update(database_schemas)
+        for database_schemas in self.engine.executor.map(self._get_database_schemas, databases):
+            schemas.update(database_schemas)
+
+        self.databases = databases
+        self.schemas = schemas
+
+    def schemas_by_database(self):
+        schemas_by_database = {}
+
+        for schema in self.schemas.values():
+            schemas_by_database.setdefault(schema['database'], []).append(schema)
+
+        return schemas_by_database
 
     def _get_database_schemas(self, database_name):
         schemas = {}
@@ -1,8 +1,12 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from snowddl.blueprint import DatabaseIdent, ObjectType
 
+if TYPE_CHECKING:
+    from snowddl.change_scope import SnowDDLChangeScope
+
+
 @dataclass
 class SnowDDLSettings:
     execute_safe_ddl: bool = False
@@ -22,3 +26,10 @@ class SnowDDLSettings:
     include_databases: List[DatabaseIdent] = field(default_factory=list)
     ignore_ownership: bool = False
     max_workers: int = 8
+    max_resolvers: int = 1
+    bulk_role_grants: bool = False
+    bulk_role_grants_max_lag: int = 900
+    async_ddl: bool = False
+    adaptive_concurrency: bool = False
+    concurrency_limits: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    change_scope: Optional["SnowDDLChangeScope"] = None
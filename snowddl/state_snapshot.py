@@ -0,0 +1,81 @@
+from hashlib import sha1
+from json import dumps, loads
+from os import replace
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Dict, List, TYPE_CHECKING
+
+from snowddl.version import __version__
+
+if TYPE_CHECKING:
+    from snowddl.blueprint import AbstractBlueprint
+    from snowddl.engine import SnowDDLEngine
+
+
+class SnowDDLStateSnapshot:
+    # Snapshot remembers objects which had no changes during previous runs
+    # Object is compared again only if its blueprint or its row in SHOW output has changed since then
+    # Snapshot is discarded if it was created for another account, user, role, env prefix or version
+    def __init__(self, engine: "SnowDDLEngine", path: Path):
+        self.engine = engine
+        self.path = path
+        self.fingerprint = self._build_fingerprint()
+
+        self.objects: Dict[str, Dict[str, List[str]]] = {}
+        self.hit_count = 0
+
+        self._lock = Lock()
+
+    def load(self):
+        try:
+            data = loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+
+        if data.get('fingerprint') == self.fingerprint:
+            self.objects = data.get('objects', {})
+
+    def save(self):
+        data = dumps({
+            "fingerprint": self.fingerprint,
+            "objects": self.objects,
+        })
+
+        # Write to temporary file and rename it, so snapshot is never left incomplete
+        with NamedTemporaryFile('w', encoding='utf-8', dir=self.path.parent, suffix='.tmp', delete=False) as f:
+            f.write(data)
+
+        replace(f.name, self.path)
+
+    def is_unchanged(self, resolver_name: str, full_name: str, bp: "AbstractBlueprint", row: Dict):
+        with self._lock:
+            is_unchanged = self.objects.get(resolver_name, {}).get(full_name) == [self._hash(bp), self._hash(row)]
+
+            if is_unchanged:
+                self.hit_count += 1
+
+            return is_unchanged
+
+    def record(self, resolver_name: str, full_name: str, bp: "AbstractBlueprint", row: Dict):
+        with self._lock:
+            self.objects.setdefault(resolver_name, {})[full_name] = [self._hash(bp), self._hash(row)]
+
+    def forget(self, resolver_name: str, full_name: str):
+        with self._lock:
+            self.objects.get(resolver_name, {}).pop(full_name, None)
+
+    def _build_fingerprint(self):
+        context = self.engine.context
+
+        return self._hash([
+            __version__,
+            context.version,
+            self.engine.config.env_prefix,
+            context.current_user,
+            context.original_role,
+        ])
+
+    def _hash(self, obj):
+        # Blueprints and rows are plain data, repr() includes all values and is stable between runs
+        return sha1(repr(obj).encode('utf-8')).hexdigest()
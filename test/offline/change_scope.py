@@ -0,0 +1,72 @@
+from pathlib import Path
+
+from snowddl.change_scope import SnowDDLChangeScope
+
+
+def test_change_scope_schema_params(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+
+    scope = SnowDDLChangeScope(config)
+    assert scope.add_config_file(Path("snowddl_db/bookings/params.yaml"))
+    scope.add_dependent_objects()
+
+    # Schema and roles derived from schema
+    assert scope.is_in_scope("SNOWDDL_DB.BOOKINGS")
+    assert scope.is_in_scope("SNOWDDL_DB__BOOKINGS__OWNER__S_ROLE")
+    assert scope.is_in_scope("SNOWDDL_DB__BOOKINGS__READ__S_ROLE")
+    assert scope.is_in_scope("SNOWDDL_DB__BOOKINGS__WRITE__S_ROLE")
+
+    # Business roles granted schema roles and users granted business roles
+    assert scope.is_in_scope("BOOKINGS_ANALYST__B_ROLE")
+    assert scope.is_in_scope("ETL_SCRIPT__B_ROLE")
+
+    # Objects of other schemas
+    assert not scope.is_in_scope("SNOWDDL_DB__SAKILA__READ__S_ROLE")
+    assert not scope.is_schema_in_scope("SNOWDDL_DB", "SAKILA")
+
+
+def test_change_scope_schema_params_with_env_prefix(offline_helper):
+    config = offline_helper.load_config("sample01_01", "test")
+
+    scope = SnowDDLChangeScope(config)
+    assert scope.add_config_file(Path("snowddl_db/bookings/params.yaml"))
+    scope.add_dependent_objects()
+
+    assert scope.is_in_scope("TEST__SNOWDDL_DB__BOOKINGS__READ__S_ROLE")
+    assert scope.is_in_scope("TEST__BOOKINGS_ANALYST__B_ROLE")
+
+
+def test_change_scope_database_params(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+
+    scope = SnowDDLChangeScope(config)
+    assert scope.add_config_file(Path("snowddl_db/params.yaml"))
+    scope.add_dependent_objects()
+
+    # Schemas inherit database params, so all schemas and their roles are in scope
+    assert scope.is_in_scope("SNOWDDL_DB")
+    assert scope.is_in_scope("SNOWDDL_DB.BOOKINGS")
+    assert scope.is_in_scope("SNOWDDL_DB__BOOKINGS__READ__S_ROLE")
+    assert scope.is_in_scope("BOOKINGS_ANALYST__B_ROLE")
+
+
+def test_change_scope_table(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+
+    scope = SnowDDLChangeScope(config)
+    assert scope.add_config_file(Path("snowddl_db/bookings/table/bookings.yaml"))
+    scope.add_dependent_objects()
+
+    assert scope.is_in_scope("SNOWDDL_DB.BOOKINGS.BOOKINGS")
+    assert scope.is_schema_in_scope("SNOWDDL_DB", "BOOKINGS")
+
+    # Schema roles are not changed by schema objects
+    assert not scope.is_in_scope("SNOWDDL_DB__BOOKINGS__READ__S_ROLE")
+
+
+def test_change_scope_account_file(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+
+    # Account-level config files are not mapped to specific objects
+    scope = SnowDDLChangeScope(config)
+    assert not scope.add_config_file(Path("business_role.yaml"))
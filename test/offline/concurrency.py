@@ -0,0 +1,58 @@
+from threading import Lock
+from time import monotonic
+
+from snowddl.emulator import SnowDDLEmulatorCursor
+from snowddl.engine import SnowDDLEngine
+from snowddl.resolver import default_resolver_dependencies, default_resolver_sequence
+from snowddl.scheduler import SnowDDLResolverScheduler
+from snowddl.settings import SnowDDLSettings
+
+
+def test_async_ddl_holds_concurrency_slot(offline_helper, monkeypatch):
+    config = offline_helper.load_config("sample01_01")
+    catalog = offline_helper.create_catalog()
+
+    # Async statements are still running after worker thread returned, slot must be held until completion
+    latency = {"CREATE": 0.02, "ALTER": 0.02}
+    connections = []
+    max_running = [0]
+    lock = Lock()
+
+    def connect():
+        connection = catalog.connect(latency)
+        connections.append(connection)
+
+        return connection
+
+    original_execute_async = SnowDDLEmulatorCursor.execute_async
+
+    def execute_async(cur, sql, **kwargs):
+        with lock:
+            result = original_execute_async(cur, sql, **kwargs)
+            running = sum(1 for c in connections for ready_at, _ in c.async_queries.values() if ready_at > monotonic())
+            max_running[0] = max(max_running[0], running)
+
+        return result
+
+    monkeypatch.setattr(SnowDDLEmulatorCursor, "execute_async", execute_async)
+
+    settings = SnowDDLSettings(
+        execute_safe_ddl=True,
+        execute_unsafe_ddl=True,
+        async_ddl=True,
+        adaptive_concurrency=True,
+        concurrency_limits={"DDL": (2, 2)},
+    )
+
+    with SnowDDLEngine(connect(), config, settings, connection_factory=connect) as engine:
+        scheduler = SnowDDLResolverScheduler(engine, default_resolver_sequence, default_resolver_dependencies)
+        scheduler.resolve()
+
+        assert scheduler.error_count == 0
+        assert 0 < max_running[0] <= 2
+        assert all(limit.in_flight == 0 for limit in engine.concurrency.limits.values())
+
+    error_count, _, suggested_ddl = offline_helper.resolve(catalog, config, False)
+
+    assert error_count == 0
+    assert not any(sql.startswith("CREATE ") and " TABLE " in sql for sql in suggested_ddl)
@@ -0,0 +1,56 @@
+from pathlib import Path
+from pytest import fixture
+
+from snowddl.config import SnowDDLConfig
+from snowddl.emulator import SnowDDLEmulatorCatalog
+from snowddl.engine import SnowDDLEngine
+from snowddl.parser import default_parser_sequence, ParseCache, PlaceholderParser
+from snowddl.resolver import default_resolver_dependencies, default_resolver_sequence
+from snowddl.scheduler import SnowDDLResolverScheduler
+from snowddl.settings import SnowDDLSettings
+
+
+class OfflineHelper:
+    # Tests in this directory do not need Snowflake account, sample configs are parsed from package
+    SAMPLE_CONFIG_PATH = Path(__file__).resolve().parents[2] / 'snowddl' / '_config'
+
+    def config_path(self, name):
+        return self.SAMPLE_CONFIG_PATH / name
+
+    def load_config(self, name, env_prefix=None, parse_cache_path=None):
+        config = SnowDDLConfig(env_prefix)
+        config_path = self.config_path(name)
+
+        PlaceholderParser(config, config_path).load_placeholders()
+
+        if parse_cache_path:
+            config.parse_cache = ParseCache(parse_cache_path, config.placeholders)
+
+        for parser_cls in default_parser_sequence:
+            parser = parser_cls(config, config_path)
+            parser.load_blueprints()
+
+        assert not config.errors
+
+        return config
+
+    def create_catalog(self):
+        return SnowDDLEmulatorCatalog()
+
+    def create_engine(self, catalog, config, **settings):
+        return SnowDDLEngine(catalog.connect(), config, SnowDDLSettings(**settings), connection_factory=catalog.connect)
+
+    def resolve(self, catalog, config, is_apply, **settings):
+        # Returns number of errors, executed DDL and suggested DDL
+        with self.create_engine(catalog, config, execute_safe_ddl=is_apply, execute_unsafe_ddl=is_apply, **settings) as engine:
+            scheduler = SnowDDLResolverScheduler(engine, default_resolver_sequence, default_resolver_dependencies)
+            scheduler.resolve()
+
+            engine.flush_ddl_buffers()
+
+            return scheduler.error_count, engine.executed_ddl, engine.suggested_ddl
+
+
+@fixture(scope="session")
+def offline_helper():
+    return OfflineHelper()
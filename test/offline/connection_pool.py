@@ -0,0 +1,38 @@
+def _show_databases(connection):
+    cur = connection.cursor()
+    cur.execute("SHOW DATABASES")
+
+    return connection
+
+
+def test_replace_expired_primary_connection(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+
+    with offline_helper.create_engine(offline_helper.create_catalog(), config) as engine:
+        expired = engine.connection
+        expired.expire()
+
+        connection = engine.connection_pool.run(_show_databases)
+
+        # Expired session is closed, engine uses the same primary connection as pool
+        assert connection is not expired
+        assert expired.is_closed()
+        assert engine.connection is connection
+        assert engine.connection_pool.run(_show_databases) is connection
+
+
+def test_replace_expired_pooled_connection(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+
+    # Single worker thread, both tasks use the same pooled session
+    with offline_helper.create_engine(offline_helper.create_catalog(), config, max_workers=1) as engine:
+        expired = engine.executor.submit(engine.connection_pool.get_connection).result()
+        expired.expire()
+
+        connection = engine.executor.submit(engine.connection_pool.run, _show_databases).result()
+
+        assert connection is not expired
+        assert expired.is_closed()
+        assert expired not in engine.connection_pool.pooled_connections
+        assert connection in engine.connection_pool.pooled_connections
+        assert engine.connection is not connection
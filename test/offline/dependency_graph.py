@@ -0,0 +1,172 @@
+from random import Random
+
+from snowddl.resolver._dependency_graph import sort_by_dependencies, find_cycles
+
+
+def _sort_by_batches(dependencies):
+    # Previous implementation, each batch contains nodes with all dependencies in previous batches
+    remaining = dict(dependencies)
+    allocated = set()
+    levels = {}
+    level = 0
+
+    while remaining:
+        batch = [node for node, predecessors in remaining.items() if all(p in allocated for p in predecessors)]
+
+        for node in batch:
+            del remaining[node]
+            levels[node] = level
+
+        allocated.update(batch)
+        level += 1
+
+    return levels
+
+
+def _get_nodes_in_cycles(dependencies):
+    # Node is in cycle if it can be reached from itself
+    nodes_in_cycles = set()
+
+    for node in dependencies:
+        reachable = set()
+        stack = list(dependencies[node])
+
+        while stack:
+            predecessor = stack.pop()
+
+            if predecessor not in reachable:
+                reachable.add(predecessor)
+                stack.extend(dependencies[predecessor])
+
+        if node in reachable:
+            nodes_in_cycles.add(node)
+
+    return nodes_in_cycles
+
+
+def _flush_order(levels):
+    # Same order as tasks of resolver
+    return sorted(levels, key=lambda n: (levels[n], n))
+
+
+def test_sort_chain():
+    levels, cycles = sort_by_dependencies({
+        "C": ["B"],
+        "B": ["A"],
+        "A": [],
+    })
+
+    assert levels == {"A": 0, "B": 1, "C": 2}
+    assert cycles == []
+
+
+def test_sort_longest_chain():
+    # Level is the length of the longest chain, not the shortest one
+    levels, cycles = sort_by_dependencies({
+        "D": ["A", "C"],
+        "C": ["B"],
+        "B": ["A"],
+        "A": [],
+    })
+
+    assert levels == {"A": 0, "B": 1, "C": 2, "D": 3}
+    assert cycles == []
+
+
+def test_flush_order_by_level_and_name():
+    levels, cycles = sort_by_dependencies({
+        "Z": [],
+        "Y": ["Z"],
+        "B": ["Y"],
+        "A": [],
+        "X": ["A", "Z"],
+        "C": [],
+    })
+
+    assert levels == {"A": 0, "C": 0, "Z": 0, "X": 1, "Y": 1, "B": 2}
+    assert _flush_order(levels) == ["A", "C", "Z", "X", "Y", "B"]
+
+
+def test_sort_same_levels_as_batches():
+    rnd = Random(5)
+
+    for _ in range(500):
+        names = [f"N{i}" for i in range(rnd.randint(1, 30))]
+        dependencies = {name: rnd.sample(names[:i], rnd.randint(0, min(i, 3))) for i, name in enumerate(names)}
+
+        # Order of input must not matter
+        items = list(dependencies.items())
+        rnd.shuffle(items)
+        dependencies = dict(items)
+
+        levels, cycles = sort_by_dependencies(dependencies)
+
+        assert cycles == []
+        assert levels == _sort_by_batches(dependencies)
+
+
+def test_sort_cycles():
+    levels, cycles = sort_by_dependencies({
+        "A": ["B"],
+        "B": ["A"],
+        "C": ["A"],
+        "D": ["D"],
+        "E": ["C", "F"],
+        "F": [],
+        "G": ["H"],
+        "H": ["I"],
+        "I": ["G", "C"],
+    })
+
+    assert cycles == [["A", "B"], ["D"], ["G", "H", "I"]]
+
+    # Nodes depending on cycles are sorted as if cycles did not exist
+    assert levels == {"C": 0, "F": 0, "E": 1}
+    assert _flush_order(levels) == ["C", "F", "E"]
+
+
+def test_sort_dependents_of_cycles():
+    levels, cycles = sort_by_dependencies({
+        "A": ["B"],
+        "B": ["A"],
+        "C": [],
+        "D": ["A", "C"],
+        "E": ["D"],
+    })
+
+    assert cycles == [["A", "B"]]
+    assert levels == {"C": 0, "D": 1, "E": 2}
+
+
+def test_find_cycles_random():
+    rnd = Random(5)
+
+    for _ in range(500):
+        names = [f"N{i}" for i in range(rnd.randint(1, 12))]
+        dependencies = {name: rnd.sample(names, rnd.randint(0, min(2, len(names)))) for name in names}
+
+        levels, cycles = sort_by_dependencies(dependencies)
+        nodes_in_cycles = _get_nodes_in_cycles(dependencies)
+
+        assert {node for cycle in cycles for node in cycle} == nodes_in_cycles
+        assert set(levels) == set(names) - nodes_in_cycles
+
+        for node, level in levels.items():
+            for predecessor in dependencies[node]:
+                if predecessor in levels:
+                    assert levels[predecessor] < level
+
+
+def test_find_cycles_without_recursion():
+    # Long chains must not hit recursion limit
+    size = 100000
+
+    levels, cycles = sort_by_dependencies({f"N{i}": [f"N{i - 1}"] if i else [] for i in range(size)})
+
+    assert cycles == []
+    assert levels[f"N{size - 1}"] == size - 1
+
+    cycles = find_cycles({f"N{i}": [f"N{(i + 1) % size}"] for i in range(size)})
+
+    assert len(cycles) == 1
+    assert len(cycles[0]) == size
@@ -0,0 +1,124 @@
+from pathlib import Path
+from re import compile
+
+from snowddl.change_scope import SnowDDLChangeScope
+
+# Emulator does not keep functions, procedures, table constraints and users, such statements are suggested on every run
+not_emulated_re = compile(r'\b(FUNCTION|PROCEDURE|PRIMARY KEY|FOREIGN KEY|UNIQUE)\b|^CREATE USER\b|\bTO USER\b')
+
+
+def _emulated(statements):
+    return [sql for sql in statements if not not_emulated_re.search(sql)]
+
+
+def test_plan_does_not_change_catalog(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+    catalog = offline_helper.create_catalog()
+
+    error_count, executed_ddl, suggested_ddl = offline_helper.resolve(catalog, config, False)
+
+    # Only context statements are executed during plan
+    assert error_count == 0
+    assert all(sql.startswith("USE ") for sql in executed_ddl)
+    assert _emulated(suggested_ddl)
+
+    # Nothing was applied, so the same statements are suggested again
+    assert offline_helper.resolve(catalog, config, False)[2] == suggested_ddl
+
+
+def test_apply_converges(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+    catalog = offline_helper.create_catalog()
+
+    error_count, executed_ddl, suggested_ddl = offline_helper.resolve(catalog, config, True)
+
+    assert error_count == 0
+    assert _emulated(executed_ddl)
+    assert suggested_ddl == []
+
+    error_count, executed_ddl, suggested_ddl = offline_helper.resolve(catalog, config, False)
+
+    assert error_count == 0
+    assert _emulated(suggested_ddl) == []
+
+
+def test_apply_changes_converge(offline_helper):
+    catalog = offline_helper.create_catalog()
+
+    error_count, _, _ = offline_helper.resolve(catalog, offline_helper.load_config("sample01_01"), True)
+    assert error_count == 0
+
+    config = offline_helper.load_config("sample01_02")
+
+    # Second config alters, replaces and revokes objects created by first config
+    error_count, executed_ddl, suggested_ddl = offline_helper.resolve(catalog, config, False)
+
+    assert error_count == 0
+    assert any(sql.startswith("ALTER TABLE ") for sql in _emulated(suggested_ddl))
+    assert any(sql.startswith("CREATE OR REPLACE VIEW ") for sql in _emulated(suggested_ddl))
+    assert any(sql.startswith("REVOKE ") for sql in _emulated(suggested_ddl))
+
+    error_count, executed_ddl, suggested_ddl = offline_helper.resolve(catalog, config, True)
+
+    assert error_count == 0
+    assert _emulated(executed_ddl)
+
+    error_count, executed_ddl, suggested_ddl = offline_helper.resolve(catalog, config, False)
+
+    assert error_count == 0
+    assert _emulated(suggested_ddl) == []
+
+
+def test_apply_with_env_prefix_converges(offline_helper):
+    config = offline_helper.load_config("sample01_01", "test")
+    catalog = offline_helper.create_catalog()
+
+    error_count, executed_ddl, _ = offline_helper.resolve(catalog, config, True)
+
+    assert error_count == 0
+    assert all('"SNOWDDL_DB"' not in sql for sql in executed_ddl)
+
+    error_count, _, suggested_ddl = offline_helper.resolve(catalog, config, False)
+
+    assert error_count == 0
+    assert _emulated(suggested_ddl) == []
+
+
+def test_parallel_resolvers_same_output(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+
+    results = [offline_helper.resolve(offline_helper.create_catalog(), config, True, max_resolvers=max_resolvers) for max_resolvers in (1, 4)]
+
+    # Statements are written in sequence order regardless of number of resolvers running in parallel
+    assert results[0][0] == results[1][0] == 0
+    assert results[0][1] == results[1][1]
+
+
+def test_change_scope_limits_plan(offline_helper):
+    catalog = offline_helper.create_catalog()
+
+    error_count, _, _ = offline_helper.resolve(catalog, offline_helper.load_config("sample01_01"), True)
+    assert error_count == 0
+
+    config = offline_helper.load_config("sample01_02")
+
+    change_scope = SnowDDLChangeScope(config)
+    assert change_scope.add_config_file(Path("snowddl_db/sakila/table/actor.yaml"))
+    change_scope.add_dependent_objects()
+
+    error_count, _, suggested_ddl = offline_helper.resolve(catalog, config, False, change_scope=change_scope)
+
+    assert error_count == 0
+    assert any(sql.startswith('ALTER TABLE "SNOWDDL_DB"."SAKILA"."ACTOR"') for sql in suggested_ddl)
+
+    # Changes of tables, warehouses and users outside of scope are not compared
+    assert not any('"BOOKINGS"' in sql or 'WAREHOUSE' in sql or 'USER' in sql for sql in suggested_ddl)
+
+    # Full plan after scoped apply still finds remaining changes
+    offline_helper.resolve(catalog, config, True, change_scope=change_scope)
+
+    error_count, _, suggested_ddl = offline_helper.resolve(catalog, config, False)
+
+    assert error_count == 0
+    assert not any(sql.startswith('ALTER TABLE "SNOWDDL_DB"."SAKILA"."ACTOR"') for sql in _emulated(suggested_ddl))
+    assert any('"BOOKINGS"' in sql for sql in _emulated(suggested_ddl))
@@ -0,0 +1,95 @@
+from string import Formatter
+
+from pytest import raises
+
+from snowddl.blueprint import AccountObjectIdent, BaseDataType, SchemaObjectIdent, SchemaObjectIdentWithArgs
+from snowddl.formatter import SnowDDLFormatter
+
+
+def _vformat(formatter, sql, params):
+    # Reference output, template is parsed on every call
+    return Formatter.vformat(formatter, str(sql), [], params)
+
+
+format_cases = [
+    ("SELECT {a}", {"a": "it's"}),
+    ("SELECT {a:s}, {b:d}, {c:f}, {d:b}", {"a": None, "b": -10, "c": "1.5e+10", "d": True}),
+    ("SELECT {a}", {"a": ["x", "y"]}),
+    ("DROP TABLE {name:i}", {"name": SchemaObjectIdent("TEST__", "DB", "SC", "T1")}),
+    ("SHOW GRANTS TO ROLE {name:i}", {"name": 'ROLE"1'}),
+    ("DROP FUNCTION {name:i}", {"name": SchemaObjectIdentWithArgs("", "DB", "SC", "F", [BaseDataType.NUMBER, BaseDataType.VARCHAR])}),
+    ("COMMENT ON FUNCTION {name:in} IS {comment}", {"name": SchemaObjectIdentWithArgs("", "DB", "SC", "F", [BaseDataType.NUMBER]), "comment": "c"}),
+    ("USE WAREHOUSE {name:i}", {"name": AccountObjectIdent("", "WH")}),
+    ("GRANT {privileges:r} ON {names:i}", {"privileges": "SELECT, INSERT", "names": ["A", "B"]}),
+    ("SHOW ROLES LIKE {a:lf}, {b:ls}, {c:le}, {d:lse}", {"a": "A_B", "b": "A%", "c": "B", "d": ("A", "B")}),
+    ("CALL P({a:dp})", {"a": "x"}),
+    ("SELECT '{{literal}}', {a}", {"a": 1}),
+    ("SELECT {a}{a}{b}", {"a": 1, "b": 2}),
+    ("SELECT {a.name}", {"a": AccountObjectIdent("", "WH")}),
+    ("SELECT {a[0]:i}", {"a": ["X"]}),
+    ("SELECT 1", {"a": 1}),
+    ("", {"a": 1}),
+]
+
+
+format_error_cases = [
+    ("SELECT {a:unknown}", {"a": 1}),
+    ("SELECT {a!r}", {"a": 1}),
+    ("SELECT {a:{spec}}", {"a": "x", "spec": "i"}),
+    ("SELECT {a}", {"a": []}),
+    ("SELECT {a:d}", {"a": "1; DROP TABLE T"}),
+    ("SELECT {a:i}", {"a": ""}),
+    ("SELECT {a}", {"b": 1}),
+]
+
+
+def test_format_same_as_vformat():
+    formatter = SnowDDLFormatter()
+
+    for sql, params in format_cases:
+        # Second call uses compiled template from cache
+        assert formatter.format_sql(sql, params) == _vformat(formatter, sql, params)
+        assert formatter.format_sql(sql, params) == _vformat(formatter, sql, params)
+
+
+def test_format_errors_same_as_vformat():
+    formatter = SnowDDLFormatter()
+
+    for sql, params in format_error_cases:
+        with raises(Exception) as e:
+            _vformat(formatter, sql, params)
+
+        with raises(e.type):
+            formatter.format_sql(sql, params)
+
+
+def test_format_without_params():
+    formatter = SnowDDLFormatter()
+
+    assert formatter.format_sql("SELECT '{a}'") == "SELECT '{a}'"
+    assert formatter.format_sql(SchemaObjectIdent("", "DB", "SC", "T")) == str(SchemaObjectIdent("", "DB", "SC", "T"))
+
+
+def test_format_statements_same_as_vformat(offline_helper, monkeypatch):
+    # All templates and params used by resolvers while sample config is applied and changed
+    calls = []
+    format_sql = SnowDDLFormatter.format_sql
+
+    def format_sql_and_record(self, sql, params=None):
+        calls.append((self, sql, params))
+        return format_sql(self, sql, params)
+
+    monkeypatch.setattr(SnowDDLFormatter, "format_sql", format_sql_and_record)
+
+    catalog = offline_helper.create_catalog()
+
+    for name in ("sample01_01", "sample01_02"):
+        offline_helper.resolve(catalog, offline_helper.load_config(name), True)
+
+    monkeypatch.undo()
+
+    calls = [(formatter, sql, params) for formatter, sql, params in calls if params]
+    assert len(calls) > 1000
+
+    for formatter, sql, params in calls:
+        assert formatter.format_sql(sql, params) == _vformat(formatter, sql, params)
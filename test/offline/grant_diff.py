@@ -0,0 +1,143 @@
+from random import Random
+
+from snowddl.blueprint import AccountObjectIdent, BaseDataType, DatabaseIdent, FutureGrant, Grant, ObjectType, SchemaIdent, SchemaObjectIdent, SchemaObjectIdentWithArgs
+from snowddl.resolver._grant_diff import GrantDiff, covering_future_grant_key, diff_grants, grant_key
+
+
+def _grant_to_future_grant(grant):
+    # Previous implementation, new future grant was built for each existing grant
+    if not grant.on.is_future_grant_supported:
+        return None
+
+    return FutureGrant(
+        privilege=grant.privilege,
+        on=grant.on,
+        name=SchemaIdent(grant.name.env_prefix, grant.name.database, grant.name.schema) if isinstance(grant.name, SchemaObjectIdent) else grant.name
+    )
+
+
+def _diff_grants_nested(bp_grants, existing_grants, bp_future_grants, existing_future_grants):
+    # Previous implementation, nested scans of lists
+    return GrantDiff(
+        create_grants=[g for g in bp_grants if g not in existing_grants],
+        drop_grants=[g for g in existing_grants if g not in bp_grants and _grant_to_future_grant(g) not in bp_future_grants],
+        create_future_grants=[g for g in bp_future_grants if g not in existing_future_grants],
+        drop_future_grants=[g for g in existing_future_grants if g not in bp_future_grants],
+    )
+
+
+table_a = Grant("SELECT", ObjectType.TABLE, SchemaObjectIdent("", "DB", "SC", "A"))
+table_b = Grant("SELECT", ObjectType.TABLE, SchemaObjectIdent("", "DB", "SC", "B"))
+table_other_schema = Grant("SELECT", ObjectType.TABLE, SchemaObjectIdent("", "DB", "OTHER", "A"))
+table_insert = Grant("INSERT", ObjectType.TABLE, SchemaObjectIdent("", "DB", "SC", "A"))
+view_a = Grant("SELECT", ObjectType.VIEW, SchemaObjectIdent("", "DB", "SC", "A"))
+function_a = Grant("USAGE", ObjectType.FUNCTION, SchemaObjectIdentWithArgs("", "DB", "SC", "F", [BaseDataType.NUMBER, BaseDataType.VARCHAR]))
+function_b = Grant("USAGE", ObjectType.FUNCTION, SchemaObjectIdentWithArgs("", "DB", "SC", "F", [BaseDataType.NUMBER]))
+schema_sc = Grant("USAGE", ObjectType.SCHEMA, SchemaIdent("", "DB", "SC"))
+database_db = Grant("USAGE", ObjectType.DATABASE, DatabaseIdent("", "DB"))
+warehouse_wh = Grant("USAGE", ObjectType.WAREHOUSE, AccountObjectIdent("", "WH"))
+
+future_table = FutureGrant("SELECT", ObjectType.TABLE, SchemaIdent("", "DB", "SC"))
+future_view = FutureGrant("SELECT", ObjectType.VIEW, SchemaIdent("", "DB", "SC"))
+future_function = FutureGrant("USAGE", ObjectType.FUNCTION, SchemaIdent("", "DB", "SC"))
+future_schema = FutureGrant("USAGE", ObjectType.SCHEMA, DatabaseIdent("", "DB"))
+
+
+diff_grants_cases = [
+    # (bp_grants, existing_grants, bp_future_grants, existing_future_grants, expected diff)
+    ([], [], [], [], GrantDiff()),
+    ([table_a, table_b], [], [], [], GrantDiff(create_grants=[table_a, table_b])),
+    ([table_b, table_a], [table_a], [], [], GrantDiff(create_grants=[table_b])),
+    ([], [table_b, table_a], [], [], GrantDiff(drop_grants=[table_b, table_a])),
+    ([table_a], [table_a, table_insert, view_a], [], [], GrantDiff(drop_grants=[table_insert, view_a])),
+
+    # Existing grants implied by future grant in the same schema are not dropped
+    ([], [table_a, table_b, table_other_schema], [future_table], [future_table], GrantDiff(drop_grants=[table_other_schema])),
+    ([], [table_a, view_a, table_insert], [future_table], [future_table], GrantDiff(drop_grants=[view_a, table_insert])),
+    ([], [function_a, function_b], [future_function], [future_function], GrantDiff()),
+    ([], [function_a, function_b], [future_table], [future_table], GrantDiff(drop_grants=[function_a, function_b])),
+    ([], [schema_sc, database_db, warehouse_wh], [future_schema], [future_schema], GrantDiff(drop_grants=[schema_sc, database_db, warehouse_wh])),
+
+    # Functions with the same name and different arguments are different objects
+    ([function_a], [function_b], [], [], GrantDiff(create_grants=[function_a], drop_grants=[function_b])),
+
+    # Future grants
+    ([], [], [future_view, future_table], [future_table], GrantDiff(create_future_grants=[future_view])),
+    ([], [], [], [future_view, future_table], GrantDiff(drop_future_grants=[future_view, future_table])),
+    ([table_a], [table_b], [future_view], [future_table], GrantDiff(create_grants=[table_a], drop_grants=[table_b], create_future_grants=[future_view], drop_future_grants=[future_table])),
+]
+
+
+covering_future_grant_key_cases = [
+    (table_a, grant_key(future_table)),
+    (table_other_schema, grant_key(FutureGrant("SELECT", ObjectType.TABLE, SchemaIdent("", "DB", "OTHER")))),
+    (view_a, grant_key(future_view)),
+    (function_a, grant_key(future_function)),
+    (function_b, grant_key(future_function)),
+    (schema_sc, grant_key(FutureGrant("USAGE", ObjectType.SCHEMA, SchemaIdent("", "DB", "SC")))),
+    (database_db, None),
+    (warehouse_wh, None),
+]
+
+
+def test_diff_grants():
+    for bp_grants, existing_grants, bp_future_grants, existing_future_grants, expected in diff_grants_cases:
+        assert diff_grants(bp_grants, existing_grants, bp_future_grants, existing_future_grants) == expected
+
+
+def test_diff_grants_same_as_nested_scan():
+    for bp_grants, existing_grants, bp_future_grants, existing_future_grants, _ in diff_grants_cases:
+        assert diff_grants(bp_grants, existing_grants, bp_future_grants, existing_future_grants) \
+            == _diff_grants_nested(bp_grants, existing_grants, bp_future_grants, existing_future_grants)
+
+
+def test_covering_future_grant_key():
+    for grant, expected in covering_future_grant_key_cases:
+        assert covering_future_grant_key(grant) == expected
+
+
+def test_covering_future_grant_key_with_env_prefix():
+    grant = Grant("SELECT", ObjectType.TABLE, SchemaObjectIdent("TEST__", "DB", "SC", "A"))
+    future_grant = FutureGrant("SELECT", ObjectType.TABLE, SchemaIdent("TEST__", "DB", "SC"))
+
+    assert covering_future_grant_key(grant) == grant_key(future_grant)
+    assert covering_future_grant_key(grant) != grant_key(future_table)
+
+
+def test_diff_grants_random_same_as_nested_scan():
+    rnd = Random(1)
+    object_types = [ObjectType.TABLE, ObjectType.VIEW, ObjectType.DATABASE, ObjectType.SCHEMA, ObjectType.FUNCTION, ObjectType.WAREHOUSE, ObjectType.STAGE]
+
+    def random_name(object_type):
+        database, schema, name = rnd.choice("AB"), rnd.choice("XY"), rnd.choice("PQ")
+
+        if object_type == ObjectType.DATABASE:
+            return DatabaseIdent("", database)
+
+        if object_type == ObjectType.SCHEMA:
+            return SchemaIdent("", database, schema)
+
+        if object_type == ObjectType.FUNCTION:
+            return SchemaObjectIdentWithArgs("", database, schema, name, [rnd.choice([BaseDataType.NUMBER, BaseDataType.VARCHAR])])
+
+        if object_type == ObjectType.WAREHOUSE:
+            return AccountObjectIdent("", database)
+
+        return SchemaObjectIdent("", database, schema, name)
+
+    def random_grant():
+        object_type = rnd.choice(object_types)
+        return Grant(rnd.choice(["SELECT", "USAGE"]), object_type, random_name(object_type))
+
+    def random_future_grant():
+        object_type = rnd.choice([o for o in object_types if o.is_future_grant_supported and o != ObjectType.SCHEMA])
+        return FutureGrant(rnd.choice(["SELECT", "USAGE"]), object_type, SchemaIdent("", rnd.choice("AB"), rnd.choice("XY")))
+
+    for _ in range(1000):
+        bp_grants = [random_grant() for _ in range(rnd.randint(0, 12))]
+        existing_grants = [random_grant() for _ in range(rnd.randint(0, 12))]
+        bp_future_grants = [random_future_grant() for _ in range(rnd.randint(0, 5))]
+        existing_future_grants = [random_future_grant() for _ in range(rnd.randint(0, 5))]
+
+        assert diff_grants(bp_grants, existing_grants, bp_future_grants, existing_future_grants) \
+            == _diff_grants_nested(bp_grants, existing_grants, bp_future_grants, existing_future_grants)
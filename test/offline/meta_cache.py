@@ -0,0 +1,112 @@
+from snowddl.meta_cache import SnowDDLMetaCache
+
+
+def _put(cache, sql, value=None):
+    generation = cache.get_generation(sql)
+    cache.put(('EXECUTE', sql), sql, value or sql, generation)
+
+
+def _cached_statements(cache):
+    return sorted(key[1] for key in cache.entries)
+
+
+def test_meta_cache_invalidate_by_name():
+    cache = SnowDDLMetaCache()
+
+    _put(cache, 'SHOW GRANTS TO ROLE "A"')
+    _put(cache, 'SHOW GRANTS TO ROLE "B"')
+    _put(cache, 'DESC TABLE "DB"."SC"."T"')
+
+    cache.invalidate('GRANT ROLE "A" TO ROLE "C"')
+    assert _cached_statements(cache) == ['DESC TABLE "DB"."SC"."T"', 'SHOW GRANTS TO ROLE "B"']
+
+    # Only the first identifier of chain is a top-level name
+    cache.invalidate('ALTER TABLE "OTHER"."DB"."T" ADD COLUMN "COL" NUMBER')
+    assert _cached_statements(cache) == ['DESC TABLE "DB"."SC"."T"', 'SHOW GRANTS TO ROLE "B"']
+
+    cache.invalidate('CREATE SCHEMA "DB"."X"')
+    assert _cached_statements(cache) == ['SHOW GRANTS TO ROLE "B"']
+
+
+def test_meta_cache_invalidate_without_names():
+    cache = SnowDDLMetaCache()
+
+    _put(cache, 'SHOW ROLES')
+    _put(cache, 'SHOW GRANTS TO ROLE "A"')
+
+    # Entries without names are invalidated by any DDL, DDL without names does not invalidate other entries
+    cache.invalidate('ALTER SESSION SET QUERY_TAG = 1')
+    assert _cached_statements(cache) == ['SHOW GRANTS TO ROLE "A"']
+
+    _put(cache, 'SHOW ROLES')
+
+    cache.invalidate('GRANT ROLE "B" TO ROLE "C"')
+    assert _cached_statements(cache) == ['SHOW GRANTS TO ROLE "A"']
+
+
+def test_meta_cache_outdated_result_is_not_stored():
+    cache = SnowDDLMetaCache()
+
+    sql = 'SHOW SCHEMAS IN DATABASE "DB"'
+    generation = cache.get_generation(sql)
+
+    # Unrelated DDL was executed while query was running
+    cache.invalidate('CREATE SCHEMA "OTHER"."X"')
+    cache.put(('EXECUTE', sql), sql, 1, generation)
+    assert cache.get(('EXECUTE', sql)) == 1
+
+    cache.clear()
+    generation = cache.get_generation(sql)
+
+    # Related DDL was executed while query was running
+    cache.invalidate('CREATE SCHEMA "DB"."X"')
+    cache.put(('EXECUTE', sql), sql, 2, generation)
+    assert cache.get(('EXECUTE', sql)) is None
+
+    generation = cache.get_generation(sql)
+
+    # Session state was changed while query was running
+    cache.clear()
+    cache.put(('EXECUTE', sql), sql, 3, generation)
+    assert cache.get(('EXECUTE', sql)) is None
+
+
+def test_meta_cache_index_is_cleaned_up():
+    cache = SnowDDLMetaCache()
+
+    _put(cache, 'SHOW GRANTS TO ROLE "A"')
+    _put(cache, 'SHOW GRANTS OF ROLE "A"')
+    _put(cache, 'SHOW GRANTS TO ROLE "A"', 'replaced')
+
+    assert cache.get(('EXECUTE', 'SHOW GRANTS TO ROLE "A"')) == 'replaced'
+
+    cache.invalidate('DROP ROLE "A"')
+
+    assert cache.entries == {}
+    assert cache._keys_by_name == {}
+    assert cache._unnamed_keys == set()
+
+
+def test_meta_cache_engine(offline_helper):
+    catalog = offline_helper.create_catalog()
+    config = offline_helper.load_config("sample01_01")
+
+    with offline_helper.create_engine(catalog, config, execute_safe_ddl=True) as engine:
+        sql = 'SHOW SCHEMAS IN DATABASE {database:i}'
+        engine.execute_safe_ddl('CREATE DATABASE {database:i}', {"database": "DB"})
+
+        assert [r['name'] for r in engine.execute_meta(sql, {"database": "DB"})] == ['PUBLIC']
+
+        hit_count = engine.meta_cache.hit_count
+        assert [r['name'] for r in engine.execute_meta(sql, {"database": "DB"})] == ['PUBLIC']
+        assert engine.meta_cache.hit_count == hit_count + 1
+
+        # DDL in unrelated database keeps cached result
+        engine.execute_safe_ddl('CREATE DATABASE {database:i}', {"database": "OTHER"})
+        engine.execute_meta(sql, {"database": "DB"})
+        assert engine.meta_cache.hit_count == hit_count + 2
+
+        # DDL in the same database invalidates cached result
+        engine.execute_safe_ddl('CREATE SCHEMA {database:i}.{schema:i}', {"database": "DB", "schema": "SC"})
+        assert sorted(r['name'] for r in engine.execute_meta(sql, {"database": "DB"})) == ['PUBLIC', 'SC']
+        assert engine.meta_cache.hit_count == hit_count + 2
@@ -0,0 +1,53 @@
+from snowddl.metadata_snapshot import SnowDDLMetadataSnapshot
+
+
+def _apply_sample(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+    catalog = offline_helper.create_catalog()
+
+    error_count, _, _ = offline_helper.resolve(catalog, config, True)
+    assert error_count == 0
+
+    return catalog, config
+
+
+def test_desc_table_same_as_desc(offline_helper):
+    catalog, config = _apply_sample(offline_helper)
+
+    with offline_helper.create_engine(catalog, config) as engine:
+        snapshot = SnowDDLMetadataSnapshot(engine)
+
+        for (schema, name) in catalog.schema_objects['TABLE']['SNOWDDL_DB']:
+            desc_rows = engine.execute_meta("DESC TABLE {database:i}.{schema:i}.{name:i}", {
+                "database": 'SNOWDDL_DB',
+                "schema": schema,
+                "name": name,
+            }).fetchall()
+
+            snapshot_rows = snapshot.desc_table('SNOWDDL_DB', schema, name)
+
+            assert [(r['name'], r['type'], r['null?'], r['default'], r['expression'] or None) for r in snapshot_rows] \
+                == [(r['name'], r['type'], r['null?'], r['default'], r['expression'] or None) for r in desc_rows]
+
+
+def test_desc_table_schema_fallback(offline_helper, monkeypatch):
+    catalog, config = _apply_sample(offline_helper)
+    _, _, expected_ddl = offline_helper.resolve(catalog, config, False)
+
+    # SNOWDDL_DB has 123 columns: 37 in BOOKINGS and 86 in SAKILA
+    monkeypatch.setattr(SnowDDLMetadataSnapshot, "show_row_limit", 50)
+
+    with offline_helper.create_engine(catalog, config) as engine:
+        snapshot = SnowDDLMetadataSnapshot(engine)
+
+        for (schema, name) in catalog.schema_objects['TABLE']['SNOWDDL_DB']:
+            if schema == 'BOOKINGS':
+                assert snapshot.desc_table('SNOWDDL_DB', schema, name)
+            else:
+                assert snapshot.desc_table('SNOWDDL_DB', schema, name) is None
+
+    # Tables in schemas without snapshot are described individually, plan is the same
+    error_count, _, suggested_ddl = offline_helper.resolve(catalog, config, False)
+
+    assert error_count == 0
+    assert suggested_ddl == expected_ddl
@@ -0,0 +1,38 @@
+from snowddl.metrics import SnowDDLMetrics
+from snowddl.resolver import default_resolver_dependencies, default_resolver_sequence
+from snowddl.scheduler import SnowDDLResolverScheduler
+
+
+def _resolve(offline_helper, metrics):
+    config = offline_helper.load_config("sample01_01")
+    catalog = offline_helper.create_catalog()
+
+    with offline_helper.create_engine(catalog, config, execute_safe_ddl=True) as engine:
+        engine.metrics = metrics
+
+        scheduler = SnowDDLResolverScheduler(engine, default_resolver_sequence, default_resolver_dependencies)
+        scheduler.resolve()
+
+        return scheduler.error_count
+
+
+def test_metrics_disabled_by_default(offline_helper):
+    config = offline_helper.load_config("sample01_01")
+
+    with offline_helper.create_engine(offline_helper.create_catalog(), config) as engine:
+        assert engine.metrics is None
+
+    assert _resolve(offline_helper, None) == 0
+
+
+def test_metrics_report(offline_helper):
+    metrics = SnowDDLMetrics()
+
+    assert _resolve(offline_helper, metrics) == 0
+
+    report = metrics.build_report()
+
+    assert len(report['queries']) == sum(item['count'] for item in report['queries_by_kind'])
+    assert len(report['tasks']) == sum(item['count'] for item in report['tasks_by_resolver'])
+    assert any(item['kind'] == 'SHOW' for item in report['queries_by_kind'])
+    assert any(item['kind'] == 'CREATE' for item in report['queries_by_kind'])
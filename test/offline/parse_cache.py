@@ -0,0 +1,102 @@
+from datetime import date
+
+from snowddl.parser import ParseCache
+from snowddl.parser._json_schema import load_json_schema
+from snowddl.parser.abc_parser import AbstractParser
+from snowddl.parser.table import table_json_schema
+from snowddl.parser.view import view_json_schema
+
+
+def test_json_schema_key():
+    # Key is the same in all processes, schema can be loaded by key in worker process
+    assert load_json_schema("snowddl.parser.table:table_json_schema") is table_json_schema
+    assert load_json_schema("snowddl.parser.view:view_json_schema") is view_json_schema
+
+
+def test_json_schema_keys_of_parsers(offline_helper, monkeypatch):
+    # Each parser passes key of the same schema object it validates with
+    keys = {}
+
+    original_parse_single_file = AbstractParser.parse_single_file
+    original_parse_schema_object_files = AbstractParser.parse_schema_object_files
+
+    def parse_single_file(parser, path, json_schema, json_schema_key, callback=None):
+        keys[json_schema_key] = json_schema
+        return original_parse_single_file(parser, path, json_schema, json_schema_key, callback)
+
+    def parse_schema_object_files(parser, object_type, json_schema, json_schema_key, callback):
+        keys[json_schema_key] = json_schema
+        return original_parse_schema_object_files(parser, object_type, json_schema, json_schema_key, callback)
+
+    monkeypatch.setattr(AbstractParser, "parse_single_file", parse_single_file)
+    monkeypatch.setattr(AbstractParser, "parse_schema_object_files", parse_schema_object_files)
+
+    offline_helper.load_config("sample01_01")
+
+    assert len(keys) > 20
+
+    for json_schema_key, json_schema in keys.items():
+        assert load_json_schema(json_schema_key) is json_schema
+
+
+def test_parse_cache_key(tmp_path):
+    cache = ParseCache(tmp_path, {"A": 1})
+    table_key = "snowddl.parser.table:table_json_schema"
+    view_key = "snowddl.parser.view:view_json_schema"
+
+    key = cache.build_key(b"columns: {}", table_json_schema, table_key)
+
+    assert key == cache.build_key(b"columns: {}", table_json_schema, table_key)
+    assert key == cache.build_key(b"columns: {}", table_json_schema)
+    assert key == ParseCache(tmp_path, {"A": 1}).build_key(b"columns: {}", table_json_schema, table_key)
+
+    # Content, schema and placeholders are parts of key
+    assert key != cache.build_key(b"columns: {} ", table_json_schema, table_key)
+    assert key != cache.build_key(b"columns: {}", view_json_schema, view_key)
+    assert key != ParseCache(tmp_path, {"A": 2}).build_key(b"columns: {}", table_json_schema, table_key)
+
+
+def test_parse_cache_put_get(tmp_path):
+    cache = ParseCache(tmp_path, {})
+
+    cache.put("a" * 64, {"columns": {"b": {"type": "NUMBER"}, "a": {"type": "VARCHAR"}}})
+
+    # Order of mappings is preserved
+    assert list(cache.get("a" * 64)["columns"]) == ["b", "a"]
+    assert (cache.hit_count, cache.miss_count) == (1, 0)
+
+    # Params which do not survive JSON round trip are not cached
+    cache.put("b" * 64, {"date": date(2020, 1, 1)})
+    cache.put("c" * 64, {1: "non-string key"})
+
+    assert cache.get("b" * 64) is None
+    assert cache.get("c" * 64) is None
+    assert (cache.hit_count, cache.miss_count) == (1, 2)
+
+
+def test_parse_cache_config(offline_helper, tmp_path):
+    config = offline_helper.load_config("sample01_01")
+
+    # Files with the same content share the same entry
+    first_config = offline_helper.load_config("sample01_01", parse_cache_path=tmp_path)
+    file_count = first_config.parse_cache.hit_count + first_config.parse_cache.miss_count
+
+    assert first_config.parse_cache.miss_count > first_config.parse_cache.hit_count
+
+    second_config = offline_helper.load_config("sample01_01", parse_cache_path=tmp_path)
+    assert second_config.parse_cache.hit_count == file_count
+    assert second_config.parse_cache.miss_count == 0
+
+    # Blueprints are the same with and without cache
+    assert first_config.blueprints == config.blueprints
+    assert second_config.blueprints == config.blueprints
+
+
+def test_parse_cache_env_prefix(offline_helper, tmp_path):
+    first_config = offline_helper.load_config("sample01_01", parse_cache_path=tmp_path)
+
+    # Env prefix is available as placeholder, so params cached without prefix are not reused
+    config = offline_helper.load_config("sample01_01", "test", parse_cache_path=tmp_path)
+    assert config.parse_cache.miss_count == first_config.parse_cache.miss_count
+
+    assert config.blueprints == offline_helper.load_config("sample01_01", "test").blueprints
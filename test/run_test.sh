@@ -1,6 +1,9 @@
 #!/bin/sh
 cd "${0%/*}"
 
+# Run offline tests, Snowflake account is not required
+pytest --tb=short offline/*.py
+
 # Cleanup
 snowddl -c _config/step1 --apply-unsafe destroy
 